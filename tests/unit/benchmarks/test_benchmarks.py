@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import hypothesis.strategies as st
+import pytest
+from hypothesis import given, settings
+
+from traxon_strats.benchmarks.suite import BASELINE_VERSION, STAGES, compare, run_suite
+from traxon_strats.benchmarks.synthetic import benchmark_settings, synthetic_universe
+from traxon_strats.robotwealth.api_client.yolo.data_schemas import (
+    YoloVolatilitiesSchema,
+    YoloWeightsSchema,
+)
+from traxon_strats.robotwealth.yolo.order_builder import YoloOrderBuilder
+from traxon_strats.robotwealth.yolo.portfolio_sizer import YoloPortfolioSizer
+
+
+def _document(*results: tuple[str, int, float, float | None]) -> dict[str, object]:
+    return {
+        "version": BASELINE_VERSION,
+        "results": [
+            {
+                "stage": stage,
+                "symbols": symbols,
+                "seconds": seconds,
+                "peak_rss_mib": peak_rss,
+                "python_peak_mib": 1.0,
+            }
+            for stage, symbols, seconds, peak_rss in results
+        ],
+    }
+
+
+class TestSyntheticUniverse:
+    @settings(max_examples=20, deadline=None)
+    @given(n=st.integers(min_value=1, max_value=2_000), seed=st.integers(min_value=0, max_value=2**32 - 1))
+    def test_frames_follow_the_production_schemas(self, n: int, seed: int) -> None:
+        universe = synthetic_universe(n, seed)
+
+        YoloWeightsSchema.validate(universe.weights)
+        YoloVolatilitiesSchema.validate(universe.volatilities)
+        assert universe.weights.height == universe.volatilities.height == n
+        assert universe.weights["symbol"].is_unique().all()
+        assert universe.current_portfolio.columns == [
+            "symbol",
+            "notional_size_signed",
+            "size",
+            "price",
+            "side",
+        ]
+        assert (universe.current_portfolio["size"] > 0).all()
+
+    def test_is_reproducible(self) -> None:
+        first, second = synthetic_universe(500, seed=7), synthetic_universe(500, seed=7)
+
+        assert first.weights.equals(second.weights)
+        assert first.current_portfolio.equals(second.current_portfolio)
+        assert not first.weights.equals(synthetic_universe(500, seed=8).weights)
+
+    def test_rejects_an_empty_universe(self) -> None:
+        with pytest.raises(ValueError, match="at least one symbol"):
+            synthetic_universe(0)
+
+    def test_sizes_and_plans_orders(self) -> None:
+        universe = synthetic_universe(2_000, seed=3)
+        config = benchmark_settings()
+        weights = universe.weights.select(
+            "symbol", "arrival_price", "updated_at", weight=universe.weights["combo_weight"] / 10
+        )
+
+        target = YoloPortfolioSizer().size_frame(universe.equity, weights, universe.current_portfolio, config)
+        plan = YoloOrderBuilder(min_order_value=config.min_order_value).plan_orders(target, universe.markets)
+
+        assert target.height > 0
+        assert plan.legs.height > 0
+
+
+class TestCompare:
+    def test_flags_slowdowns_above_the_tolerance(self) -> None:
+        baseline = _document(("sizing", 1_000, 0.100, 10.0), ("signal", 1_000, 0.100, 10.0))
+        current = _document(("sizing", 1_000, 0.150, 10.0), ("signal", 1_000, 0.110, 10.0))
+
+        regressions = compare(baseline, current, tolerance=0.25)
+
+        assert [(r.stage, r.metric) for r in regressions] == [("sizing", "seconds")]
+        assert "+50%" in str(regressions[0])
+
+    def test_ignores_differences_below_the_noise_floor(self) -> None:
+        baseline = _document(("sizing", 10, 0.0001, 0.1))
+        current = _document(("sizing", 10, 0.0010, 0.9))
+
+        assert compare(baseline, current) == []
+
+    def test_skips_missing_measurements(self) -> None:
+        baseline = _document(("sizing", 10, 0.1, None))
+        current = _document(("sizing", 10, 0.1, 50.0), ("sizing", 100, 9.0, 50.0))
+
+        assert compare(baseline, current) == []
+
+    def test_rejects_unknown_versions(self) -> None:
+        with pytest.raises(ValueError, match="unsupported benchmark version"):
+            compare({"version": 0, "results": []}, _document())
+
+
+def test_run_suite_measures_every_stage() -> None:
+    document = run_suite(sizes=[10], repeats=1)
+
+    assert document["version"] == BASELINE_VERSION
+    assert [r["stage"] for r in document["results"]] == list(STAGES)
+    assert all(r["seconds"] > 0 and r["symbols"] == 10 for r in document["results"])
+    assert compare(document, document) == []
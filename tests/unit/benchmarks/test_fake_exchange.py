@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from traxon_core.config import ExecutorConfig
+from traxon_core.crypto.models import (
+    ExchangeId,
+    OrderExecutionType,
+    OrderSide,
+    OrdersToExecute,
+    SizedOrderBuilder,
+)
+
+from traxon_strats.benchmarks.fake_exchange import FakeVenue, FillModel, Latency
+from traxon_strats.benchmarks.runs import _config, _run_once, benchmark_run
+from traxon_strats.benchmarks.synthetic import SyntheticUniverse, synthetic_universe
+from traxon_strats.crypto.services.markets import MarketsIndex
+from traxon_strats.robotwealth.yolo.fills import fills_from_report
+from traxon_strats.robotwealth.yolo.portfolio_sizer import YoloPortfolioSizer
+
+
+@pytest.fixture
+def universe() -> SyntheticUniverse:
+    return synthetic_universe(200, seed=1)
+
+
+def _venue(universe: SyntheticUniverse, fills: FillModel = FillModel(), **latency: Any) -> FakeVenue:
+    return FakeVenue(
+        universe.markets,
+        universe.weights.select("symbol", price="arrival_price"),
+        universe.current_portfolio,
+        universe.equity,
+        Latency(**latency),
+        fills,
+    )
+
+
+def _buy(venue: FakeVenue, market: str, size: float) -> OrdersToExecute:
+    [info] = [m for s, m in venue.markets.items() if s == market]
+    order = SizedOrderBuilder(
+        exchange_id=ExchangeId.BINANCE,
+        market=info,
+        side=OrderSide.BUY,
+        execution_type=OrderExecutionType.MAKER,
+        size=Decimal(str(size)),
+    )
+    return OrdersToExecute(updates={}, new={market: [order]})
+
+
+def _held(venue: FakeVenue, symbol: str) -> float:
+    frame = YoloPortfolioSizer().portfolio_frame(venue.portfolio(ExchangeId.BINANCE))
+    held = frame.filter(symbol=symbol)["notional_size_signed"]
+    return float(held[0]) if len(held) else 0.0
+
+
+def test_portfolio_matches_the_synthetic_one(universe: SyntheticUniverse) -> None:
+    frame = YoloPortfolioSizer().portfolio_frame(_venue(universe).portfolio(ExchangeId.BINANCE))
+
+    expected = universe.current_portfolio.sort("symbol")
+    assert frame.sort("symbol")["symbol"].to_list() == expected["symbol"].to_list()
+    assert frame.sort("symbol")["notional_size_signed"].to_list() == pytest.approx(
+        expected["notional_size_signed"].to_list()
+    )
+
+
+@pytest.mark.asyncio
+async def test_fills_update_the_portfolio_and_are_reported(universe: SyntheticUniverse) -> None:
+    venue = _venue(universe)
+    before = _held(venue, "S00000/USDT")
+
+    report = await venue.order_executor(ExecutorConfig(execution="fast", max_spread_pct=0.01)).execute_orders(
+        [], _buy(venue, "S00000/USDT", 2.0)
+    )
+
+    fills = fills_from_report(report, MarketsIndex.from_markets(venue.markets))
+    assert fills is not None
+    assert fills.row(0) == ("S00000/USDT", pytest.approx(2.0), pytest.approx(fills["price"][0]), True)
+    assert _held(venue, "S00000/USDT") == pytest.approx(before + 2.0)
+    assert venue.orders == 1
+    assert venue.api_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_perp_fills_are_reported_in_contracts(universe: SyntheticUniverse) -> None:
+    venue = _venue(universe)
+    market = next(str(s) for s, m in venue.markets.items() if m.contract_size == Decimal("100"))
+    symbol = market.split(":")[0]
+    before = _held(venue, symbol)
+
+    [order] = await venue.execute(_buy(venue, market, 200.0))
+
+    assert order["filled"] == pytest.approx(2.0)
+    assert _held(venue, symbol) == pytest.approx(before + 200.0)
+    fills = fills_from_report([order], MarketsIndex.from_markets(venue.markets))
+    assert fills is not None
+    assert fills["filled_size_signed"].to_list() == pytest.approx([200.0])
+
+
+@pytest.mark.asyncio
+async def test_partial_fills_and_unreported_orders(universe: SyntheticUniverse) -> None:
+    venue = _venue(universe, FillModel(partial_fill_probability=1.0, partial_fill_range=(0.5, 0.5)))
+    before = _held(venue, "S00000/USDT")
+
+    [order] = await venue.execute(_buy(venue, "S00000/USDT", 2.0))
+
+    assert order["filled"] == pytest.approx(1.0)
+    assert order["status"] == "canceled"
+    assert _held(venue, "S00000/USDT") == pytest.approx(before + 1.0)
+
+    unreported = _venue(universe, FillModel(unreported_probability=1.0))
+    [order] = await unreported.execute(_buy(unreported, "S00000/USDT", 2.0))
+    fills = fills_from_report([order], MarketsIndex.from_markets(unreported.markets))
+    assert fills is not None and not fills["complete"].any()
+
+
+@pytest.mark.asyncio
+async def test_requests_are_rate_limited(universe: SyntheticUniverse) -> None:
+    venue = _venue(universe, mean_seconds=0.02, max_concurrent_requests=2)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(venue.call() for _ in range(4)))
+
+    assert time.perf_counter() - start >= 0.04
+    assert venue.api_calls == 4
+
+
+@pytest.mark.asyncio
+async def test_strategy_runs_against_the_venue_until_converged(universe: SyntheticUniverse) -> None:
+    venue = _venue(universe)
+    config = _config("incremental")
+
+    await _run_once(universe, venue, config)
+    traded = venue.orders
+    await _run_once(universe, venue, config)
+
+    assert traded > 0
+    # Only symbols whose legs could not all trade (inactive markets, amount precision) are off target
+    assert venue.orders - traded < traded // 10
+
+
+def test_benchmark_run_reports_every_phase() -> None:
+    measurement = benchmark_run(50, latency="colocated", fills="partial", repeats=1)
+
+    assert measurement.seconds > 0
+    assert measurement.orders > 0
+    assert measurement.api_calls >= 2 * measurement.orders
+    assert {"yolo.exchanges", "yolo.pipeline", "yolo.execute", "yolo.validate"} <= measurement.phases.keys()
@@ -0,0 +1,170 @@
+import asyncio
+from collections.abc import Iterator
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from traxon_core.config import ExchangeConfig
+from traxon_core.crypto.exchanges import Exchange
+
+from traxon_strats.crypto.services.exchange_pool import ExchangePool
+
+
+def _exchange_config(exchange_id: str) -> ExchangeConfig:
+    return ExchangeConfig(
+        exchange_id=exchange_id,
+        spot_quote_symbol="USDT",
+        leverage=1,
+        spot=True,
+        perp=True,
+        credentials={"apiKey": "key", "secret": "secret"},
+    )
+
+
+def _new_exchange() -> MagicMock:
+    exchange = MagicMock(spec=Exchange)
+    exchange.api = MagicMock()
+    exchange.api.markets = {"BTC/USDT": object()}
+    return exchange
+
+
+@pytest.fixture
+def from_config() -> Iterator[AsyncMock]:
+    async def _create(demo: bool, configs: list[ExchangeConfig]) -> list[MagicMock]:
+        return [_new_exchange() for _ in configs]
+
+    with patch(
+        "traxon_strats.crypto.services.exchange_pool.ExchangeFactory.from_config",
+        new=AsyncMock(side_effect=_create),
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture
+def close() -> Iterator[AsyncMock]:
+    with patch("traxon_strats.crypto.services.exchange_pool.Exchange.close", new_callable=AsyncMock) as mock:
+        yield mock
+
+
+@pytest.mark.asyncio
+async def test_released_sessions_are_reused(from_config: AsyncMock, close: AsyncMock) -> None:
+    pool = ExchangePool()
+    config = _exchange_config("binance")
+
+    [first] = await pool.acquire(True, [config])
+    await pool.release([first])
+    [second] = await pool.acquire(True, [config])
+
+    assert second is first
+    from_config.assert_awaited_once()
+    close.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_keyed_by_demo_flag(from_config: AsyncMock, close: AsyncMock) -> None:
+    pool = ExchangePool()
+    config = _exchange_config("binance")
+
+    [demo] = await pool.acquire(True, [config])
+    await pool.release([demo])
+    [live] = await pool.acquire(False, [config])
+
+    assert live is not demo
+    assert from_config.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_and_unhealthy_sessions_are_recycled(from_config: AsyncMock, close: AsyncMock) -> None:
+    pool = ExchangePool()
+    config = _exchange_config("binance")
+
+    [failed] = await pool.acquire(True, [config])
+    await pool.release([failed], failed=True)
+    close.assert_awaited_once_with([failed])
+
+    [unhealthy] = await pool.acquire(True, [config])
+    assert unhealthy is not failed
+    await pool.release([unhealthy])
+    unhealthy.api.markets = {}
+
+    [replacement] = await pool.acquire(True, [config])
+    assert replacement is not unhealthy
+    close.assert_awaited_with([unhealthy])
+
+
+@pytest.mark.asyncio
+async def test_expired_sessions_are_recycled(from_config: AsyncMock, close: AsyncMock) -> None:
+    pool = ExchangePool(max_age=timedelta(seconds=-1))
+    config = _exchange_config("binance")
+
+    [first] = await pool.acquire(True, [config])
+    await pool.release([first])
+
+    close.assert_awaited_once_with([first])
+
+
+@pytest.mark.asyncio
+async def test_close_closes_idle_and_in_use_sessions(from_config: AsyncMock, close: AsyncMock) -> None:
+    pool = ExchangePool()
+    idle, in_use = await pool.acquire(True, [_exchange_config("binance"), _exchange_config("bybit")])
+    await pool.release([idle])
+
+    await pool.close()
+
+    close.assert_awaited_once_with([idle, in_use])
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_created_by_the_given_factory(from_config: AsyncMock, close: AsyncMock) -> None:
+    create = AsyncMock(side_effect=lambda demo, configs: [_new_exchange() for _ in configs])
+    pool = ExchangePool(create_exchanges=create)
+
+    await pool.acquire(True, [_exchange_config("binance")])
+
+    create.assert_awaited_once()
+    from_config.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reserved_sessions_return_to_the_pool_when_creation_fails(
+    from_config: AsyncMock, close: AsyncMock
+) -> None:
+    pool = ExchangePool()
+    binance, bybit = _exchange_config("binance"), _exchange_config("bybit")
+    [warm] = await pool.acquire(True, [binance])
+    await pool.release([warm])
+
+    from_config.side_effect = ConnectionError("venue unreachable")
+    with pytest.raises(ConnectionError):
+        await pool.acquire(True, [binance, bybit])
+
+    [reused] = await pool.acquire(True, [binance])
+    assert reused is warm
+    close.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_created_concurrently(close: AsyncMock) -> None:
+    started = 0
+    both_started = asyncio.Event()
+
+    async def create(demo: bool, configs: list[ExchangeConfig]) -> list[Exchange]:
+        nonlocal started
+        started += 1
+        if started == 2:
+            both_started.set()
+        # Only returns once the other caller is creating its sessions too
+        await both_started.wait()
+        return [_new_exchange() for _ in configs]
+
+    pool = ExchangePool(create_exchanges=create)
+
+    binance, bybit = await asyncio.wait_for(
+        asyncio.gather(
+            pool.acquire(True, [_exchange_config("binance")]),
+            pool.acquire(True, [_exchange_config("bybit")]),
+        ),
+        timeout=1,
+    )
+
+    assert binance[0] is not bybit[0]
@@ -0,0 +1,94 @@
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import polars as pl
+import pytest
+from traxon_core.crypto.exchanges import Exchange
+from traxon_core.crypto.models import ExchangeId, Symbol
+from traxon_core.crypto.models.market_info import MarketInfo
+
+from traxon_strats.crypto.services.markets import MarketMetadataCache, MarketsIndex
+
+
+def _market(symbol: str, type_: str) -> MarketInfo:
+    return MarketInfo(
+        symbol=Symbol(symbol),
+        type=type_,
+        active=True,
+        precision_amount=3,
+        precision_price=2,
+        contract_size=Decimal("1.0"),
+    )
+
+
+@pytest.fixture
+def exchange() -> MagicMock:
+    exchange = MagicMock(spec=Exchange)
+    exchange.id = ExchangeId.BINANCE
+    exchange.api = MagicMock()
+    exchange.api.markets = {
+        Symbol("BTC/USDT"): _market("BTC/USDT", "spot"),
+        Symbol("BTC/USDT:USDT"): _market("BTC/USDT:USDT", "swap"),
+    }
+    return exchange
+
+
+def test_markets_index_ipc_round_trip(tmp_path: Path, exchange: MagicMock) -> None:
+    index = MarketsIndex.from_markets(exchange.api.markets)
+    index.write_ipc(tmp_path / "markets.arrow")
+
+    loaded = MarketsIndex.read_ipc(tmp_path / "markets.arrow")
+
+    assert len(loaded) == 2
+    assert loaded.frame.equals(index.frame)
+    assert loaded.get("BTC/USDT:USDT") == exchange.api.markets[Symbol("BTC/USDT:USDT")]
+    assert loaded.get("ETH/USDT") is None
+
+
+def test_markets_index_rejects_incomplete_markets(tmp_path: Path, exchange: MagicMock) -> None:
+    index = MarketsIndex.from_markets(exchange.api.markets)
+    path = tmp_path / "markets.arrow"
+    index.frame.with_columns(contract_size=pl.lit(None, dtype=pl.Float64)).write_ipc(path)
+
+    with pytest.raises(ValueError, match="BTC/USDT, BTC/USDT:USDT"):
+        MarketsIndex.read_ipc(path)
+
+
+@pytest.mark.asyncio
+async def test_cache_indexes_each_session_once(exchange: MagicMock) -> None:
+    cache = MarketMetadataCache()
+
+    first = await cache.get(exchange)
+    assert await cache.get(exchange) is first
+
+    other = MagicMock(spec=Exchange)
+    other.id = ExchangeId.BINANCE
+    other.api = MagicMock()
+    other.api.markets = {}
+    assert len(await cache.get(other)) == 0
+
+    # A session that reloaded its markets by itself gets a new index
+    exchange.api.markets = {Symbol("ETH/USDT"): _market("ETH/USDT", "spot")}
+    assert (await cache.get(exchange)).get("ETH/USDT") is not None
+
+
+@pytest.mark.asyncio
+async def test_cache_reloads_stale_markets_from_the_venue(exchange: MagicMock) -> None:
+    async def load_markets(reload: bool = False) -> None:
+        assert reload
+        exchange.api.markets = {Symbol("ETH/USDT"): _market("ETH/USDT", "spot")}
+
+    exchange.api.load_markets = AsyncMock(side_effect=load_markets)
+    cache = MarketMetadataCache(ttl=timedelta(0))
+
+    stale = await cache.get(exchange)
+    assert (await cache.get(exchange)) is stale
+    await cache.close()
+
+    exchange.api.load_markets.assert_awaited_once_with(reload=True)
+    assert stale.get("BTC/USDT") is not None
+    refreshed = await cache.get(exchange)
+    assert refreshed.get("ETH/USDT") is not None
+    assert refreshed.get("BTC/USDT") is None
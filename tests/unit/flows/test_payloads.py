@@ -0,0 +1,107 @@
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import DataConverter
+
+from traxon_strats.flows.payloads import (
+    ARROW_IPC_ENCODING,
+    BLOB_REF_ENCODING,
+    BlobSpillCodec,
+    LocalBlobStore,
+    data_converter,
+)
+from traxon_strats.robotwealth.yolo.stages import BatchResult, FrameData, OrderBatch
+
+
+def _frame(n: int = 3) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "symbol": [f"S{i}/USDT" for i in range(n)],
+            "weight": [i / n for i in range(n)],
+            "quantity": list(range(n)),
+        }
+    )
+
+
+async def _round_trip(
+    converter: DataConverter, value: Any, type_hint: Any = None
+) -> tuple[list[Payload], Any]:
+    payloads = await converter.encode([value])
+    [decoded] = await converter.decode(payloads, [type_hint] if type_hint is not None else None)
+    return payloads, decoded
+
+
+@pytest.mark.asyncio
+async def test_dataframe_round_trips_as_arrow_ipc() -> None:
+    df = _frame()
+
+    [payload], decoded = await _round_trip(data_converter(), df, pl.DataFrame)
+
+    assert payload.metadata["encoding"] == ARROW_IPC_ENCODING.encode()
+    assert_frame_equal(decoded, df)
+
+
+@pytest.mark.asyncio
+async def test_frame_data_round_trips_without_decoding() -> None:
+    data = FrameData.of(_frame())
+
+    _, decoded = await _round_trip(data_converter(), data)
+
+    assert decoded == data
+    assert_frame_equal(decoded.frame(), _frame())
+
+
+@pytest.mark.asyncio
+async def test_nested_frames_round_trip_in_dataclasses() -> None:
+    converter = data_converter()
+    batch = OrderBatch("binance", "BTC/USDT", FrameData.of(_frame()))
+    result = BatchResult("binance", "BTC/USDT", 1, None)
+
+    _, decoded_batch = await _round_trip(converter, [batch], list[OrderBatch])
+    _, decoded_result = await _round_trip(converter, result, BatchResult)
+
+    assert decoded_batch == [batch]
+    assert_frame_equal(decoded_batch[0].legs.frame(), _frame())
+    assert decoded_result == result
+
+
+@pytest.mark.asyncio
+async def test_ipc_is_smaller_than_json() -> None:
+    df = _frame(5_000)
+
+    [payload], _ = await _round_trip(data_converter(), df, pl.DataFrame)
+
+    assert payload.ByteSize() < len(df.serialize(format="json")) / 5
+
+
+@pytest.mark.asyncio
+async def test_large_payloads_spill_to_blob_store(tmp_path: Path) -> None:
+    converter = data_converter(tmp_path, spill_bytes=16 * 1024)
+    df = _frame(5_000)
+
+    [small], decoded_small = await _round_trip(converter, _frame(), pl.DataFrame)
+    [large], decoded_large = await _round_trip(converter, df, pl.DataFrame)
+
+    assert small.metadata["encoding"] == ARROW_IPC_ENCODING.encode()
+    assert large.metadata["encoding"] == BLOB_REF_ENCODING.encode()
+    assert large.ByteSize() < 1024
+    assert [p.name for p in tmp_path.iterdir()] == [large.data.decode()]
+    assert_frame_equal(decoded_small, _frame())
+    assert_frame_equal(decoded_large, df)
+
+
+@pytest.mark.asyncio
+async def test_spilled_blobs_are_content_addressed(tmp_path: Path) -> None:
+    codec = BlobSpillCodec(LocalBlobStore(tmp_path), threshold=0)
+    payload = Payload(metadata={"encoding": b"binary/plain"}, data=b"x" * 64)
+
+    first = await codec.encode([payload])
+    second = await codec.encode([payload])
+
+    assert first == second
+    assert len(list(tmp_path.iterdir())) == 1
+    assert await codec.decode(first) == [payload]
@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from traxon_strats.flows.worker import StrategySpec, _parser, main, serve, worker_config
+from traxon_strats.robotwealth.yolo.config import WorkerConfig
+
+
+class _Worker:
+    def __init__(self, fail: bool = False) -> None:
+        self._fail = fail
+        self._stopped = asyncio.Event()
+        self.shutdowns = 0
+
+    async def run(self) -> None:
+        if self._fail:
+            raise RuntimeError("poller failed")
+        await self._stopped.wait()
+
+    async def shutdown(self) -> None:
+        self.shutdowns += 1
+        self._stopped.set()
+
+
+def test_strategy_spec_task_queues() -> None:
+    assert StrategySpec.parse("yolo.yaml") == StrategySpec(None, Path("yolo.yaml"))
+    assert StrategySpec.parse("fast=conf/yolo.yaml").task_queue("yolo") == "yolo.fast"
+    assert StrategySpec.parse("conf/yolo.yaml").task_queue("yolo") == "yolo"
+    with pytest.raises(argparse.ArgumentTypeError):
+        StrategySpec.parse("=yolo.yaml")
+
+
+def test_command_line_overrides_worker_config() -> None:
+    args = _parser().parse_args(
+        ["--services", "s.yaml", "--strategy", "y.yaml", "--max-concurrent-activities", "8"]
+    )
+
+    config = worker_config(WorkerConfig(graceful_shutdown_seconds=5), args)
+
+    assert config.max_concurrent_activities == 8
+    assert config.graceful_shutdown_seconds == 5
+    assert config.max_concurrent_workflow_tasks == WorkerConfig().max_concurrent_workflow_tasks
+
+
+def test_strategies_need_distinct_task_queues() -> None:
+    with pytest.raises(SystemExit):
+        main(["--services", "s.yaml", "--strategy", "a.yaml", "--strategy", "b.yaml"])
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_every_worker() -> None:
+    workers = [_Worker(), _Worker()]
+    stop = asyncio.Event()
+
+    serving = asyncio.create_task(serve(workers, stop))
+    await asyncio.sleep(0)
+    stop.set()
+    await asyncio.wait_for(serving, timeout=1)
+
+    assert [w.shutdowns for w in workers] == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_failed_worker_stops_the_others() -> None:
+    healthy = _Worker()
+
+    with pytest.raises(RuntimeError, match="poller failed"):
+        await asyncio.wait_for(serve([healthy, _Worker(fail=True)], asyncio.Event()), timeout=1)
+
+    assert healthy.shutdowns == 1
@@ -0,0 +1,84 @@
+import asyncio
+import dataclasses
+import time
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from temporalio.testing import ActivityEnvironment
+
+from traxon_strats.flows.yolo import activities as activities_module
+from traxon_strats.flows.yolo.activities import YoloActivities
+from traxon_strats.robotwealth.yolo.progress import ProgressCallback, RunCheckpoint, VenueProgress
+
+if TYPE_CHECKING:
+    from traxon_strats.robotwealth.yolo.strategy import YoloStrategy
+
+
+class _Strategy:
+    def __init__(self) -> None:
+        self.resumed_from: RunCheckpoint | None = None
+
+    async def run_strategy(
+        self, resume_from: RunCheckpoint | None = None, on_progress: ProgressCallback | None = None
+    ) -> None:
+        self.resumed_from = resume_from
+        checkpoint = RunCheckpoint(date(2026, 1, 5), resume_from.venues if resume_from else None, on_progress)
+        checkpoint.update("bybit", "executing", orders_submitted=2)
+        # Long phase without progress: the keep-alive heartbeats in between
+        await asyncio.sleep(0.05)
+        checkpoint.update("bybit", "done")
+
+
+@pytest.mark.asyncio
+async def test_run_strategy_heartbeats_and_resumes_checkpoint() -> None:
+    previous = RunCheckpoint(date(2026, 1, 5), {"binance": VenueProgress("done", 1, 1)}).to_dict()
+    env = ActivityEnvironment()
+    env.info = dataclasses.replace(
+        env.info, heartbeat_details=[previous], heartbeat_timeout=timedelta(milliseconds=30)
+    )
+    heartbeats: list[tuple[Any, ...]] = []
+    env.on_heartbeat = lambda *details: heartbeats.append(details)
+    strategy = _Strategy()
+    activities = YoloActivities.__new__(YoloActivities)
+    activities.strategy = cast("YoloStrategy", strategy)
+    activities.schema = MagicMock(run=AsyncMock(return_value=False))
+
+    await env.run(activities.run_strategy)
+
+    assert strategy.resumed_from is not None
+    assert strategy.resumed_from.venues == {"binance": VenueProgress("done", 1, 1)}
+    # The first keep-alive carries the previous checkpoint, so a crash before any progress keeps it
+    assert heartbeats[0] == (previous,)
+    phases = [d[0]["venues"]["bybit"]["phase"] for d in heartbeats if "bybit" in d[0]["venues"]]
+    assert phases[0] == "executing" and phases[-1] == "done"
+    assert phases.count("executing") > 1
+
+
+class _StuckStrategy:
+    async def run_strategy(
+        self, resume_from: RunCheckpoint | None = None, on_progress: ProgressCallback | None = None
+    ) -> None:
+        checkpoint = RunCheckpoint(date(2026, 1, 5), None, on_progress)
+        checkpoint.update("bybit", "executing")
+        # Stuck in a phase: the keep-alive must stop so the heartbeat timeout can fire
+        await asyncio.sleep(0.1)
+
+
+@pytest.mark.asyncio
+async def test_run_strategy_stops_heartbeating_when_stuck(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(activities_module, "_PHASE_DEADLINE", timedelta(milliseconds=20))
+    env = ActivityEnvironment()
+    env.info = dataclasses.replace(env.info, heartbeat_timeout=timedelta(milliseconds=15))
+    beats: list[float] = []
+    env.on_heartbeat = lambda *details: beats.append(time.monotonic())
+    activities = YoloActivities.__new__(YoloActivities)
+    activities.strategy = cast("YoloStrategy", _StuckStrategy())
+    activities.schema = MagicMock(run=AsyncMock(return_value=False))
+
+    started = time.monotonic()
+    await env.run(activities.run_strategy)
+
+    assert len(beats) >= 2
+    assert max(beats) - started < 0.06
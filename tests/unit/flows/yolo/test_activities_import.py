@@ -0,0 +1,38 @@
+import json
+import subprocess
+import sys
+
+# Modules the worker must not pay for before the activities are built
+HEAVY_MODULES = ("polars", "pandas", "pandera", "pyarrow", "httpx", "ccxt", "duckdb", "traxon_core")
+# Import budget for the flow modules on top of temporalio itself
+IMPORT_BUDGET_MS = 500
+
+_PROBE = f"""
+import json, sys, time
+import temporalio.activity, temporalio.workflow
+start = time.perf_counter()
+import traxon_strats.flows.yolo.activities
+import traxon_strats.flows.yolo.workflows
+import traxon_strats.flows.yolo.schedule
+from traxon_strats.flows.yolo import YoloWorkflow
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{"elapsed_ms": elapsed_ms, "loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def _cold_import() -> dict[str, object]:
+    result = subprocess.run([sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_flow_modules_import_without_strategy_stack() -> None:
+    probe = _cold_import()
+
+    assert probe["loaded"] == []
+
+
+def test_flow_modules_cold_import_budget() -> None:
+    # Best of three, to keep a busy machine from failing the check
+    elapsed_ms = min(float(_cold_import()["elapsed_ms"]) for _ in range(3))  # type: ignore[arg-type]
+
+    assert elapsed_ms < IMPORT_BUDGET_MS, f"cold import took {elapsed_ms:.0f}ms (budget {IMPORT_BUDGET_MS}ms)"
@@ -0,0 +1,18 @@
+from datetime import UTC, datetime
+
+from traxon_strats.flows.yolo.schedule import next_rebalance
+
+
+def test_next_rebalance_is_today_before_the_rebalance_time() -> None:
+    now = datetime(2026, 1, 5, 0, 1, tzinfo=UTC)
+
+    assert next_rebalance(now, "00:05") == datetime(2026, 1, 5, 0, 5, tzinfo=UTC)
+
+
+def test_next_rebalance_is_tomorrow_once_the_rebalance_time_passed() -> None:
+    assert next_rebalance(datetime(2026, 1, 5, 0, 5, tzinfo=UTC), "00:05") == datetime(
+        2026, 1, 6, 0, 5, tzinfo=UTC
+    )
+    assert next_rebalance(datetime(2026, 12, 31, 23, 0, tzinfo=UTC), "00:05") == datetime(
+        2027, 1, 1, 0, 5, tzinfo=UTC
+    )
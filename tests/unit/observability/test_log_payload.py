@@ -0,0 +1,55 @@
+import json
+import logging
+
+import polars as pl
+import structlog
+
+from traxon_strats.observability.log_payload import DeferredFrame, DeferredRepr
+
+
+class _CountingFrame(DeferredFrame):
+    renders = 0
+
+    def render(self) -> str:
+        type(self).renders += 1
+        return super().render()
+
+    __structlog__ = render
+
+
+def test_deferred_frame_sorts_and_truncates() -> None:
+    df = pl.DataFrame({"symbol": [f"S{i:02d}" for i in reversed(range(30))], "w": range(30)})
+
+    rendered = repr(DeferredFrame(df, sort_by="symbol", max_rows=4))
+
+    assert rendered.index("S00") < rendered.index("S29")
+    assert "S15" not in rendered
+    assert "…" in rendered
+    assert df["symbol"][0] == "S29"
+
+
+def test_deferred_repr_truncates() -> None:
+    payload = {"data": ["x" * 10] * 100}
+
+    assert repr(DeferredRepr(payload, max_chars=2000)) == repr(payload)
+    short = str(DeferredRepr(payload, max_chars=20))
+    assert short.startswith(repr(payload)[:20])
+    assert short.endswith(f"({len(repr(payload)) - 20} more chars)")
+
+
+def test_payload_rendered_only_when_emitted() -> None:
+    capture = structlog.testing.CapturingLogger()
+    log = structlog.wrap_logger(
+        capture,
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+        processors=[structlog.processors.JSONRenderer()],
+    )
+    df = pl.DataFrame({"symbol": ["B", "A"]})
+    _CountingFrame.renders = 0
+
+    log.debug("dropped", df=_CountingFrame(df, sort_by="symbol"))
+    assert _CountingFrame.renders == 0 and capture.calls == []
+
+    log.info("emitted", df=_CountingFrame(df, sort_by="symbol"))
+    assert _CountingFrame.renders == 1
+    assert json.loads(capture.calls[0].args[0])["df"] == DeferredFrame(df, sort_by="symbol").render()
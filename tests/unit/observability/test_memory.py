@@ -0,0 +1,147 @@
+import json
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import polars as pl
+import pytest
+
+from traxon_strats.benchmarks.synthetic import synthetic_universe
+from traxon_strats.observability.memory import (
+    component_allocations,
+    configure_memory_profiling,
+    memory_checkpoint,
+    memory_profiler,
+    profiled,
+)
+
+
+@pytest.fixture
+def profile_path(tmp_path: Path) -> Iterator[Path]:
+    configure_memory_profiling(tmp_path)
+    yield tmp_path
+    configure_memory_profiling()
+
+
+_LEAK = 1024 * 1024
+
+
+def _reports(path: Path) -> list[dict[str, Any]]:
+    return [json.loads(p.read_text()) for p in sorted(path.glob("*.json"))]
+
+
+@profiled("run")
+async def _run(n: int) -> None:
+    memory_checkpoint("start")
+    frame = pl.DataFrame({"x": range(n)})
+    memory_checkpoint("built", frame=frame, missing=None)
+
+
+@pytest.mark.asyncio
+async def test_disabled_profiling_does_nothing(tmp_path: Path) -> None:
+    await _run(10)
+
+    assert not memory_profiler.enabled
+    assert not tracemalloc.is_tracing()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_profiled_run_reports_each_phase(profile_path: Path) -> None:
+    await _run(1_000)
+
+    # Tracing goes on between runs while profiling is enabled
+    assert tracemalloc.is_tracing()
+    [report] = _reports(profile_path / "run")
+    assert report["run"] == "run"
+    assert [c["phase"] for c in report["checkpoints"]] == ["start", "built", "end"]
+    built = report["checkpoints"][1]
+    assert built["frames"] == {"frame": {"rows": 1_000, "chunks": 1, "mib": pytest.approx(0.008, abs=1e-3)}}
+    assert built["traced_mib"] >= 0 and built["peak_mib"] >= 0
+    assert "since_previous_run" not in report
+    assert (profile_path / "run" / "latest.snapshot").exists()
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_are_logged(profile_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    log = MagicMock()
+    monkeypatch.setattr(memory_profiler, "_logger", log)
+
+    await _run(1_000)
+
+    [start, built] = [c for c in log.info.call_args_list if "memory at" in c.args[0]]
+    assert start.args[0] == "run memory at start"
+    assert built.args[0] == "run memory at built"
+    assert set(built.kwargs) == {"traced_mib", "peak_mib", "rss_mib", "frames_mib"}
+    assert built.kwargs["frames_mib"] == pytest.approx(0.008, abs=1e-3)
+    log.warning.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_runs_are_diffed_against_the_previous_one(profile_path: Path) -> None:
+    await _run(10)
+    # Reports are named after the second the run started at
+    first = next((profile_path / "run").glob("*.json"))
+    first.rename(first.with_name("0.json"))
+    await _run(10)
+
+    reports = _reports(profile_path / "run")
+    assert len(reports) == 2
+    assert "traced_mib" in reports[1]["since_previous_run"]
+
+
+@pytest.mark.asyncio
+async def test_growth_across_runs_is_reported(profile_path: Path) -> None:
+    leaked: list[bytes] = []
+
+    @profiled("leaky")
+    async def leaky() -> None:
+        leaked.append(bytes(_LEAK))
+
+    await leaky()
+    first = next((profile_path / "leaky").glob("*.json"))
+    first.rename(first.with_name("0.json"))
+    await leaky()
+
+    [_, second] = _reports(profile_path / "leaky")
+    assert second["since_previous_run"]["traced_mib"] == pytest.approx(_LEAK / 1024 / 1024, abs=0.1)
+
+
+def test_disabling_profiling_stops_tracing(profile_path: Path) -> None:
+    with memory_profiler.profile("run"):
+        pass
+    assert tracemalloc.is_tracing()
+
+    configure_memory_profiling()
+
+    assert not tracemalloc.is_tracing()
+
+
+@pytest.mark.asyncio
+async def test_nested_runs_are_profiled_once(profile_path: Path) -> None:
+    @profiled("outer")
+    async def outer() -> None:
+        await _run(10)
+        memory_checkpoint("after")
+
+    await outer()
+
+    [report] = _reports(profile_path / "outer")
+    assert [c["phase"] for c in report["checkpoints"]] == ["start", "built", "after", "end"]
+    assert not (profile_path / "run").exists()
+
+
+def test_allocations_are_attributed_to_the_calling_module() -> None:
+    tracemalloc.start(25)
+    try:
+        before = tracemalloc.take_snapshot()
+        universe = synthetic_universe(2_000)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    components = [a.location for a in component_allocations(after, before, 10)]
+    assert "traxon_strats.benchmarks.synthetic" in components
+    assert universe.weights.height == 2_000
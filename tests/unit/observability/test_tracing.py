@@ -0,0 +1,86 @@
+import asyncio
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from traxon_strats.observability.tracing import (
+    JsonlSpanExporter,
+    Span,
+    Tracer,
+    configure_tracing,
+    traced,
+    tracer,
+)
+
+
+class _Collector:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+
+@pytest.fixture
+def collector() -> Iterator[_Collector]:
+    collector = _Collector()
+    tracer.configure([collector])
+    yield collector
+    configure_tracing()
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_across_tasks(collector: _Collector) -> None:
+    @traced("child")
+    async def child(n: int) -> pl.DataFrame:
+        await asyncio.sleep(0)
+        return pl.DataFrame({"x": range(n)})
+
+    with tracer.span("root", run="test") as root:
+        await asyncio.gather(child(2), child(3))
+
+    by_name = {s.name: s for s in collector.spans}
+    children = [s for s in collector.spans if s.name == "child"]
+    assert [s.name for s in collector.spans][-1] == "root"
+    assert {s.parent_id for s in children} == {root.span_id}
+    assert {s.trace_id for s in children} == {root.trace_id}
+    assert sorted(s.rows or 0 for s in children) == [2, 3]
+    assert by_name["root"].parent_id is None
+    assert by_name["root"].attributes == {"run": "test"}
+    assert tracer.current() is None
+
+
+def test_span_records_errors(collector: _Collector) -> None:
+    @traced()
+    def failing() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        failing()
+
+    [span] = collector.spans
+    assert span.name.endswith("failing")
+    assert span.error == "ValueError: boom"
+    assert span.duration_ms >= 0
+
+
+def test_jsonl_exporter_writes_otlp_spans(tmp_path: Path) -> None:
+    path = tmp_path / "traces" / "spans.jsonl"
+    local = Tracer([JsonlSpanExporter(path)])
+
+    with local.span("parent", exchange="binance"):
+        with local.span("child") as child:
+            child.rows = 5
+
+    child_record, parent_record = [json.loads(line) for line in path.read_text().splitlines()]
+    assert child_record["parentSpanId"] == parent_record["spanId"]
+    assert "parentSpanId" not in parent_record
+    assert len(parent_record["traceId"]) == 32 and len(parent_record["spanId"]) == 16
+    assert int(parent_record["endTimeUnixNano"]) >= int(parent_record["startTimeUnixNano"])
+    assert parent_record["status"] == {"code": 1}
+    attributes = {a["key"]: a["value"] for a in parent_record["attributes"]}
+    assert attributes["exchange"] == {"stringValue": "binance"}
+    assert {a["key"]: a["value"] for a in child_record["attributes"]}["rows"] == {"intValue": "5"}
@@ -0,0 +1,71 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import polars as pl
+import pytest
+from traxon_core.persistence.db.base import Database
+
+from traxon_strats.persistence.duckdb.repositories.run_journal import DuckDbRunJournalRepository
+from traxon_strats.persistence.repositories.interfaces import RunJournalEntry
+
+
+@pytest.fixture
+def mock_db() -> MagicMock:
+    db = MagicMock(spec=Database)
+    db.execute.return_value = db
+    return db
+
+
+@pytest.fixture
+def repository(mock_db: MagicMock) -> DuckDbRunJournalRepository:
+    return DuckDbRunJournalRepository(mock_db)
+
+
+@pytest.fixture
+def entry() -> RunJournalEntry:
+    target_portfolio = pl.DataFrame(
+        {
+            "symbol": ["BTC/USDT"],
+            "price": [50000.0],
+            "target_size_signed": [0.04],
+            "target_value": [2000.0],
+            "arrival_price": [50000.0],
+            "notional_size_signed": [0.0],
+            "delta": [0.04],
+            "delta_value": [2000.0],
+            "updated_at": ["2026-01-05"],
+        }
+    )
+    return RunJournalEntry("yolo.binance", "abc", datetime(2026, 1, 5, 12), True, target_portfolio)
+
+
+@pytest.mark.asyncio
+async def test_init_tables(repository: DuckDbRunJournalRepository, mock_db: MagicMock) -> None:
+    await repository.init_tables()
+    mock_db.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_store_and_get_run(
+    repository: DuckDbRunJournalRepository, mock_db: MagicMock, entry: RunJournalEntry
+) -> None:
+    await repository.store_run(entry)
+    mock_db.execute.assert_called_once()
+    stored = mock_db.execute.call_args.args[1]
+
+    mock_db.fetchone.return_value = tuple(stored)
+    run = await repository.get_run("yolo.binance", "abc")
+
+    assert run is not None
+    assert run.has_orders is True
+    assert run.created_at == entry.created_at
+    assert run.target_portfolio.equals(entry.target_portfolio)
+
+    with pytest.raises(ValueError):
+        await repository.store_run(entry._replace(account=""))
+
+
+@pytest.mark.asyncio
+async def test_get_run_not_found(repository: DuckDbRunJournalRepository, mock_db: MagicMock) -> None:
+    mock_db.fetchone.return_value = None
+    assert await repository.get_run("yolo.binance", "abc") is None
@@ -1,11 +1,17 @@
-from datetime import date
+from datetime import date, datetime, timedelta
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import polars as pl
 import pytest
+from traxon_core.config import DuckDBConfig
+from traxon_core.persistence.db import create_database
 from traxon_core.persistence.db.base import Database
 
+from traxon_strats.persistence.duckdb.repositories.accounts import DuckDbAccountsRepository
+from traxon_strats.persistence.duckdb.repositories.run_journal import DuckDbRunJournalRepository
 from traxon_strats.persistence.duckdb.repositories.yolo import DuckDbYoloRepository
+from traxon_strats.persistence.parquet.archive import ParquetArchiveExporter, ParquetArchiveReader
 
 
 @pytest.fixture
@@ -27,6 +33,50 @@ async def test_init_tables(repository: DuckDbYoloRepository, mock_db: MagicMock)
     assert mock_db.execute.call_count >= 2
 
 
+@pytest.mark.asyncio
+async def test_prune_history(mock_db: MagicMock) -> None:
+    archive = MagicMock(spec=ParquetArchiveExporter)
+    repository = DuckDbYoloRepository(mock_db, archive)
+
+    await repository.prune_history()
+
+    archive.export.assert_awaited_once()
+    assert all(c.args[0].lstrip().startswith("DELETE") for c in mock_db.execute.call_args_list)
+    mock_db.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_prune_history_archives_every_table_once(tmp_path: Path) -> None:
+    database = create_database(DuckDBConfig(path=":memory:"))
+    repository = DuckDbYoloRepository(database, ParquetArchiveExporter(database, tmp_path))
+    await repository.init_tables()
+    await DuckDbAccountsRepository(database).init_tables()
+    await DuckDbRunJournalRepository(database).init_tables()
+    old, recent = datetime.now() - timedelta(days=800), datetime.now() - timedelta(days=1)
+    for day in (old, recent):
+        database.execute(
+            "INSERT INTO weights VALUES (?, ?, 1.0, 1.0, 1.0, 0.1, 100.0)",
+            ["BTC/USDT", day.strftime("%Y-%m-%d")],
+        )
+        database.execute("INSERT INTO accounts VALUES (?, ?, 1000.0)", ["yolo.binance", day])
+    database.commit()
+
+    await repository.prune_history()
+    await repository.prune_history()
+
+    reader = ParquetArchiveReader(tmp_path)
+    assert reader.scan("weights").collect()["updated_at"].to_list() == [old.strftime("%Y-%m-%d")]
+    assert reader.scan("accounts").collect().height == 1
+    assert database.execute("SELECT count(*) FROM weights").fetchone() == (1,)
+    # Accounts are kept, the watermark stops them from being exported again
+    assert database.execute("SELECT count(*) FROM accounts").fetchone() == (2,)
+    watermarks = database.execute("SELECT count(*) FROM archive_watermarks").fetchone()
+    assert watermarks == (4,)
+    cutoff = (datetime.now() - timedelta(days=365 * 2)).date()
+    assert await ParquetArchiveExporter(database, tmp_path).export(end=cutoff) == 0
+    assert await ParquetArchiveExporter(database, tmp_path).export(end=date.today()) == 2
+
+
 @pytest.mark.asyncio
 async def test_store_weights(repository: DuckDbYoloRepository, mock_db: MagicMock) -> None:
     weights = pl.DataFrame(
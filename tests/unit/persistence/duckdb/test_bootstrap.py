@@ -0,0 +1,63 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from traxon_core.persistence.db.base import Database
+
+from traxon_strats.persistence.duckdb.bootstrap import SCHEMA_VERSION, DuckDbSchemaBootstrap
+from traxon_strats.persistence.repositories.interfaces import AccountsRepository, YoloRepository
+
+
+def _database(version: int | None) -> MagicMock:
+    db = MagicMock(spec=Database)
+    db.execute.return_value = db
+    db.fetchone.return_value = (version,)
+    return db
+
+
+def _repositories() -> list[MagicMock]:
+    accounts = MagicMock(spec=AccountsRepository)
+    accounts.init_tables = AsyncMock()
+    yolo = MagicMock(spec=YoloRepository)
+    yolo.init_tables = AsyncMock()
+    return [accounts, yolo]
+
+
+@pytest.mark.asyncio
+async def test_fresh_database_is_initialized_once_per_process() -> None:
+    db = _database(None)
+    repositories = _repositories()
+    bootstrap = DuckDbSchemaBootstrap(db, repositories)
+
+    results = await asyncio.gather(bootstrap.run(), bootstrap.run())
+    rerun = await bootstrap.run()
+
+    assert sorted(results) == [False, True]
+    assert rerun is False
+    for repository in repositories:
+        repository.init_tables.assert_awaited_once()
+    [insert] = [c for c in db.execute.call_args_list if c.args[0].startswith("INSERT")]
+    assert insert.args[1][0] == SCHEMA_VERSION
+
+
+@pytest.mark.asyncio
+async def test_database_at_current_version_is_left_untouched() -> None:
+    db = _database(SCHEMA_VERSION)
+    repositories = _repositories()
+
+    assert await DuckDbSchemaBootstrap(db, repositories).run() is False
+
+    for repository in repositories:
+        repository.init_tables.assert_not_awaited()
+    db.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_older_version_is_migrated() -> None:
+    db = _database(SCHEMA_VERSION)
+    repositories = _repositories()
+
+    assert await DuckDbSchemaBootstrap(db, repositories, version=SCHEMA_VERSION + 1).run() is True
+
+    for repository in repositories:
+        repository.init_tables.assert_awaited_once()
@@ -0,0 +1,80 @@
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import polars as pl
+import pytest
+from traxon_core.persistence.db.base import Database
+
+from traxon_strats.persistence.parquet.archive import (
+    ArchiveTable,
+    ParquetArchiveExporter,
+    ParquetArchiveReader,
+)
+
+
+@pytest.fixture
+def mock_db() -> MagicMock:
+    db = MagicMock(spec=Database)
+    db.execute.return_value = db
+    db.fetchone.return_value = None
+    return db
+
+
+@pytest.fixture
+def weights_rows() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "symbol": ["BTC/USDT", "ETH/USDT", "BTC/USDT"],
+            "updated_at": ["2026-01-05", "2026-01-05", "2026-01-06"],
+            "combo_weight": [0.1, 0.2, 0.3],
+            "date": ["2026-01-05", "2026-01-05", "2026-01-06"],
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_writes_one_partition_per_date(
+    tmp_path: Path, mock_db: MagicMock, weights_rows: pl.DataFrame
+) -> None:
+    mock_db.fetchdf.return_value = weights_rows
+    exporter = ParquetArchiveExporter(mock_db, tmp_path, (ArchiveTable("weights", "updated_at"),))
+
+    written = await exporter.export(end=date(2026, 1, 7))
+
+    assert written == 3
+    assert (tmp_path / "weights" / "date=2026-01-05" / "data.parquet").exists()
+    assert (tmp_path / "weights" / "date=2026-01-06" / "data.parquet").exists()
+    [(_, params)] = [c.args for c in mock_db.execute.call_args_list if "FROM weights" in c.args[0]]
+    assert params == ["2026-01-07"]
+
+
+@pytest.mark.asyncio
+async def test_export_is_idempotent(tmp_path: Path, mock_db: MagicMock, weights_rows: pl.DataFrame) -> None:
+    mock_db.fetchdf.return_value = weights_rows
+    exporter = ParquetArchiveExporter(mock_db, tmp_path, (ArchiveTable("weights", "updated_at"),))
+
+    await exporter.export()
+    await exporter.export()
+
+    assert ParquetArchiveReader(tmp_path).scan("weights").collect().height == 3
+
+
+@pytest.mark.asyncio
+async def test_reader_prunes_partitions(
+    tmp_path: Path, mock_db: MagicMock, weights_rows: pl.DataFrame
+) -> None:
+    mock_db.fetchdf.return_value = weights_rows
+    await ParquetArchiveExporter(mock_db, tmp_path, (ArchiveTable("weights", "updated_at"),)).export()
+
+    df = ParquetArchiveReader(tmp_path).scan("weights", start=date(2026, 1, 6)).collect()
+
+    assert df.height == 1
+    assert df["combo_weight"][0] == 0.3
+    assert df["date"][0] == date(2026, 1, 6)
+
+
+def test_duckdb_source_enables_hive_partitioning(tmp_path: Path) -> None:
+    source = ParquetArchiveReader(tmp_path).duckdb_source("weights")
+    assert "hive_partitioning = true" in source
+    assert (tmp_path / "weights").as_posix() in source
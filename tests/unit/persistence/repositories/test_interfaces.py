@@ -2,7 +2,12 @@ from datetime import date
 
 import polars as pl
 
-from traxon_strats.persistence.repositories.interfaces import AccountsRepository, YoloRepository
+from traxon_strats.persistence.repositories.interfaces import (
+    AccountsRepository,
+    RunJournalEntry,
+    RunJournalRepository,
+    YoloRepository,
+)
 
 
 def test_accounts_repository_exists() -> None:
@@ -48,3 +53,17 @@ def test_yolo_repository_runtime_checkable() -> None:
             return pl.DataFrame()
 
     assert isinstance(Impl(), YoloRepository)
+
+
+def test_run_journal_repository_runtime_checkable() -> None:
+    class Impl:
+        async def init_tables(self) -> None:
+            pass
+
+        async def store_run(self, entry: RunJournalEntry) -> None:
+            pass
+
+        async def get_run(self, account: str, fingerprint: str) -> RunJournalEntry | None:
+            return None
+
+    assert isinstance(Impl(), RunJournalRepository)
@@ -0,0 +1,119 @@
+from decimal import Decimal
+
+import polars as pl
+import pytest
+from traxon_core.crypto.models import Symbol
+from traxon_core.crypto.models.market_info import MarketInfo
+
+from traxon_strats.crypto.services.markets import MarketsIndex
+from traxon_strats.robotwealth.yolo.fills import apply_fills, fills_from_report, unresolved_symbols
+
+
+def _market(symbol: str, type: str, contract_size: str) -> MarketInfo:
+    return MarketInfo(
+        symbol=Symbol(symbol),
+        type=type,
+        active=True,
+        precision_amount=3,
+        precision_price=2,
+        contract_size=Decimal(contract_size),
+    )
+
+
+@pytest.fixture
+def markets() -> MarketsIndex:
+    spot = {s: _market(s, "spot", "1") for s in ("BTC/USDT", "ETH/USDT", "SOL/USDT", "XRP/USDT")}
+    perps = {"BTC/USDT:USDT": _market("BTC/USDT:USDT", "swap", "0.001")}
+    return MarketsIndex.from_markets({Symbol(s): m for s, m in (spot | perps).items()})
+
+
+@pytest.fixture
+def pre_trade() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "symbol": ["BTC/USDT", "ETH/USDT"],
+            "notional_size_signed": [0.5, -2.0],
+            "size": [0.5, 2.0],
+            "price": [50000.0, 3000.0],
+            "side": ["long", "short"],
+        }
+    )
+
+
+def test_fills_from_report_converts_contracts_to_base(markets: MarketsIndex) -> None:
+    fills = fills_from_report(
+        [
+            {
+                "symbol": "BTC/USDT:USDT",
+                "side": "sell",
+                "filled": 200.0,
+                "status": "closed",
+                "average": 50100.0,
+            },
+            {"symbol": "SOL/USDT", "side": "buy", "filled": 3.0, "status": "open", "average": None},
+        ],
+        markets,
+    )
+
+    assert fills is not None
+    assert fills.to_dicts() == [
+        {"symbol": "BTC/USDT", "filled_size_signed": pytest.approx(-0.2), "price": 50100.0, "complete": True},
+        {"symbol": "SOL/USDT", "filled_size_signed": 3.0, "price": None, "complete": False},
+    ]
+
+
+def test_fills_from_report_leaves_unconvertible_fills_unresolved(markets: MarketsIndex) -> None:
+    fills = fills_from_report(
+        [
+            {"symbol": "BTC/USDT:USDT", "side": "buy", "filled": 5.0, "status": "closed"},
+            # The contract size of a market missing from the index is unknown
+            {"symbol": "DOGE/USDT:USDT", "side": "buy", "filled": 5.0, "status": "closed"},
+        ],
+        markets,
+    )
+    assert fills is not None
+
+    assert fills["filled_size_signed"].to_list() == [pytest.approx(0.005), None]
+    assert unresolved_symbols(fills, ["BTC/USDT", "DOGE/USDT"]) == ["DOGE/USDT"]
+
+
+def test_fills_from_report_without_orders(markets: MarketsIndex) -> None:
+    assert fills_from_report([], markets) is None
+
+
+def test_unresolved_symbols_reports_missing_and_ambiguous_fills(markets: MarketsIndex) -> None:
+    fills = fills_from_report(
+        [
+            {"symbol": "BTC/USDT", "side": "buy", "filled": 0.1, "status": "closed"},
+            {"symbol": "ETH/USDT", "side": "buy", "filled": 0.5, "status": "open"},
+            {"symbol": "XRP/USDT", "side": None, "filled": 1.0, "status": "closed"},
+        ],
+        markets,
+    )
+    assert fills is not None
+
+    unresolved = unresolved_symbols(fills, ["BTC/USDT", "ETH/USDT", "SOL/USDT"])
+
+    assert unresolved == ["ETH/USDT", "SOL/USDT", "XRP/USDT"]
+
+
+def test_apply_fills_updates_flips_and_adds_positions(pre_trade: pl.DataFrame, markets: MarketsIndex) -> None:
+    fills = fills_from_report(
+        [
+            {"symbol": "BTC/USDT", "side": "sell", "filled": 0.2, "status": "closed", "average": 49000.0},
+            {"symbol": "ETH/USDT", "side": "buy", "filled": 3.0, "status": "closed", "average": 3100.0},
+            {"symbol": "SOL/USDT", "side": "sell", "filled": 10.0, "status": "closed", "average": 150.0},
+        ],
+        markets,
+    )
+    assert fills is not None
+
+    result = apply_fills(pre_trade, fills).sort("symbol")
+
+    assert result.columns == pre_trade.columns
+    assert result["symbol"].to_list() == ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
+    assert result["notional_size_signed"].to_list() == pytest.approx([0.3, 1.0, -10.0])
+    assert result["size"].to_list() == pytest.approx([0.3, 1.0, 10.0])
+    assert result["side"].to_list() == ["long", "long", "short"]
+    # Known positions keep their mark price, new ones use the fill price
+    assert result["price"].to_list() == [50000.0, 3000.0, 150.0]
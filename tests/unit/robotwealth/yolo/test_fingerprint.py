@@ -0,0 +1,56 @@
+from datetime import date
+
+import polars as pl
+import pytest
+from traxon_core.config import ExecutorConfig
+
+from traxon_strats.robotwealth.yolo.config import YoloSettingsConfig
+from traxon_strats.robotwealth.yolo.fingerprint import run_fingerprint
+
+
+@pytest.fixture
+def settings() -> YoloSettingsConfig:
+    return YoloSettingsConfig(
+        dry_run=False,
+        demo=True,
+        max_leverage=2.0,
+        equity_buffer=0.1,
+        trade_buffer=0.05,
+        momentum_factor=1.0,
+        trend_factor=1.0,
+        carry_factor=1.0,
+        executor=ExecutorConfig(execution="fast", max_spread_pct=0.01),
+    )
+
+
+@pytest.fixture
+def portfolio() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "symbol": ["BTC/USDT", "ETH/USDT", "SOL/USDT"],
+            "notional_size_signed": [0.5, -2.0, 0.0],
+            "size": [0.5, 2.0, 0.0],
+            "price": [50000.0, 3000.0, 150.0],
+            "side": ["long", "short", "long"],
+        }
+    )
+
+
+def test_fingerprint_ignores_row_order_prices_and_flat_positions(
+    settings: YoloSettingsConfig, portfolio: pl.DataFrame
+) -> None:
+    reference = run_fingerprint(date(2026, 1, 5), settings, 10000.0, portfolio)
+    moved = portfolio.reverse().with_columns(pl.col("price") * 1.01).filter(pl.col("symbol") != "SOL/USDT")
+
+    assert run_fingerprint(date(2026, 1, 5), settings, 10000.0, moved) == reference
+
+
+def test_fingerprint_changes_with_inputs(settings: YoloSettingsConfig, portfolio: pl.DataFrame) -> None:
+    reference = run_fingerprint(date(2026, 1, 5), settings, 10000.0, portfolio)
+    traded = portfolio.with_columns(pl.col("notional_size_signed") * 0.5)
+    tweaked = settings.model_copy(update={"trade_buffer": 0.1})
+
+    assert run_fingerprint(date(2026, 1, 6), settings, 10000.0, portfolio) != reference
+    assert run_fingerprint(date(2026, 1, 5), tweaked, 10000.0, portfolio) != reference
+    assert run_fingerprint(date(2026, 1, 5), settings, 10500.0, portfolio) != reference
+    assert run_fingerprint(date(2026, 1, 5), settings, 10000.0, traded) != reference
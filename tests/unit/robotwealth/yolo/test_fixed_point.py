@@ -0,0 +1,39 @@
+from decimal import Decimal
+
+import polars as pl
+import pytest
+
+from traxon_strats.robotwealth.yolo.errors import YoloInvalidAmountError
+from traxon_strats.robotwealth.yolo.fixed_point import DECIMAL_DTYPE, decimal_series, to_decimal
+
+
+def test_decimal_series_keeps_exact_values() -> None:
+    series = decimal_series("size", [Decimal("0.1"), Decimal("-2.5"), 3])
+
+    assert series.dtype == DECIMAL_DTYPE
+    assert series.sum() == Decimal("0.6")
+
+
+def test_to_decimal_rounds_float_artefacts() -> None:
+    df = pl.DataFrame({"value": [0.1 + 0.2, 220.00000000000003, None], "other": [1.0, 2.0, 3.0]})
+
+    result = to_decimal(df, "value")
+
+    assert result.schema["value"] == DECIMAL_DTYPE
+    assert result.schema["other"] == pl.Float64
+    assert result["value"].to_list() == [Decimal("0.3"), Decimal("220"), None]
+
+
+def test_decimal_series_rejects_values_out_of_range() -> None:
+    with pytest.raises(YoloInvalidAmountError, match=r"size .* for ETH/USDT: 1E\+30"):
+        decimal_series("size", [Decimal("1"), Decimal("1e30")], ["BTC/USDT", "ETH/USDT"])
+    with pytest.raises(YoloInvalidAmountError, match="row 0"):
+        decimal_series("size", [Decimal("NaN")])
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), 1e26])
+def test_to_decimal_rejects_non_finite_and_overflowing_values(value: float) -> None:
+    df = pl.DataFrame({"symbol": ["BTC/USDT", "ETH/USDT"], "value": [1.0, value]})
+
+    with pytest.raises(YoloInvalidAmountError, match="value .* for ETH/USDT"):
+        to_decimal(df, "value")
@@ -13,7 +13,11 @@ from traxon_core.crypto.models import (
 from traxon_core.crypto.models.market_info import MarketInfo
 from traxon_core.crypto.models.symbol import Symbol
 
+from traxon_strats.crypto.services.markets import DECIMAL_PLACES, TICK_SIZE, MarketsIndex
+from traxon_strats.robotwealth.yolo.data_schemas import OrderLegsSchema
+from traxon_strats.robotwealth.yolo.errors import YoloInvalidAmountError
 from traxon_strats.robotwealth.yolo.order_builder import YoloOrderBuilder
+from traxon_strats.validation.schemas import validated_frames
 
 
 class TestYoloOrderBuilder:
@@ -141,3 +145,208 @@ class TestYoloOrderBuilder:
         assert isinstance(open_order, OrderRequest)
         assert open_order.side == OrderSide.SELL
         assert open_order.notes == "direction flip"
+
+    def test_build_order_legs_classification(self) -> None:
+        """Test leg expansion: skip zero deltas, split flips, tag new vs adjustment."""
+        target_portfolio = pl.DataFrame(
+            {
+                "symbol": ["BTC/USDT", "ETH/USDT", "SOL/USDT", "ADA/USDT"],
+                "price": [50000.0, 3000.0, 100.0, 1.0],
+                "target_size_signed": [0.1, -1.0, 2.0, 10.0],
+                "target_value": [5000.0, -3000.0, 200.0, 10.0],
+                "arrival_price": [50000.0, 3000.0, 100.0, 1.0],
+                "notional_size_signed": [0.1, 1.0, 0.0, 5.0],
+                "delta": [0.0, -2.0, 2.0, 5.0],
+                "delta_value": [0.0, 6000.0, 200.0, 5.0],
+                "updated_at": ["2026-01-13"] * 4,
+            }
+        )
+
+        legs = YoloOrderBuilder.build_order_legs(target_portfolio)
+        assert validated_frames.is_validated(legs, OrderLegsSchema)
+
+        assert legs.select("symbol", "market_symbol", "leg", "bucket", "notes").rows() == [
+            ("ETH/USDT", "ETH/USDT", "close", "updates", "direction flip"),
+            ("ETH/USDT", "ETH/USDT:USDT", "open", "new", "direction flip"),
+            ("SOL/USDT", "SOL/USDT", "trade", "new", "new"),
+            ("ADA/USDT", "ADA/USDT", "trade", "updates", "adjustment"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_prepare_orders_flip_without_close_market(self) -> None:
+        """Test that a flip is skipped entirely when the current position's market is missing."""
+        exchange = MagicMock(spec=Exchange)
+        exchange.id = ExchangeId.BINANCE
+        exchange.api = MagicMock()
+
+        perp_symbol = Symbol("BTC/USDT:USDT")
+        perp_market = MarketInfo(
+            symbol=perp_symbol,
+            type="swap",
+            active=True,
+            precision_amount=3,
+            precision_price=2,
+            contract_size=Decimal("1.0"),
+        )
+        exchange.api.markets = {perp_symbol: perp_market}
+
+        positions = pl.DataFrame(
+            [
+                {
+                    "symbol": "BTC/USDT",
+                    "price": 50000.0,
+                    "arrival_price": 50000.0,
+                    "notional_size_signed": 0.1,
+                    "target_size_signed": -0.1,
+                    "target_value": -5000.0,
+                    "delta": -0.2,
+                    "delta_value": 10000.0,
+                    "updated_at": "2026-01-13",
+                }
+            ]
+        )
+
+        orders = await YoloOrderBuilder().prepare_orders(exchange, positions)
+
+        assert orders.is_empty()
+
+    def test_filter_tradable_legs(self) -> None:
+        """Test dust, precision and inactive-market filtering of order legs."""
+        legs = pl.DataFrame(
+            {
+                "symbol": ["BTC/USDT", "ETH/USDT", "SOL/USDT", "ADA/USDT"],
+                "market_symbol": ["BTC/USDT", "ETH/USDT", "SOL/USDT", "ADA/USDT"],
+                "leg": ["trade", "trade", "close", "trade"],
+                "bucket": ["updates", "updates", "updates", "new"],
+                "side_size": [0.1, 0.0004, -3.0, 10.0],
+                "size": [None, None, 3.0, None],
+                "price": [50000.0, 3000.0, 100.0, 0.5],
+                "value": [5000.0, 1.2, None, 5.0],
+                "notes": ["adjustment", "adjustment", "direction flip", "new"],
+                "market_idx": [0, 1, 2, 3],
+            },
+            schema_overrides={"market_idx": pl.UInt32},
+        )
+        markets = pl.DataFrame(
+            {
+                "market_idx": [0, 1, 2, 3],
+                "active": [True, True, False, True],
+                "precision_amount": [3.0, 3.0, 2.0, 1.0],
+                "precision_mode": [DECIMAL_PLACES] * 4,
+                "contract_size": [1.0, 1.0, 1.0, None],
+            },
+            schema_overrides={"market_idx": pl.UInt32, "precision_mode": pl.UInt8},
+        )
+
+        tradable, skipped = YoloOrderBuilder.filter_tradable_legs(legs, markets, min_order_value=6.0)
+
+        assert tradable["symbol"].to_list() == ["BTC/USDT"]
+        assert tradable.columns == legs.columns
+        assert dict(skipped.select("symbol", "reason").iter_rows()) == {
+            "ETH/USDT": "below amount precision",
+            "SOL/USDT": "market inactive",
+            "ADA/USDT": "below minimum order value",
+        }
+
+    def test_filter_tradable_legs_writes_back_rounded_sizes(self) -> None:
+        """Test that legs carry the sizes rounded to each market's step, whatever the precision mode."""
+        legs = pl.DataFrame(
+            {
+                "symbol": ["BTC/USDT", "ETH/USDT", "SOL/USDT"],
+                "market_symbol": ["BTC/USDT", "ETH/USDT:USDT", "SOL/USDT:USDT"],
+                "leg": ["close", "trade", "trade"],
+                "bucket": ["updates", "updates", "new"],
+                "side_size": [0.1234, -25.7, 19.0],
+                "size": [-0.1234, None, None],
+                "price": [50000.0, 10.0, 10.0],
+                "value": [None, 257.0, 190.0],
+                "notes": ["direction flip", "adjustment", "new"],
+                "market_idx": [0, 1, 2],
+            },
+            schema_overrides={"market_idx": pl.UInt32},
+        )
+        decimals = pl.DataFrame(
+            {
+                "market_idx": [0, 1, 2],
+                "active": [True, True, True],
+                "precision_amount": [3.0, 0.0, 1.0],
+                "precision_mode": [DECIMAL_PLACES] * 3,
+                "contract_size": [1.0, 1.0, 1.0],
+            },
+            schema_overrides={"market_idx": pl.UInt32, "precision_mode": pl.UInt8},
+        )
+        ticks = decimals.with_columns(
+            pl.Series("precision_amount", [0.001, 1.0, 10.0]),
+            pl.lit(TICK_SIZE, pl.UInt8).alias("precision_mode"),
+        )
+
+        for markets in (decimals, ticks):
+            tradable, _ = YoloOrderBuilder.filter_tradable_legs(legs, markets, min_order_value=0.0)
+            assert tradable["size"].to_list()[0] == pytest.approx(-0.123)
+            assert tradable["value"].to_list()[1:] == pytest.approx(
+                [250.0, 190.0 if markets is decimals else 100.0]
+            )
+
+    def test_filter_tradable_legs_skips_flip_when_close_leg_is_skipped(self) -> None:
+        """Test that the open leg of a flip is not traded alone, which would double the position."""
+        legs = pl.DataFrame(
+            {
+                "symbol": ["BTC/USDT", "BTC/USDT"],
+                "market_symbol": ["BTC/USDT", "BTC/USDT:USDT"],
+                "leg": ["close", "open"],
+                "bucket": ["updates", "new"],
+                "side_size": [-0.1, -0.1],
+                "size": [0.1, None],
+                "price": [50000.0, 50000.0],
+                "value": [None, 5000.0],
+                "notes": ["direction flip", "direction flip"],
+                "market_idx": [0, 1],
+            },
+            schema_overrides={"market_idx": pl.UInt32},
+        )
+        markets = pl.DataFrame(
+            {
+                "market_idx": [0, 1],
+                "active": [False, True],
+                "precision_amount": [3.0, 3.0],
+                "precision_mode": [DECIMAL_PLACES] * 2,
+                "contract_size": [1.0, 1.0],
+            },
+            schema_overrides={"market_idx": pl.UInt32, "precision_mode": pl.UInt8},
+        )
+
+        tradable, skipped = YoloOrderBuilder.filter_tradable_legs(legs, markets, min_order_value=0.0)
+
+        assert tradable.is_empty()
+        assert skipped["reason"].to_list() == ["market inactive", "close leg skipped"]
+
+    def test_orders_for_legs_rejects_legs_without_amount(self) -> None:
+        """Test that a leg whose amount went missing is never turned into an order."""
+        exchange = MagicMock(spec=Exchange)
+        exchange.id = ExchangeId.BINANCE
+        symbol = Symbol("BTC/USDT")
+        market = MarketInfo(
+            symbol=symbol,
+            type="spot",
+            active=True,
+            precision_amount=3,
+            precision_price=2,
+            contract_size=Decimal("1.0"),
+        )
+        legs = pl.DataFrame(
+            {
+                "symbol": ["BTC/USDT"],
+                "market_symbol": ["BTC/USDT"],
+                "leg": ["trade"],
+                "bucket": ["updates"],
+                "side_size": [0.1],
+                "size": [None],
+                "price": [50000.0],
+                "value": [None],
+                "notes": ["adjustment"],
+            },
+            schema_overrides={"size": pl.Float64, "value": pl.Float64},
+        )
+
+        with pytest.raises(YoloInvalidAmountError, match="BTC/USDT"):
+            YoloOrderBuilder().orders_for_legs(exchange, legs, MarketsIndex.from_markets({symbol: market}))
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 import hypothesis.strategies as st
 import polars as pl
 import pytest
@@ -8,6 +12,8 @@ from traxon_core.config import ExecutorConfig
 from traxon_core.crypto.models import (
     ExchangeId,
     Portfolio,
+    PositionSide,
+    Symbol,
 )
 from traxon_core.floats import float_is_zero, floats_equal
 
@@ -212,3 +218,32 @@ def test_position_sizing_logic(
     # Since portfolio is empty, delta should be equal to target size
     btc_delta = output_df.filter(pl.col("symbol") == "BTC/USDT").select("delta").item()
     assert btc_delta == 0.05
+
+
+def test_portfolio_ingestion_aggregates_in_fixed_point() -> None:
+    portfolio = MagicMock(spec=Portfolio)
+    portfolio.balances = [
+        SimpleNamespace(
+            symbol=Symbol("BTC/USDT"),
+            current_price=Decimal("50000.1"),
+            size=Decimal("0.1"),
+            notional_size=Decimal("0.1"),
+        )
+    ]
+    portfolio.perps = [
+        SimpleNamespace(
+            symbol=Symbol("BTC/USDT:USDT"),
+            side=PositionSide.SHORT,
+            current_price=Decimal("50000.3"),
+            size=Decimal("0.2"),
+            notional_size=Decimal("0.2"),
+        )
+    ]
+
+    df = YoloPortfolioSizer().portfolio_frame(portfolio)
+
+    row = df.row(0, named=True)
+    assert row["symbol"] == "BTC/USDT"
+    assert row["notional_size_signed"] == -0.1
+    assert row["size"] == pytest.approx(0.3)
+    assert row["price"] == pytest.approx(50000.2)
@@ -0,0 +1,26 @@
+import json
+from datetime import date
+
+from traxon_strats.robotwealth.yolo.progress import RunCheckpoint, VenueProgress
+
+
+def test_update_keeps_counts_and_notifies() -> None:
+    seen: list[dict[str, object]] = []
+    checkpoint = RunCheckpoint(date(2026, 1, 5), on_change=lambda c: seen.append(c.to_dict()))
+
+    checkpoint.update("binance", "executing", orders_submitted=3)
+    checkpoint.update("binance", "executed", fills_seen=2)
+
+    assert checkpoint.phase("binance") == "executed"
+    assert checkpoint.phase("bybit") is None
+    assert checkpoint.venues["binance"] == VenueProgress("executed", orders_submitted=3, fills_seen=2)
+    assert [s["venues"]["binance"]["phase"] for s in seen] == ["executing", "executed"]  # type: ignore[index]
+
+
+def test_round_trips_through_json() -> None:
+    checkpoint = RunCheckpoint(date(2026, 1, 5), {"binance": VenueProgress("done", 3, 2)})
+
+    restored = RunCheckpoint.from_dict(json.loads(json.dumps(checkpoint.to_dict())))
+
+    assert restored.run_date == checkpoint.run_date
+    assert restored.venues == checkpoint.venues
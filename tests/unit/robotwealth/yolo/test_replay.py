@@ -0,0 +1,128 @@
+import asyncio
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+import polars as pl
+import pytest
+from traxon_core.config import ExecutorConfig
+from traxon_core.crypto.models import Symbol
+from traxon_core.crypto.models.market_info import MarketInfo
+
+from traxon_strats.crypto.services.markets import MarketsIndex
+from traxon_strats.robotwealth.yolo.config import YoloSettingsConfig
+from traxon_strats.robotwealth.yolo.replay import RunBundle, main, replay
+
+
+@pytest.fixture
+def bundle() -> RunBundle:
+    settings = YoloSettingsConfig(
+        dry_run=False,
+        demo=True,
+        max_leverage=2.0,
+        equity_buffer=0.1,
+        trade_buffer=0.05,
+        momentum_factor=1.0,
+        trend_factor=1.0,
+        carry_factor=1.0,
+        executor=ExecutorConfig(execution="fast", max_spread_pct=0.01),
+    )
+    symbols = [Symbol("BTC/USDT"), Symbol("ETH/USDT"), Symbol("ETH/USDT:USDT")]
+    markets = MarketsIndex.from_markets(
+        {
+            s: MarketInfo(
+                symbol=s,
+                type="swap",
+                active=True,
+                precision_amount=3,
+                precision_price=2,
+                contract_size=Decimal("1.0"),
+            )
+            for s in symbols
+        }
+    )
+    weights = pl.DataFrame(
+        {
+            "symbol": ["BTC/USDT", "ETH/USDT"],
+            "updated_at": ["2026-01-05", "2026-01-05"],
+            "momentum_megafactor": [0.1, -0.3],
+            "trend_megafactor": [0.2, -0.2],
+            "carry_megafactor": [0.3, 0.1],
+            "combo_weight": [0.2, -0.1],
+            "arrival_price": [50000.0, 3000.0],
+        }
+    )
+    volatilities = pl.DataFrame(
+        {"symbol": ["BTC/USDT", "ETH/USDT"], "updated_at": ["2026-01-05"] * 2, "ewvol": [0.8, 0.9]}
+    )
+    current_portfolio = pl.DataFrame(
+        {
+            "symbol": ["ETH/USDT"],
+            "notional_size_signed": [0.5],
+            "size": [0.5],
+            "price": [3000.0],
+            "side": ["long"],
+        }
+    )
+    empty = pl.DataFrame()
+    return RunBundle(
+        exchange_id="binance",
+        run_date=date(2026, 1, 5),
+        captured_at=datetime(2026, 1, 5, 12, 30),
+        settings=settings,
+        equity=10000.0,
+        weights=weights,
+        volatilities=volatilities,
+        current_portfolio=current_portfolio,
+        markets=markets,
+        target_weights=empty,
+        target_portfolio=empty,
+        orders=empty,
+    )
+
+
+@pytest.mark.asyncio
+async def test_bundle_round_trip_replays_identically(bundle: RunBundle, tmp_path: Path) -> None:
+    result = await replay(bundle)
+    # BTC opens long on spot, ETH flips from a spot long to a perp short
+    assert result.orders.select("market_symbol", "leg").rows() == [
+        ("BTC/USDT", "trade"),
+        ("ETH/USDT", "close"),
+        ("ETH/USDT:USDT", "open"),
+    ]
+    captured = bundle._replace(
+        target_weights=result.target_weights,
+        target_portfolio=result.target_portfolio,
+        orders=result.orders,
+    )
+
+    captured.write(tmp_path / "bundle")
+    loaded = RunBundle.read(tmp_path / "bundle")
+
+    assert loaded.settings == bundle.settings
+    assert loaded.run_date == bundle.run_date
+    assert loaded.markets.frame.equals(bundle.markets.frame)
+    assert (await replay(loaded)).mismatches(loaded) == []
+
+
+@pytest.mark.asyncio
+async def test_replay_reports_mismatched_outputs(bundle: RunBundle) -> None:
+    result = await replay(bundle)
+    drifted = bundle._replace(
+        target_weights=result.target_weights,
+        target_portfolio=result.target_portfolio,
+        orders=result.orders.head(1),
+    )
+
+    assert result.mismatches(drifted) == ["orders"]
+
+
+def test_main_exit_code(bundle: RunBundle, tmp_path: Path) -> None:
+    result = asyncio.run(replay(bundle))
+    bundle._replace(target_weights=result.target_weights, target_portfolio=result.target_portfolio).write(
+        tmp_path / "stale"
+    )
+    bundle._replace(**result._asdict()).write(tmp_path / "fresh")
+
+    assert main([str(tmp_path / "fresh")]) == 0
+    assert main([str(tmp_path / "fresh"), str(tmp_path / "stale")]) == 1
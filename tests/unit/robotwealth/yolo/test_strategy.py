@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import json
+from datetime import date, datetime
 from decimal import Decimal
+from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import polars as pl
@@ -17,131 +22,728 @@ from traxon_core.crypto.models import AccountEquity, ExchangeId, Portfolio, Symb
 from traxon_core.crypto.models.market_info import MarketInfo
 
 from traxon_strats.crypto.services.equity import EquityService
-from traxon_strats.persistence.repositories.interfaces import YoloRepository
+from traxon_strats.crypto.services.exchange_pool import ExchangePool
+from traxon_strats.crypto.services.markets import MarketsIndex
+from traxon_strats.flows.payloads import data_converter
+from traxon_strats.observability.memory import configure_memory_profiling
+from traxon_strats.persistence.repositories.interfaces import (
+    RunJournalEntry,
+    RunJournalRepository,
+    YoloRepository,
+)
 from traxon_strats.robotwealth.yolo.config import (
     ServicesConfig,
     TemporalConfig,
     YoloConfig,
     YoloSettingsConfig,
 )
+from traxon_strats.robotwealth.yolo.errors import YoloApiDataNotUpToDateError, YoloStrategyError
+from traxon_strats.robotwealth.yolo.fills import fills_from_report
+from traxon_strats.robotwealth.yolo.order_builder import OrderPlan
+from traxon_strats.robotwealth.yolo.progress import RunCheckpoint, VenueProgress
+from traxon_strats.robotwealth.yolo.replay import RunBundle, replay
+from traxon_strats.robotwealth.yolo.stages import BatchResult, FrameData, OrderBatch, VenueTarget
 from traxon_strats.robotwealth.yolo.strategy import YoloStrategy
 
 
+@pytest.fixture
+def config() -> YoloConfig:
+    settings = YoloSettingsConfig(
+        dry_run=True,
+        demo=True,
+        max_leverage=2.0,
+        equity_buffer=0.1,
+        trade_buffer=0.05,
+        momentum_factor=1.0,
+        trend_factor=1.0,
+        carry_factor=1.0,
+        executor=ExecutorConfig(execution="fast", max_spread_pct=0.01),
+    )
+    return YoloConfig(
+        settings=settings,
+        exchanges=[
+            ExchangeConfig(
+                exchange_id="binance",
+                spot_quote_symbol="USDT",
+                leverage=1,
+                spot=True,
+                perp=True,
+                credentials={"apiKey": "key", "secret": "secret"},
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def services_config() -> ServicesConfig:
+    return ServicesConfig(
+        temporal=TemporalConfig(host="localhost", port=7233, namespace="default", task_queue="yolo"),
+        robot_wealth_api_key="rw_key",
+        database=DuckDBConfig(path="/tmp/test.db"),
+        cache=DiskConfig(path="/tmp/cache"),
+    )
+
+
+@pytest.fixture
+def exchange() -> MagicMock:
+    exchange = MagicMock(spec=Exchange)
+    exchange.id = ExchangeId.BINANCE
+    exchange.api = MagicMock()
+
+    symbol = Symbol("BTC/USDT")
+    market = MarketInfo(
+        symbol=symbol,
+        type="swap",
+        active=True,
+        precision_amount=3,
+        precision_price=2,
+        contract_size=Decimal("1.0"),
+    )
+    exchange.api.markets = {symbol: market}
+    exchange.api.close = AsyncMock()
+
+    exchange.fetch_account_equity = AsyncMock(
+        return_value=AccountEquity(
+            total_equity=Decimal("10000.0"),
+            perps_equity=Decimal("10000.0"),
+            spot_equity=Decimal("0.0"),
+            available_balance=Decimal("5000.0"),
+            maintenance_margin=Decimal("0.0"),
+            maintenance_margin_pct=Decimal("0.0"),
+        )
+    )
+    return exchange
+
+
+@pytest.fixture
+def yolo_repo() -> MagicMock:
+    yolo_repo = MagicMock(spec=YoloRepository)
+    yolo_repo.get_weights = AsyncMock(
+        return_value=pl.DataFrame(
+            [
+                {
+                    "symbol": "BTC/USDT",
+                    "updated_at": "2026-01-05",
+                    "momentum_megafactor": 0.1,
+                    "trend_megafactor": 0.2,
+                    "carry_megafactor": 0.3,
+                    "combo_weight": 0.2,
+                    "arrival_price": 50000.0,
+                }
+            ]
+        )
+    )
+    yolo_repo.get_volatilities = AsyncMock(
+        return_value=pl.DataFrame(
+            [
+                {
+                    "symbol": "BTC/USDT",
+                    "updated_at": "2026-01-05",
+                    "ewvol": 0.02,
+                }
+            ]
+        )
+    )
+    return yolo_repo
+
+
+@pytest.fixture
+def portfolio_fetcher() -> MagicMock:
+    portfolio_fetcher = MagicMock(spec=PortfolioFetcher)
+    mock_portfolio = Portfolio(exchange_id=ExchangeId.BINANCE, balances=[], perps=[])
+    portfolio_fetcher.fetch_portfolios = AsyncMock(return_value=[mock_portfolio])
+    return portfolio_fetcher
+
+
+@pytest.fixture
+def equity_service() -> MagicMock:
+    equity_service = MagicMock(spec=EquityService)
+    equity_service.calculate_trading_capital = AsyncMock(return_value=10000.0)
+    return equity_service
+
+
+@pytest.fixture
+def strategy(
+    config: YoloConfig,
+    services_config: ServicesConfig,
+    portfolio_fetcher: MagicMock,
+    yolo_repo: MagicMock,
+    equity_service: MagicMock,
+) -> YoloStrategy:
+    return YoloStrategy(
+        config=config,
+        services_config=services_config,
+        portfolio_fetcher=portfolio_fetcher,
+        yolo_repository=yolo_repo,
+        equity_service=equity_service,
+    )
+
+
 class TestYoloStrategy:
     """Tests for YoloStrategy orchestration."""
 
     @pytest.mark.asyncio
-    async def test_run_strategy_flow(self) -> None:
-        # Mock dependencies
-        settings = YoloSettingsConfig(
-            dry_run=True,
-            demo=True,
-            max_leverage=2.0,
-            equity_buffer=0.1,
-            trade_buffer=0.05,
-            momentum_factor=1.0,
-            trend_factor=1.0,
-            carry_factor=1.0,
-            executor=ExecutorConfig(execution="fast", max_spread_pct=0.01),
-        )
-        config = YoloConfig(
-            settings=settings,
-            exchanges=[
-                ExchangeConfig(
-                    exchange_id="binance",
-                    spot_quote_symbol="USDT",
-                    leverage=1,
-                    spot=True,
-                    perp=True,
-                    credentials={"apiKey": "key", "secret": "secret"},
-                )
-            ],
-        )
-        services_config = ServicesConfig(
-            temporal=TemporalConfig(host="localhost", port=7233, namespace="default", task_queue="yolo"),
-            robot_wealth_api_key="rw_key",
-            database=DuckDBConfig(path="/tmp/test.db"),
-            cache=DiskConfig(path="/tmp/cache"),
-        )
-
-        portfolio_fetcher = MagicMock(spec=PortfolioFetcher)
-        yolo_repo = MagicMock(spec=YoloRepository)
-        equity_service = MagicMock(spec=EquityService)
-        equity_service.calculate_trading_capital = AsyncMock(return_value=10000.0)
-
-        exchange = MagicMock(spec=Exchange)
-        exchange.id = ExchangeId.BINANCE
-        exchange.api = MagicMock()
-
-        symbol = Symbol("BTC/USDT")
-        market = MarketInfo(
-            symbol=symbol,
-            type="swap",
-            active=True,
-            precision_amount=3,
-            precision_price=2,
-            contract_size=Decimal("1.0"),
-        )
-        exchange.api.markets = {symbol: market}
-        exchange.api.close = AsyncMock()
-
-        exchange.fetch_account_equity = AsyncMock(
-            return_value=AccountEquity(
-                total_equity=Decimal("10000.0"),
-                perps_equity=Decimal("10000.0"),
-                spot_equity=Decimal("0.0"),
-                available_balance=Decimal("5000.0"),
-                maintenance_margin=Decimal("0.0"),
-                maintenance_margin_pct=Decimal("0.0"),
-            )
+    async def test_run_strategy_flow(
+        self,
+        strategy: YoloStrategy,
+        exchange: MagicMock,
+        yolo_repo: MagicMock,
+        portfolio_fetcher: MagicMock,
+        equity_service: MagicMock,
+    ) -> None:
+        with patch.object(YoloStrategy, "_get_exchanges", new_callable=AsyncMock) as mock_get_exchanges:
+            mock_get_exchanges.return_value = [exchange]
+
+            # Run
+            await strategy.run_strategy()
+
+            # Verify orchestration
+            yolo_repo.get_weights.assert_called()
+            mock_get_exchanges.assert_called_once()
+            portfolio_fetcher.fetch_portfolios.assert_called()
+            equity_service.calculate_trading_capital.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_run_strategy_reads_the_signals_of_each_run_date(
+        self,
+        strategy: YoloStrategy,
+        exchange: MagicMock,
+        yolo_repo: MagicMock,
+    ) -> None:
+        class _Today(date):
+            current = date(2026, 1, 5)
+
+            @classmethod
+            def today(cls) -> date:
+                return cls.current
+
+        # One strategy instance serves the daily runs of a long-lived worker
+        with (
+            patch.object(YoloStrategy, "_get_exchanges", new_callable=AsyncMock, return_value=[exchange]),
+            patch.object(Exchange, "close", new_callable=AsyncMock),
+            patch("traxon_strats.robotwealth.yolo.strategy.date", _Today),
+        ):
+            await strategy.run_strategy()
+            _Today.current = date(2026, 1, 6)
+            await strategy.run_strategy()
+
+        assert [c.args[0] for c in yolo_repo.get_weights.await_args_list] == [
+            date(2026, 1, 5),
+            date(2026, 1, 6),
+        ]
+        assert [c.args[0] for c in yolo_repo.get_volatilities.await_args_list] == [
+            date(2026, 1, 5),
+            date(2026, 1, 6),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_run_strategy_pipeline_failure_closes_exchange(
+        self,
+        strategy: YoloStrategy,
+        exchange: MagicMock,
+        yolo_repo: MagicMock,
+    ) -> None:
+        yolo_repo.get_weights = AsyncMock(return_value=pl.DataFrame())
+
+        with (
+            patch.object(YoloStrategy, "_get_exchanges", new_callable=AsyncMock, return_value=[exchange]),
+            patch.object(Exchange, "close", new_callable=AsyncMock) as mock_close,
+            pytest.raises(YoloStrategyError) as exc_info,
+        ):
+            await strategy.run_strategy()
+
+        assert isinstance(exc_info.value.__cause__, YoloApiDataNotUpToDateError)
+        mock_close.assert_awaited_once_with([exchange])
+
+    @pytest.mark.asyncio
+    async def test_run_strategy_uses_exchange_pool(
+        self,
+        config: YoloConfig,
+        services_config: ServicesConfig,
+        portfolio_fetcher: MagicMock,
+        yolo_repo: MagicMock,
+        equity_service: MagicMock,
+        exchange: MagicMock,
+    ) -> None:
+        pool = MagicMock(spec=ExchangePool)
+        pool.acquire = AsyncMock(return_value=[exchange])
+        pool.release = AsyncMock()
+        strategy = YoloStrategy(
+            config=config,
+            services_config=services_config,
+            portfolio_fetcher=portfolio_fetcher,
+            yolo_repository=yolo_repo,
+            equity_service=equity_service,
+            exchange_pool=pool,
         )
 
-        yolo_repo.get_weights = AsyncMock(
-            return_value=pl.DataFrame(
-                [
-                    {
-                        "symbol": "BTC/USDT",
-                        "updated_at": "2026-01-05",
-                        "momentum_megafactor": 0.1,
-                        "trend_megafactor": 0.2,
-                        "carry_megafactor": 0.3,
-                        "combo_weight": 0.2,
-                        "arrival_price": 50000.0,
-                    }
-                ]
-            )
+        await strategy.run_strategy()
+
+        pool.acquire.assert_awaited_once_with(config.settings.demo, config.exchanges)
+        pool.release.assert_awaited_once_with([exchange], failed=False)
+
+    @pytest.mark.asyncio
+    async def test_warm_up_loads_markets_into_pooled_sessions(
+        self,
+        config: YoloConfig,
+        services_config: ServicesConfig,
+        portfolio_fetcher: MagicMock,
+        yolo_repo: MagicMock,
+        equity_service: MagicMock,
+        exchange: MagicMock,
+    ) -> None:
+        pool = MagicMock(spec=ExchangePool)
+        pool.acquire = AsyncMock(return_value=[exchange])
+        pool.release = AsyncMock()
+        strategy = YoloStrategy(
+            config=config,
+            services_config=services_config,
+            portfolio_fetcher=portfolio_fetcher,
+            yolo_repository=yolo_repo,
+            equity_service=equity_service,
+            exchange_pool=pool,
         )
-        yolo_repo.get_volatilities = AsyncMock(
-            return_value=pl.DataFrame(
-                [
-                    {
-                        "symbol": "BTC/USDT",
-                        "updated_at": "2026-01-05",
-                        "ewvol": 0.02,
-                    }
-                ]
-            )
+
+        with patch.object(strategy._order_builder, "markets_index", new_callable=AsyncMock) as markets_index:
+            await strategy.warm_up()
+
+        markets_index.assert_awaited_once_with(exchange)
+        pool.release.assert_awaited_once_with([exchange], failed=False)
+        portfolio_fetcher.fetch_portfolios.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_strategy_isolates_venue_failures(
+        self,
+        strategy: YoloStrategy,
+        exchange: MagicMock,
+        yolo_repo: MagicMock,
+        equity_service: MagicMock,
+    ) -> None:
+        broken = MagicMock(spec=Exchange)
+        broken.id = "bybit"
+        broken.fetch_account_equity = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with (
+            patch.object(
+                YoloStrategy, "_get_exchanges", new_callable=AsyncMock, return_value=[exchange, broken]
+            ),
+            patch.object(Exchange, "close", new_callable=AsyncMock) as mock_close,
+            pytest.raises(YoloStrategyError) as exc_info,
+        ):
+            await strategy.run_strategy()
+
+        assert isinstance(exc_info.value.__cause__, RuntimeError)
+        # Weights are fetched once for both venues
+        yolo_repo.get_weights.assert_awaited_once()
+        equity_service.calculate_trading_capital.assert_awaited_once()
+        assert equity_service.calculate_trading_capital.await_args.kwargs["account"] == f"yolo.{exchange.id}"
+        mock_close.assert_any_await([exchange])
+        mock_close.assert_any_await([broken])
+
+    @pytest.mark.asyncio
+    async def test_incremental_validation_applies_fills_without_refetch(
+        self,
+        config: YoloConfig,
+        services_config: ServicesConfig,
+        portfolio_fetcher: MagicMock,
+        yolo_repo: MagicMock,
+        equity_service: MagicMock,
+        exchange: MagicMock,
+    ) -> None:
+        settings = config.settings.model_copy(update={"dry_run": False, "validation_mode": "incremental"})
+        strategy = YoloStrategy(
+            config=config.model_copy(update={"settings": settings}),
+            services_config=services_config,
+            portfolio_fetcher=portfolio_fetcher,
+            yolo_repository=yolo_repo,
+            equity_service=equity_service,
+        )
+        executor = MagicMock()
+        executor.execute_orders = AsyncMock(
+            return_value=[{"symbol": "BTC/USDT", "side": "buy", "filled": 0.04, "status": "closed"}]
+        )
+
+        with (
+            patch.object(YoloStrategy, "_get_exchanges", new_callable=AsyncMock, return_value=[exchange]),
+            patch.object(Exchange, "close", new_callable=AsyncMock),
+            patch("traxon_strats.robotwealth.yolo.strategy.DefaultOrderExecutor", return_value=executor),
+        ):
+            await strategy.run_strategy()
+
+        executor.execute_orders.assert_awaited_once()
+        portfolio_fetcher.fetch_portfolios.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_incremental_validation_ignores_skipped_legs(
+        self,
+        config: YoloConfig,
+        services_config: ServicesConfig,
+        portfolio_fetcher: MagicMock,
+        yolo_repo: MagicMock,
+        equity_service: MagicMock,
+        exchange: MagicMock,
+    ) -> None:
+        settings = config.settings.model_copy(update={"validation_mode": "incremental"})
+        strategy = YoloStrategy(
+            config=config.model_copy(update={"settings": settings}),
+            services_config=services_config,
+            portfolio_fetcher=portfolio_fetcher,
+            yolo_repository=yolo_repo,
+            equity_service=equity_service,
+        )
+        pre_trade = pl.DataFrame(
+            {
+                "symbol": ["BTC/USDT"],
+                "notional_size_signed": [0.5],
+                "size": [0.5],
+                "price": [50000.0],
+                "side": ["long"],
+            }
+        )
+        # ETH/USDT is below the minimum order value, so only BTC/USDT was traded
+        target_portfolio = pl.DataFrame({"symbol": ["BTC/USDT", "ETH/USDT"], "delta": [0.1, 0.001]})
+        plan = OrderPlan(pl.DataFrame({"symbol": ["BTC/USDT"]}), pl.DataFrame(), [])
+        fills = fills_from_report(
+            [{"symbol": "BTC/USDT", "side": "buy", "filled": 0.1, "status": "closed"}],
+            MarketsIndex.from_markets(exchange.api.markets),
+        )
+
+        with (
+            patch.object(strategy._order_builder, "markets_index", new_callable=AsyncMock),
+            patch.object(strategy._order_builder, "plan_orders", return_value=plan),
+        ):
+            portfolio = await strategy._post_trade_portfolio(exchange, pre_trade, target_portfolio, fills)
+
+        portfolio_fetcher.fetch_portfolios.assert_not_awaited()
+        assert portfolio["notional_size_signed"].to_list() == pytest.approx([0.6])
+
+    @pytest.mark.asyncio
+    async def test_run_strategy_writes_memory_profile(
+        self,
+        config: YoloConfig,
+        services_config: ServicesConfig,
+        portfolio_fetcher: MagicMock,
+        yolo_repo: MagicMock,
+        equity_service: MagicMock,
+        exchange: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        settings = config.settings.model_copy(update={"dry_run": False, "validation_mode": "incremental"})
+        strategy = YoloStrategy(
+            config=config.model_copy(update={"settings": settings}),
+            services_config=services_config,
+            portfolio_fetcher=portfolio_fetcher,
+            yolo_repository=yolo_repo,
+            equity_service=equity_service,
+        )
+        executor = MagicMock()
+        executor.execute_orders = AsyncMock(
+            return_value=[{"symbol": "BTC/USDT", "side": "buy", "filled": 0.04, "status": "closed"}]
+        )
+
+        configure_memory_profiling(tmp_path)
+        try:
+            with (
+                patch.object(YoloStrategy, "_get_exchanges", new_callable=AsyncMock, return_value=[exchange]),
+                patch.object(Exchange, "close", new_callable=AsyncMock),
+                patch("traxon_strats.robotwealth.yolo.strategy.DefaultOrderExecutor", return_value=executor),
+            ):
+                await strategy.run_strategy()
+        finally:
+            configure_memory_profiling()
+
+        [path] = (tmp_path / "run_strategy").glob("*.json")
+        checkpoints = json.loads(path.read_text())["checkpoints"]
+        assert [c["phase"] for c in checkpoints] == [
+            "exchanges",
+            "setup",
+            f"planned:{exchange.id}",
+            f"executed:{exchange.id}",
+            f"validated:{exchange.id}",
+            "end",
+        ]
+        assert checkpoints[2]["frames"]["target_portfolio"]["rows"] > 0
+
+    @pytest.mark.asyncio
+    async def test_run_strategy_reports_progress_and_resumes_checkpoint(
+        self,
+        config: YoloConfig,
+        services_config: ServicesConfig,
+        portfolio_fetcher: MagicMock,
+        yolo_repo: MagicMock,
+        equity_service: MagicMock,
+        exchange: MagicMock,
+    ) -> None:
+        settings = config.settings.model_copy(update={"dry_run": False})
+        strategy = YoloStrategy(
+            config=config.model_copy(update={"settings": settings}),
+            services_config=services_config,
+            portfolio_fetcher=portfolio_fetcher,
+            yolo_repository=yolo_repo,
+            equity_service=equity_service,
+        )
+        executor = MagicMock()
+        executor.execute_orders = AsyncMock(return_value=None)
+        venue = f"{exchange.id}"
+        phases: list[str | None] = []
+
+        with (
+            patch.object(YoloStrategy, "_get_exchanges", new_callable=AsyncMock, return_value=[exchange]),
+            patch.object(Exchange, "close", new_callable=AsyncMock),
+            patch("traxon_strats.robotwealth.yolo.strategy.DefaultOrderExecutor", return_value=executor),
+        ):
+            await strategy.run_strategy(on_progress=lambda c: phases.append(c.phase(venue)))
+            assert phases == ["sized", "executing", "executed", "done"]
+            executor.execute_orders.assert_awaited_once()
+
+            # Interrupted after execution: the retry validates without trading again
+            executor.execute_orders.reset_mock()
+            portfolio_fetcher.fetch_portfolios.reset_mock()
+            executed = RunCheckpoint(date.today(), {venue: VenueProgress("executed", orders_submitted=1)})
+            checkpoints: list[RunCheckpoint] = []
+            await strategy.run_strategy(resume_from=executed, on_progress=checkpoints.append)
+            executor.execute_orders.assert_not_awaited()
+            portfolio_fetcher.fetch_portfolios.assert_awaited_once()
+            assert checkpoints[-1].venues[venue] == VenueProgress("done", orders_submitted=1)
+
+            # Completed venues are skipped, unless the checkpoint is from another day
+            equity_service.calculate_trading_capital.reset_mock()
+            await strategy.run_strategy(resume_from=checkpoints[-1])
+            equity_service.calculate_trading_capital.assert_not_awaited()
+            stale = RunCheckpoint(date(2020, 1, 1), checkpoints[-1].venues)
+            await strategy.run_strategy(resume_from=stale)
+            equity_service.calculate_trading_capital.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_workflow_stages_round_trip_through_temporal_payloads(
+        self,
+        config: YoloConfig,
+        services_config: ServicesConfig,
+        portfolio_fetcher: MagicMock,
+        yolo_repo: MagicMock,
+        equity_service: MagicMock,
+        exchange: MagicMock,
+    ) -> None:
+        settings = config.settings.model_copy(update={"dry_run": False})
+        strategy = YoloStrategy(
+            config=config.model_copy(update={"settings": settings}),
+            services_config=services_config,
+            portfolio_fetcher=portfolio_fetcher,
+            yolo_repository=yolo_repo,
+            equity_service=equity_service,
+        )
+        executor = MagicMock()
+        executor.execute_orders = AsyncMock(
+            return_value=[{"symbol": "BTC/USDT:USDT", "side": "buy", "filled": 0.036, "status": "closed"}]
+        )
+        converter = data_converter().payload_converter
+
+        def round_trip(value: Any, type_hint: Any) -> Any:
+            [decoded] = converter.from_payloads(converter.to_payloads([value]), [type_hint])
+            return decoded
+
+        with (
+            patch.object(YoloStrategy, "_get_exchanges", new_callable=AsyncMock, return_value=[exchange]),
+            patch.object(Exchange, "close", new_callable=AsyncMock),
+            patch("traxon_strats.robotwealth.yolo.strategy.DefaultOrderExecutor", return_value=executor),
+        ):
+            targets = round_trip(await strategy.compute_targets(), list[VenueTarget])
+            assert [t.venue for t in targets] == ["binance"]
+            assert not targets[0].skip
+
+            batches = round_trip(await strategy.build_orders(targets[0]), list[OrderBatch])
+            assert [b.symbol for b in batches] == ["BTC/USDT"]
+
+            result = round_trip(await strategy.execute_order_batch(batches[0]), BatchResult)
+            assert result.orders_submitted == 1
+            assert result.fills is not None
+
+            converged = await strategy.validate_venue(targets[0], [result])
+
+        # The mocked portfolio does not move, so the target is not reached
+        assert converged is False
+        executor.execute_orders.assert_awaited_once()
+        assert portfolio_fetcher.fetch_portfolios.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_share_one_venue_session(
+        self,
+        config: YoloConfig,
+        services_config: ServicesConfig,
+        portfolio_fetcher: MagicMock,
+        yolo_repo: MagicMock,
+        equity_service: MagicMock,
+        exchange: MagicMock,
+    ) -> None:
+        strategy = YoloStrategy(
+            config=config,
+            services_config=services_config,
+            portfolio_fetcher=portfolio_fetcher,
+            yolo_repository=yolo_repo,
+            equity_service=equity_service,
+        )
+
+        async def execute_orders(exchanges: list[Exchange], orders: Any) -> list[dict[str, Any]]:
+            await asyncio.sleep(0.01)
+            return []
+
+        executor = MagicMock()
+        executor.execute_orders = AsyncMock(side_effect=execute_orders)
+        legs = pl.DataFrame(
+            {
+                "symbol": ["BTC/USDT"],
+                "market_symbol": ["BTC/USDT"],
+                "leg": ["trade"],
+                "bucket": ["updates"],
+                "side_size": [0.1],
+                "size": [None],
+                "price": [50000.0],
+                "value": [5000.0],
+                "notes": ["adjustment"],
+            },
+            schema_overrides={"size": pl.Float64},
         )
+        batches = [OrderBatch("binance", "BTC/USDT", FrameData.of(legs)) for _ in range(3)]
 
+        with (
+            patch.object(
+                YoloStrategy, "_get_exchanges", new_callable=AsyncMock, return_value=[exchange]
+            ) as get_exchanges,
+            patch.object(Exchange, "close", new_callable=AsyncMock) as close,
+            patch("traxon_strats.robotwealth.yolo.strategy.DefaultOrderExecutor", return_value=executor),
+        ):
+            await asyncio.gather(*(strategy.execute_order_batch(b) for b in batches))
+
+        get_exchanges.assert_awaited_once()
+        close.assert_awaited_once_with([exchange])
+        assert executor.execute_orders.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_run_strategy_journals_run_and_short_circuits_rerun(
+        self,
+        config: YoloConfig,
+        services_config: ServicesConfig,
+        portfolio_fetcher: MagicMock,
+        yolo_repo: MagicMock,
+        equity_service: MagicMock,
+        exchange: MagicMock,
+    ) -> None:
+        journal = MagicMock(spec=RunJournalRepository)
+        journal.get_run = AsyncMock(return_value=None)
+        journal.store_run = AsyncMock()
         strategy = YoloStrategy(
             config=config,
             services_config=services_config,
             portfolio_fetcher=portfolio_fetcher,
             yolo_repository=yolo_repo,
             equity_service=equity_service,
+            run_journal=journal,
         )
 
-        mock_portfolio = Portfolio(exchange_id=ExchangeId.BINANCE, balances=[], perps=[])
-        portfolio_fetcher.fetch_portfolios = AsyncMock(return_value=[mock_portfolio])
+        with (
+            patch.object(YoloStrategy, "_get_exchanges", new_callable=AsyncMock, return_value=[exchange]),
+            patch.object(Exchange, "close", new_callable=AsyncMock),
+        ):
+            await strategy.run_strategy()
 
-        with patch.object(YoloStrategy, "_get_exchange", new_callable=AsyncMock) as mock_get_exchange:
-            mock_get_exchange.return_value = exchange
+            journal.store_run.assert_awaited_once()
+            entry: RunJournalEntry = journal.store_run.await_args.args[0]
+            assert entry.account == f"yolo.{exchange.id}"
+            assert entry.has_orders
 
-            # Run
+            # A rerun with the same inputs after a run with nothing to trade has nothing to do
+            journal.get_run = AsyncMock(return_value=entry._replace(has_orders=False))
+            with (
+                patch.object(strategy._portfolio_sizer, "size_frame") as size_frame,
+                patch.object(
+                    strategy._order_builder,
+                    "prepare_orders",
+                    new_callable=AsyncMock,
+                    return_value=MagicMock(),
+                ) as prepare,
+            ):
+                await strategy.run_strategy()
+
+            journal.get_run.assert_awaited_once_with(entry.account, entry.fingerprint)
+            size_frame.assert_not_called()
+            prepare.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_run_strategy_reuses_journaled_target_portfolio(
+        self,
+        config: YoloConfig,
+        services_config: ServicesConfig,
+        portfolio_fetcher: MagicMock,
+        yolo_repo: MagicMock,
+        equity_service: MagicMock,
+        exchange: MagicMock,
+    ) -> None:
+        target_portfolio = pl.DataFrame(
+            {
+                "symbol": ["BTC/USDT"],
+                "price": [50000.0],
+                "target_size_signed": [0.04],
+                "target_value": [2000.0],
+                "arrival_price": [50000.0],
+                "notional_size_signed": [0.0],
+                "delta": [0.04],
+                "delta_value": [2000.0],
+                "updated_at": ["2026-01-05"],
+            }
+        )
+        previous = RunJournalEntry("yolo.binance", "abc", datetime.now(), True, target_portfolio)
+        journal = MagicMock(spec=RunJournalRepository)
+        journal.get_run = AsyncMock(return_value=previous)
+        journal.store_run = AsyncMock()
+        strategy = YoloStrategy(
+            config=config,
+            services_config=services_config,
+            portfolio_fetcher=portfolio_fetcher,
+            yolo_repository=yolo_repo,
+            equity_service=equity_service,
+            run_journal=journal,
+        )
+
+        with (
+            patch.object(YoloStrategy, "_get_exchanges", new_callable=AsyncMock, return_value=[exchange]),
+            patch.object(Exchange, "close", new_callable=AsyncMock),
+            patch.object(strategy._portfolio_sizer, "size_frame") as size_frame,
+            patch.object(
+                strategy._order_builder, "prepare_orders", new_callable=AsyncMock, return_value=MagicMock()
+            ) as prepare,
+        ):
             await strategy.run_strategy()
 
-            # Verify orchestration
-            yolo_repo.get_weights.assert_called()
-            mock_get_exchange.assert_called_once()
-            portfolio_fetcher.fetch_portfolios.assert_called()
-            equity_service.calculate_trading_capital.assert_called()
+        size_frame.assert_not_called()
+        prepare.assert_awaited_once_with(exchange, target_portfolio)
+
+    @pytest.mark.asyncio
+    async def test_run_strategy_captures_replayable_bundle(
+        self,
+        config: YoloConfig,
+        services_config: ServicesConfig,
+        portfolio_fetcher: MagicMock,
+        yolo_repo: MagicMock,
+        equity_service: MagicMock,
+        exchange: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        strategy = YoloStrategy(
+            config=config,
+            services_config=services_config.model_copy(update={"capture_path": tmp_path}),
+            portfolio_fetcher=portfolio_fetcher,
+            yolo_repository=yolo_repo,
+            equity_service=equity_service,
+        )
+
+        with (
+            patch.object(YoloStrategy, "_get_exchanges", new_callable=AsyncMock, return_value=[exchange]),
+            patch.object(Exchange, "close", new_callable=AsyncMock),
+        ):
+            await strategy.run_strategy()
+
+        [path] = (tmp_path / f"{exchange.id}").iterdir()
+        bundle = RunBundle.read(path)
+        assert bundle.equity == 10000.0
+        assert not bundle.orders.is_empty()
+        assert (await replay(bundle)).mismatches(bundle) == []
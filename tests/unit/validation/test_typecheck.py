@@ -0,0 +1,57 @@
+import pytest
+from beartype.roar import BeartypeCallHintParamViolation
+
+from traxon_strats.validation.typecheck import TYPECHECK_ENV, typecheck_mode, typechecked
+
+
+def _define() -> tuple[object, object]:
+    @typechecked
+    def checked(x: int) -> int:
+        return x
+
+    @typechecked(hot=True)
+    async def hot(x: int) -> int:
+        return x
+
+    return checked, hot
+
+
+@pytest.mark.asyncio
+async def test_full_mode_checks_everything(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(TYPECHECK_ENV, raising=False)
+    checked, hot = _define()
+
+    with pytest.raises(BeartypeCallHintParamViolation):
+        checked("1")  # type: ignore[operator]
+    with pytest.raises(BeartypeCallHintParamViolation):
+        await hot("1")  # type: ignore[operator]
+
+
+@pytest.mark.asyncio
+async def test_reduced_mode_skips_hot_paths(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(TYPECHECK_ENV, "reduced")
+    checked, hot = _define()
+
+    with pytest.raises(BeartypeCallHintParamViolation):
+        checked("1")  # type: ignore[operator]
+    assert await hot("1") == "1"  # type: ignore[operator]
+
+
+def test_off_mode_returns_callables_unwrapped(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(TYPECHECK_ENV, "off")
+
+    def plain(x: int) -> int:
+        return x
+
+    class Model:
+        pass
+
+    assert typechecked(plain) is plain
+    assert typechecked(Model) is Model
+
+
+def test_invalid_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(TYPECHECK_ENV, "partial")
+
+    with pytest.raises(ValueError, match=TYPECHECK_ENV):
+        typecheck_mode()
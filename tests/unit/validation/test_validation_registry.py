@@ -0,0 +1,100 @@
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pandera.polars as pa
+import polars as pl
+import pytest
+
+from traxon_strats.validation.schemas import (
+    SAMPLE_ROWS,
+    VALIDATION_LEVEL_ENV,
+    validate,
+    validated_frames,
+    validation_level,
+)
+
+
+class _Schema(pa.DataFrameModel):
+    symbol: pl.String
+    weight: float = pa.Field(ge=0)
+
+
+class _OtherSchema(pa.DataFrameModel):
+    symbol: pl.String
+
+
+@pytest.fixture(autouse=True)
+def _clear_registry() -> Iterator[None]:
+    validated_frames.clear()
+    yield
+    validated_frames.clear()
+
+
+def _frame(n: int = 3) -> pl.DataFrame:
+    return pl.DataFrame({"symbol": [f"S{i}" for i in range(n)], "weight": [float(i) for i in range(n)]})
+
+
+def test_validated_frame_skips_revalidation() -> None:
+    df = validate(_Schema, _frame())
+
+    with patch.object(_Schema, "validate", wraps=_Schema.validate) as spy:
+        assert validate(_Schema, df) is df
+        spy.assert_not_called()
+        # Registered per schema
+        validate(_OtherSchema, df)
+        validate(_OtherSchema, df)
+        spy.assert_not_called()
+
+    # Derived frames are new objects and are validated again
+    with pytest.raises(pa.errors.SchemaError):
+        validate(_Schema, df.with_columns(pl.col("weight") - 10))
+
+
+def test_in_place_changes_invalidate_entry() -> None:
+    df = validate(_Schema, _frame())
+
+    df.columns = ["symbol", "other"]
+
+    assert not validated_frames.is_validated(df, _Schema)
+    with pytest.raises(pa.errors.SchemaError):
+        validate(_Schema, df)
+
+
+def test_entries_dropped_with_frame() -> None:
+    df = validate(_Schema, _frame())
+    assert len(validated_frames) == 1
+
+    del df
+
+    assert len(validated_frames) == 0
+
+
+def test_boundary_level_skips_internal_validation(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(VALIDATION_LEVEL_ENV, "boundary")
+    invalid = _frame().with_columns(pl.col("weight") - 10)
+
+    assert validate(_Schema, invalid) is invalid
+    assert not validated_frames.is_validated(invalid, _Schema)
+    with pytest.raises(pa.errors.SchemaError):
+        validate(_Schema, invalid, boundary=True)
+
+
+def test_sampled_level_checks_a_sample(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(VALIDATION_LEVEL_ENV, "sampled")
+    df = _frame(SAMPLE_ROWS * 3)
+
+    with patch.object(_Schema, "validate", wraps=_Schema.validate) as spy:
+        assert validate(_Schema, df) is df
+        assert spy.call_args.args[0].height == SAMPLE_ROWS
+        validate(_Schema, df, boundary=True)
+        spy.assert_called_once()
+
+    with pytest.raises(pa.errors.SchemaError):
+        validate(_Schema, df.with_columns(pl.col("weight") - 10_000))
+
+
+def test_invalid_level(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(VALIDATION_LEVEL_ENV, "none")
+
+    with pytest.raises(ValueError, match=VALIDATION_LEVEL_ENV):
+        validation_level()
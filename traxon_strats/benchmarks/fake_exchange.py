@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Final, NamedTuple, Protocol
+
+import numpy as np
+import polars as pl
+from traxon_core.config import ExchangeConfig, ExecutorConfig
+from traxon_core.crypto.data_fetchers.portfolio import PortfolioFetcher
+from traxon_core.crypto.exchanges import Exchange
+from traxon_core.crypto.models import (
+    AccountEquity,
+    Balance,
+    DynamicSizeOrderBuilder,
+    ExchangeId,
+    OrderBuilder,
+    OrderSide,
+    OrdersToExecute,
+    Portfolio,
+    Position,
+    PositionSide,
+    SizedOrderBuilder,
+    Symbol,
+)
+from traxon_core.crypto.models.market_info import MarketInfo
+
+from traxon_strats.crypto.services.markets import DECIMAL_PLACES, MarketsIndex
+from traxon_strats.robotwealth.yolo.fills import ExecutedOrder, ExecutionReport
+
+_ZERO: Final[float] = 1e-12
+
+
+class Latency(NamedTuple):
+    """Round trip of a venue API call, drawn uniformly from `mean ± jitter`."""
+
+    mean_seconds: float = 0.0
+    jitter_seconds: float = 0.0
+    # Requests in flight at once, as allowed by the venue's rate limits
+    max_concurrent_requests: int = 20
+
+
+LATENCY_PROFILES: Final[dict[str, Latency]] = {
+    "none": Latency(),
+    "colocated": Latency(0.002, 0.001),
+    "regional": Latency(0.025, 0.010),
+    "remote": Latency(0.120, 0.040, 10),
+}
+
+
+class FillModel(NamedTuple):
+    """How the fake venue fills orders. Each probability applies to every order independently."""
+
+    # Orders cancelled after filling a fraction (drawn from `partial_fill_range`) of their size
+    partial_fill_probability: float = 0.0
+    partial_fill_range: tuple[float, float] = (0.2, 0.9)
+    # Orders rejected without any fill
+    reject_probability: float = 0.0
+    # Orders that fill but are still reported open, leaving their fill to the next portfolio fetch
+    unreported_probability: float = 0.0
+    # Average fill price deviation against the order, in basis points
+    slippage_bps: float = 1.0
+
+
+class FakeVenue:
+    """
+    In-process stand-in for an exchange, with simulated latency, rate limits and fills.
+
+    Provides the seams `YoloStrategy` creates its exchanges, portfolio fetches and order executors
+    through: `create_exchanges`, `portfolio_fetcher()` and `order_executor`. Every session shares
+    the venue's positions, so that a run sees its own fills when it validates. Sizes are in base
+    currency on every market, contract sizes are not simulated.
+    """
+
+    def __init__(
+        self,
+        markets: MarketsIndex,
+        prices: pl.DataFrame,
+        current_portfolio: pl.DataFrame,
+        equity: float,
+        latency: Latency = Latency(),
+        fills: FillModel = FillModel(),
+        seed: int = 0,
+    ) -> None:
+        self.latency: Final[Latency] = latency
+        self.fills: Final[FillModel] = fills
+        self.equity: Final[float] = equity
+        self._markets: Final[dict[Symbol, MarketInfo]] = dict(
+            markets.at(i) for i in range(markets.frame.height)
+        )
+        # Prices by `BASE/QUOTE`, from `prices` (`symbol`, `price`) and the portfolio
+        self._prices: Final[dict[str, float]] = dict(
+            pl.concat([prices.select("symbol", "price"), current_portfolio.select("symbol", "price")])
+            .unique("symbol", keep="first")
+            .iter_rows()
+        )
+        # Signed sizes by market symbol: spot balances for longs, perp positions for shorts
+        self._positions: Final[dict[str, float]] = defaultdict(float)
+        for symbol, size in current_portfolio.select("symbol", "notional_size_signed").iter_rows():
+            self._positions[symbol if size > 0 else f"{symbol}:{Symbol(symbol).quote}"] += size
+        self._rng: Final[np.random.Generator] = np.random.default_rng(seed)
+        # Request slots of the event loop the venue is used from
+        self._requests: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+        self.api_calls = 0
+        self.orders = 0
+
+    async def create_exchanges(self, demo: bool, configs: list[ExchangeConfig]) -> list[Exchange]:
+        """Connect one session per config, loading the markets like `ExchangeFactory.from_config`."""
+        exchanges: list[Exchange] = []
+        for config in configs:
+            await self.call()
+            exchanges.append(FakeExchange(self, ExchangeId(config.exchange_id)))
+        return exchanges
+
+    def portfolio_fetcher(self) -> PortfolioFetcher:
+        return FakePortfolioFetcher(self)
+
+    def order_executor(self, config: ExecutorConfig) -> FakeOrderExecutor:
+        return FakeOrderExecutor(self)
+
+    @property
+    def markets(self) -> dict[Symbol, MarketInfo]:
+        return self._markets
+
+    async def call(self) -> None:
+        """Simulate one API round trip, waiting for a free request slot first."""
+        loop = asyncio.get_running_loop()
+        if self._requests is None or self._requests[0] is not loop:
+            self._requests = loop, asyncio.Semaphore(self.latency.max_concurrent_requests)
+        self.api_calls += 1
+        async with self._requests[1]:
+            mean, jitter, _ = self.latency
+            delay = mean + jitter * (2 * self._rng.random() - 1) if jitter else mean
+            await asyncio.sleep(max(0.0, delay))
+
+    def portfolio(self, exchange_id: ExchangeId) -> Portfolio:
+        balances: list[Balance] = []
+        perps: list[Position] = []
+        for market, size in self._positions.items():
+            if abs(size) < _ZERO:
+                continue
+            symbol = Symbol(market)
+            price = self._prices[symbol.base_quote]
+            if ":" not in market:
+                balances.append(
+                    Balance(
+                        symbol=symbol,
+                        size=_decimal(size),
+                        current_price=_decimal(price),
+                        notional_size=_decimal(size),
+                    )
+                )
+            else:
+                perps.append(
+                    Position(
+                        symbol=symbol,
+                        side=PositionSide.LONG if size > 0 else PositionSide.SHORT,
+                        size=_decimal(abs(size)),
+                        current_price=_decimal(price),
+                        notional_size=_decimal(abs(size)),
+                    )
+                )
+        return Portfolio(exchange_id=exchange_id, balances=balances, perps=perps)
+
+    async def execute(self, orders: OrdersToExecute) -> ExecutionReport:
+        """
+        Execute position updates, then new positions. Symbols trade concurrently, the orders of a
+        symbol one after the other. Returns ccxt orders, with perp amounts in contracts.
+        """
+        report: ExecutionReport = []
+        for bucket in (orders.updates, orders.new):
+            symbols = await asyncio.gather(*(self._execute_symbol(o) for o in bucket.values()))
+            report += [order for executed in symbols for order in executed]
+        return report
+
+    async def _execute_symbol(self, orders: list[OrderBuilder]) -> list[ExecutedOrder]:
+        return [await self._execute_order(order) for order in orders]
+
+    async def _execute_order(self, order: OrderBuilder) -> ExecutedOrder:
+        await self.call()
+        self.orders += 1
+        market = str(order.market.symbol)
+        price = self._prices[Symbol(market).base_quote]
+        sign = 1.0 if order.side == OrderSide.BUY else -1.0
+        # Close legs carry signed sizes, the side gives the direction
+        if isinstance(order, SizedOrderBuilder):
+            amount = abs(float(order.size))
+        elif isinstance(order, DynamicSizeOrderBuilder):
+            amount = float(order.value) / price
+        else:
+            raise TypeError(f"unsupported order builder {type(order).__name__}")
+
+        fills, draw = self.fills, self._rng.random()
+        if draw < fills.reject_probability:
+            filled, status = 0.0, "rejected"
+        elif draw < fills.reject_probability + fills.partial_fill_probability:
+            filled, status = amount * self._rng.uniform(*fills.partial_fill_range), "canceled"
+        else:
+            filled, status = amount, "closed"
+        self._positions[market] += sign * filled
+        # The executor polls the order until it is done
+        await self.call()
+
+        if self._rng.random() < fills.unreported_probability:
+            return {"symbol": market, "side": order.side.value, "filled": None, "status": "open"}
+        # Positions are held in base currency, perp orders are reported in contracts
+        contract_size = float(order.market.contract_size or 1) if ":" in market else 1.0
+        return {
+            "symbol": market,
+            "side": order.side.value,
+            "filled": filled / contract_size,
+            "status": status,
+            "average": price * (1 + sign * fills.slippage_bps / 10_000) if filled else None,
+        }
+
+
+class _VenueApi(Protocol):
+    """The part of the exchange client API the strategy uses."""
+
+    markets: dict[Symbol, MarketInfo]
+    precisionMode: int
+
+    async def load_markets(self, reload: bool = False) -> dict[Symbol, MarketInfo]: ...
+
+    async def close(self) -> None: ...
+
+
+class _FakeApi:
+    """`_VenueApi` over the markets of a `FakeVenue`."""
+
+    __slots__ = ("markets", "precisionMode")
+
+    def __init__(self, markets: dict[Symbol, MarketInfo]) -> None:
+        self.markets: dict[Symbol, MarketInfo] = markets
+        self.precisionMode: int = DECIMAL_PLACES
+
+    async def load_markets(self, reload: bool = False) -> dict[Symbol, MarketInfo]:
+        return self.markets
+
+    async def close(self) -> None:
+        return None
+
+
+class FakeExchange(Exchange):
+    """A session on a `FakeVenue`."""
+
+    def __init__(self, venue: FakeVenue, exchange_id: ExchangeId) -> None:
+        # The venue stands in for the exchange client: the base initializer, which connects one,
+        # is not called, and the client attributes are set from the `_VenueApi` it implements
+        api: _VenueApi = _FakeApi(venue.markets)
+        self.id = exchange_id
+        self.api: Any = api
+        self._venue: Final[FakeVenue] = venue
+
+    async def fetch_account_equity(self) -> AccountEquity:
+        await self._venue.call()
+        equity = _decimal(self._venue.equity)
+        return AccountEquity(
+            total_equity=equity,
+            perps_equity=equity,
+            spot_equity=Decimal("0"),
+            available_balance=equity,
+            maintenance_margin=Decimal("0"),
+            maintenance_margin_pct=Decimal("0"),
+        )
+
+
+class FakePortfolioFetcher(PortfolioFetcher):
+    """Fetches portfolios from a `FakeVenue`, balances and positions in one round trip."""
+
+    def __init__(self, venue: FakeVenue) -> None:
+        # No price fetcher: the venue prices its own portfolio
+        self._venue: Final[FakeVenue] = venue
+
+    async def fetch_portfolios(self, exchanges: list[Exchange]) -> list[Portfolio]:
+        await self._venue.call()
+        return [self._venue.portfolio(e.id) for e in exchanges]
+
+
+class FakeOrderExecutor:
+    """Executes orders on a `FakeVenue`, in place of `DefaultOrderExecutor`."""
+
+    def __init__(self, venue: FakeVenue) -> None:
+        self._venue: Final[FakeVenue] = venue
+
+    async def execute_orders(self, exchanges: list[Exchange], orders: OrdersToExecute) -> ExecutionReport:
+        return await self._venue.execute(orders)
+
+
+def _decimal(value: float) -> Decimal:
+    return Decimal(repr(round(value, 12)))
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import tempfile
+import time
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Final, NamedTuple
+
+import polars as pl
+from traxon_core.config import DiskConfig, DuckDBConfig, ExchangeConfig
+from traxon_core.logs.structlog import logger
+
+from traxon_strats.benchmarks.fake_exchange import LATENCY_PROFILES, FakeVenue, FillModel
+from traxon_strats.benchmarks.synthetic import SyntheticUniverse, benchmark_settings, synthetic_universe
+from traxon_strats.crypto.services.equity import EquityService
+from traxon_strats.observability.memory import configure_memory_profiling
+from traxon_strats.observability.tracing import LogSpanExporter, Span, tracer
+from traxon_strats.robotwealth.yolo.config import ServicesConfig, TemporalConfig, YoloConfig
+from traxon_strats.robotwealth.yolo.pipeline import RobotWealthSignalStep
+from traxon_strats.robotwealth.yolo.replay import InMemoryYoloRepository
+from traxon_strats.robotwealth.yolo.strategy import YoloStrategy
+from traxon_strats.validation.schemas import validated_frames
+
+RUNS_VERSION: Final[int] = 1
+DEFAULT_SIZES: Final[tuple[int, ...]] = (100, 1_000, 10_000)
+DEFAULT_PROFILES: Final[tuple[str, ...]] = ("none", "colocated", "regional")
+# Spans reported as the phases of a run
+PHASES: Final[tuple[str, ...]] = (
+    "yolo.exchanges",
+    "yolo.venue.setup",
+    "yolo.pipeline",
+    "yolo.execute",
+    "yolo.validate",
+)
+# Fill behaviours a run can be benchmarked under
+FILL_MODELS: Final[dict[str, FillModel]] = {
+    "full": FillModel(),
+    "partial": FillModel(partial_fill_probability=0.2, reject_probability=0.02),
+    "unreported": FillModel(partial_fill_probability=0.1, unreported_probability=0.1),
+}
+
+_logger = logger.bind(component="benchmarks")
+
+
+class RunMeasurement(NamedTuple):
+    symbols: int
+    latency: str
+    fills: str
+    validation_mode: str
+    # Best wall time of a full `run_strategy` over the repeats
+    seconds: float
+    # Wall time of each phase in the best run
+    phases: dict[str, float]
+    orders: int
+    api_calls: int
+
+
+class _MemoryAccountsRepository:
+    """`AccountsRepository` keeping equities in memory."""
+
+    def __init__(self) -> None:
+        self._equities: dict[str, list[float]] = defaultdict(list)
+
+    async def init_tables(self) -> None:
+        return None
+
+    async def store_equity(self, name: str, equity: float) -> None:
+        self._equities[name].append(equity)
+
+    async def get_latest_equity(self, name: str) -> float | None:
+        history = self._equities.get(name)
+        return history[-1] if history else None
+
+    async def get_equity_history(self, name: str) -> pl.DataFrame:
+        return pl.DataFrame({"equity": self._equities.get(name, [])}, schema={"equity": pl.Float64})
+
+
+class _PhaseExporter:
+    """Sum the durations of the phase spans of a run."""
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = defaultdict(float)
+
+    def export(self, span: Span) -> None:
+        if span.name in PHASES:
+            self.seconds[span.name] += span.duration_ms / 1000
+
+
+def _config(validation_mode: str) -> YoloConfig:
+    return YoloConfig(
+        settings=benchmark_settings(dry_run=False, validation_mode=validation_mode),
+        exchanges=[
+            ExchangeConfig(
+                exchange_id="binance",
+                spot_quote_symbol="USDT",
+                leverage=1,
+                spot=True,
+                perp=True,
+                credentials={"apiKey": "fake", "secret": "fake"},
+            )
+        ],
+    )
+
+
+def _services_config() -> ServicesConfig:
+    # Nothing is stored or cached: there is no run journal, market cache or database
+    return ServicesConfig(
+        temporal=TemporalConfig(host="localhost", port=7233, namespace="default", task_queue="yolo"),
+        robot_wealth_api_key="fake",
+        database=DuckDBConfig(path=":memory:"),
+        cache=DiskConfig(path=tempfile.gettempdir()),
+    )
+
+
+async def _run_once(
+    universe: SyntheticUniverse, venue: FakeVenue, config: YoloConfig
+) -> tuple[float, dict[str, float]]:
+    repository = InMemoryYoloRepository(universe.weights, universe.volatilities)
+    strategy = YoloStrategy(
+        config=config,
+        services_config=_services_config(),
+        portfolio_fetcher=venue.portfolio_fetcher(),
+        yolo_repository=repository,
+        equity_service=EquityService(_MemoryAccountsRepository()),
+        pipeline=[RobotWealthSignalStep(config.settings, repository, universe.run_date)],
+        create_exchanges=venue.create_exchanges,
+        order_executor=venue.order_executor,
+    )
+    phases = _PhaseExporter()
+    tracer.configure([phases])
+    validated_frames.clear()
+    start = time.perf_counter()
+    await strategy.run_strategy()
+    return time.perf_counter() - start, dict(phases.seconds)
+
+
+def benchmark_run(
+    size: int,
+    latency: str = "none",
+    fills: str = "full",
+    validation_mode: str = "incremental",
+    seed: int = 0,
+    repeats: int = 3,
+) -> RunMeasurement:
+    """
+    Time full runs of the strategy, from the exchange setup to the post-trade validation, against
+    a fake venue holding the synthetic portfolio. Every repeat starts from the same venue state.
+    """
+    universe = synthetic_universe(size, seed)
+    config = _config(validation_mode)
+    prices = universe.weights.select("symbol", price="arrival_price")
+    best: tuple[float, dict[str, float], FakeVenue] | None = None
+    try:
+        for _ in range(repeats):
+            venue = FakeVenue(
+                universe.markets,
+                prices,
+                universe.current_portfolio,
+                universe.equity,
+                LATENCY_PROFILES[latency],
+                FILL_MODELS[fills],
+                seed,
+            )
+            seconds, phases = asyncio.run(_run_once(universe, venue, config))
+            if best is None or seconds < best[0]:
+                best = seconds, phases, venue
+    finally:
+        tracer.configure([LogSpanExporter()])
+    assert best is not None
+    seconds, phases, venue = best
+    return RunMeasurement(
+        size, latency, fills, validation_mode, seconds, phases, venue.orders, venue.api_calls
+    )
+
+
+def run_suite(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    latencies: Sequence[str] = DEFAULT_PROFILES,
+    fills: Sequence[str] = ("full",),
+    validation_modes: Sequence[str] = ("incremental",),
+    repeats: int = 3,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Benchmark runs over every combination of the given parameters."""
+    measurements: list[RunMeasurement] = []
+    for size in sizes:
+        for latency in latencies:
+            for fill in fills:
+                for mode in validation_modes:
+                    measurements.append(benchmark_run(size, latency, fill, mode, seed, repeats))
+                    _logger.info(
+                        f"benchmarked runs of {size} symbols, {latency} latency, {fill} fills, {mode}"
+                    )
+    return {
+        "version": RUNS_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "machine": {"python": platform.python_version(), "polars": pl.__version__, "host": platform.node()},
+        "seed": seed,
+        "repeats": repeats,
+        "results": [m._asdict() for m in measurements],
+    }
+
+
+def _format(results: list[dict[str, Any]]) -> str:
+    phases = [p.removeprefix("yolo.") for p in PHASES]
+    header = (
+        f"{'symbols':>8} {'latency':<10}{'fills':<11}{'validation':<12}{'ms':>9}{'orders':>8}{'calls':>7}"
+    )
+    lines = [header + "".join(f"{p:>12}" for p in phases)]
+    for r in results:
+        line = (
+            f"{r['symbols']:>8} {r['latency']:<10}{r['fills']:<11}{r['validation_mode']:<12}"
+            f"{r['seconds'] * 1000:>9.1f}{r['orders']:>8}{r['api_calls']:>7}"
+        )
+        lines.append(line + "".join(f"{r['phases'].get(p, 0.0) * 1000:>12.1f}" for p in PHASES))
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Benchmark full strategy runs against a fake venue."""
+    parser = argparse.ArgumentParser(description="Benchmark YOLO runs end to end against a fake exchange.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--latency", nargs="+", choices=LATENCY_PROFILES, default=list(DEFAULT_PROFILES))
+    parser.add_argument("--fills", nargs="+", choices=FILL_MODELS, default=["full"])
+    parser.add_argument("--validation", nargs="+", choices=("full", "incremental"), default=["incremental"])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="JSON file to write the results to")
+    parser.add_argument(
+        "--memory-profile", type=Path, help="directory to write memory profiles of the runs to"
+    )
+    args = parser.parse_args(argv)
+    configure_memory_profiling(args.memory_profile)
+
+    results = run_suite(args.sizes, args.latency, args.fills, args.validation, args.repeats, args.seed)
+    print(_format(results["results"]))
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import multiprocessing
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Final, NamedTuple
+
+import polars as pl
+from traxon_core.logs.structlog import logger
+
+from traxon_strats.benchmarks.synthetic import SyntheticUniverse, benchmark_settings, synthetic_universe
+from traxon_strats.observability.tracing import LogSpanExporter, tracer
+from traxon_strats.robotwealth.yolo.config import YoloSettingsConfig
+from traxon_strats.robotwealth.yolo.order_builder import OrderPlan, YoloOrderBuilder
+from traxon_strats.robotwealth.yolo.pipeline import RobotWealthSignalStep
+from traxon_strats.robotwealth.yolo.portfolio_sizer import YoloPortfolioSizer
+from traxon_strats.robotwealth.yolo.replay import InMemoryYoloRepository
+from traxon_strats.validation.schemas import validated_frames
+
+BASELINE_VERSION: Final[int] = 1
+DEFAULT_SIZES: Final[tuple[int, ...]] = (10, 100, 1_000, 10_000, 50_000)
+STAGES: Final[tuple[str, ...]] = ("signal", "sizing", "order_planning")
+# Relative slowdown (or memory growth) above which a measurement is a regression
+DEFAULT_TOLERANCE: Final[float] = 0.25
+# Differences below these are noise, whatever their ratio
+_MIN_SECONDS: Final[float] = 0.002
+_MIN_MIB: Final[float] = 1.0
+_MIB: Final[int] = 1024 * 1024
+_METRICS: Final[dict[str, float]] = {
+    "seconds": _MIN_SECONDS,
+    "peak_rss_mib": _MIN_MIB,
+    "python_peak_mib": _MIN_MIB,
+}
+
+_logger = logger.bind(component="benchmarks")
+
+
+class StageMeasurement(NamedTuple):
+    stage: str
+    symbols: int
+    # Best wall time over the repeats
+    seconds: float
+    # Growth of the RSS high-water mark during one run in a fresh process (Linux only), which
+    # unlike the Python heap covers the Arrow buffers
+    peak_rss_mib: float | None
+    # Peak of the Python heap during one run, as traced by `tracemalloc`
+    python_peak_mib: float
+
+
+class Regression(NamedTuple):
+    stage: str
+    symbols: int
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        change = (self.current / self.baseline - 1) * 100 if self.baseline else float("inf")
+        return (
+            f"{self.stage} @ {self.symbols} symbols: {self.metric} "
+            f"{self.baseline:.4g} -> {self.current:.4g} (+{change:.0f}%)"
+        )
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the RSS high-water mark of the process (Linux only)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _rss_bytes(field: str) -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1]) * 1024
+    raise ValueError(f"{field} not found in /proc/self/status")
+
+
+class _Stages:
+    """The compute stages of a venue run, each taking the output of the previous one."""
+
+    def __init__(self, universe: SyntheticUniverse, settings: YoloSettingsConfig) -> None:
+        self.universe: Final[SyntheticUniverse] = universe
+        self._settings: Final[YoloSettingsConfig] = settings
+        self._repository: Final[InMemoryYoloRepository] = InMemoryYoloRepository(
+            universe.weights, universe.volatilities
+        )
+        self._sizer: Final[YoloPortfolioSizer] = YoloPortfolioSizer()
+        self._order_builder: Final[YoloOrderBuilder] = YoloOrderBuilder(
+            min_order_value=settings.min_order_value
+        )
+        self._runner: Final[asyncio.Runner] = asyncio.Runner()
+
+    def signal(self) -> pl.DataFrame:
+        return self._runner.run(self._signal())
+
+    def sizing(self, target_weights: pl.DataFrame) -> pl.DataFrame:
+        return self._sizer.size_frame(
+            self.universe.equity, target_weights, self.universe.current_portfolio, self._settings
+        )
+
+    def order_planning(self, target_portfolio: pl.DataFrame) -> OrderPlan:
+        return self._order_builder.plan_orders(target_portfolio, self.universe.markets)
+
+    def close(self) -> None:
+        self._runner.close()
+
+    async def _signal(self) -> pl.DataFrame:
+        step = RobotWealthSignalStep(self._settings, self._repository, self.universe.run_date)
+        await step.setup()
+        return await step.run(pl.DataFrame())
+
+
+def _stage_run(stages: _Stages, stage: str) -> Callable[[], object]:
+    """A callable running `stage`, given the outputs of the stages before it."""
+    if stage == "signal":
+        return stages.signal
+    target_weights = stages.signal()
+    if stage == "sizing":
+        return lambda: stages.sizing(target_weights)
+    target_portfolio = stages.sizing(target_weights)
+    return lambda: stages.order_planning(target_portfolio)
+
+
+def _peak_rss_mib(stage: str, size: int, seed: int) -> float | None:
+    """
+    Growth of the RSS high-water mark while `stage` runs, in a fresh process: in a warm one, the
+    allocators reuse the memory freed by earlier runs and hide the stage's own peak. Linux only.
+    """
+    tracer.configure([])
+    stages = _Stages(synthetic_universe(size, seed), benchmark_settings())
+    try:
+        run = _stage_run(stages, stage)
+        validated_frames.clear()
+        gc.collect()
+        if not _reset_peak_rss():
+            return None
+        rss = _rss_bytes("VmRSS")
+        run()
+        return (_rss_bytes("VmHWM") - rss) / _MIB
+    finally:
+        stages.close()
+
+
+def _measure(stages: _Stages, stage: str, seed: int, repeats: int) -> StageMeasurement:
+    """
+    Time `stage` (best of `repeats`), then trace one more run for the Python heap peak and measure
+    the RSS peak in a fresh process, one after the other so that they do not skew the timings.
+    Validation results are cleared before each run, as every production run validates fresh frames.
+    """
+    size = stages.universe.weights.height
+    run = _stage_run(stages, stage)
+    seconds = float("inf")
+    for _ in range(repeats):
+        validated_frames.clear()
+        start = time.perf_counter()
+        run()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    validated_frames.clear()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        python_peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        peak_rss = pool.submit(_peak_rss_mib, stage, size, seed).result()
+    return StageMeasurement(stage, size, seconds, peak_rss, python_peak / _MIB)
+
+
+def benchmark_universe(size: int, seed: int = 0, repeats: int = 5) -> list[StageMeasurement]:
+    """Measure the signal pipeline, the sizer and the order planner on a synthetic universe."""
+    stages = _Stages(synthetic_universe(size, seed), benchmark_settings())
+    try:
+        return [_measure(stages, stage, seed, repeats) for stage in STAGES]
+    finally:
+        stages.close()
+
+
+def run_suite(sizes: Sequence[int] = DEFAULT_SIZES, repeats: int = 5, seed: int = 0) -> dict[str, Any]:
+    """Run the stage benchmarks at every universe size and return the baseline document."""
+    measurements: list[StageMeasurement] = []
+    # Spans are not exported while measuring, their logging would dominate the small sizes
+    tracer.configure([])
+    try:
+        for size in sizes:
+            measurements += benchmark_universe(size, seed, repeats)
+            _logger.info(f"benchmarked {size} symbols")
+    finally:
+        tracer.configure([LogSpanExporter()])
+    return {
+        "version": BASELINE_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "machine": {"python": platform.python_version(), "polars": pl.__version__, "host": platform.node()},
+        "seed": seed,
+        "repeats": repeats,
+        "results": [m._asdict() for m in measurements],
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float = DEFAULT_TOLERANCE
+) -> list[Regression]:
+    """Measurements of `current` that are worse than `baseline` by more than `tolerance`."""
+    for document in (baseline, current):
+        if document.get("version") != BASELINE_VERSION:
+            raise ValueError(f"unsupported benchmark version {document.get('version')}")
+    previous = {(r["stage"], r["symbols"]): r for r in baseline["results"]}
+    regressions: list[Regression] = []
+    for result in current["results"]:
+        before = previous.get((result["stage"], result["symbols"]))
+        if before is None:
+            continue
+        for metric, noise in _METRICS.items():
+            old, new = before.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + tolerance) and new - old > noise:
+                regressions.append(Regression(result["stage"], result["symbols"], metric, old, new))
+    return regressions
+
+
+def _format(results: list[dict[str, Any]]) -> str:
+    lines = [f"{'stage':<16}{'symbols':>9}{'ms':>11}{'rss MiB':>10}{'py MiB':>9}"]
+    for r in results:
+        rss = "-" if r["peak_rss_mib"] is None else f"{r['peak_rss_mib']:.1f}"
+        lines.append(
+            f"{r['stage']:<16}{r['symbols']:>9}{r['seconds'] * 1000:>11.2f}{rss:>10}{r['python_peak_mib']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks into a JSON baseline, or compare two baselines and flag regressions."""
+    parser = argparse.ArgumentParser(description="Benchmark the YOLO compute stages on synthetic data.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="run the benchmarks and write the results")
+    run.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    run.add_argument("--repeats", type=int, default=5)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--output", type=Path, help="JSON file to write the results to")
+    run.add_argument("--baseline", type=Path, help="baseline to compare the results against")
+    run.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    cmp = commands.add_parser("compare", help="compare two result files")
+    cmp.add_argument("baseline", type=Path)
+    cmp.add_argument("current", type=Path)
+    cmp.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        current = run_suite(args.sizes, args.repeats, args.seed)
+        print(_format(current["results"]))
+        if args.output is not None:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(json.dumps(current, indent=2))
+        if args.baseline is None:
+            return 0
+        baseline = json.loads(args.baseline.read_text())
+    else:
+        baseline = json.loads(args.baseline.read_text())
+        current = json.loads(args.current.read_text())
+
+    regressions = compare(baseline, current, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print(f"no regressions above {args.tolerance:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Final, NamedTuple
+
+import numpy as np
+import polars as pl
+from traxon_core import dates
+from traxon_core.config import ExecutorConfig
+from traxon_core.crypto.models import Symbol
+from traxon_core.crypto.models.market_info import MarketInfo
+
+from traxon_strats.crypto.services.markets import MarketsIndex
+from traxon_strats.robotwealth.yolo.config import YoloSettingsConfig
+
+QUOTE: Final[str] = "USDT"
+# Contract sizes and amount precisions (decimal places) seen on perp venues
+_CONTRACT_SIZES: Final[tuple[str, ...]] = ("1", "1", "1", "1", "10", "100", "0.001", "0.01")
+_PRECISIONS: Final[tuple[int, ...]] = (0, 1, 1, 2, 2, 3, 3, 4)
+
+
+class SyntheticUniverse(NamedTuple):
+    """
+    Inputs of a YOLO venue run over `n` synthetic symbols, shaped like production data.
+
+    `weights` and `volatilities` follow the RobotWealth API schemas, `current_portfolio` is built
+    like `YoloPortfolioSizer.portfolio_frame` and `markets` lists a spot and a perp market per symbol.
+    """
+
+    run_date: date
+    equity: float
+    weights: pl.DataFrame
+    volatilities: pl.DataFrame
+    current_portfolio: pl.DataFrame
+    markets: MarketsIndex
+
+
+def benchmark_settings(**overrides: object) -> YoloSettingsConfig:
+    """Strategy settings used by the benchmarks, close to the production ones."""
+    settings: dict[str, object] = {
+        "dry_run": True,
+        "demo": True,
+        "max_leverage": 2.0,
+        "equity_buffer": 0.1,
+        "trade_buffer": 0.05,
+        "momentum_factor": 1.0,
+        "trend_factor": 1.0,
+        "carry_factor": 1.0,
+        "executor": ExecutorConfig(execution="fast", max_spread_pct=0.01),
+        "min_order_value": 5.0,
+    }
+    return YoloSettingsConfig.model_validate(settings | overrides)
+
+
+def synthetic_universe(
+    n: int,
+    seed: int = 0,
+    run_date: date = date(2026, 1, 5),
+    equity: float = 100_000.0,
+    signal_symbols: int = 250,
+    held_fraction: float = 0.05,
+    missing_market_fraction: float = 0.01,
+    inactive_market_fraction: float = 0.01,
+) -> SyntheticUniverse:
+    """
+    Generate a reproducible universe of `n` symbols.
+
+    Prices are log-normal around a few dollars and volatilities are annualised. Like RobotWealth's
+    ranking, only `signal_symbols` symbols have non-zero megafactors; most of them are held, as are
+    `held_fraction` of the others (positions to close) and a few symbols no longer in the universe.
+    Some perp markets are missing or inactive.
+    """
+    if n < 1:
+        raise ValueError(f"a universe needs at least one symbol, got {n}")
+    rng = np.random.default_rng(seed)
+    symbols = [f"S{i:05d}/{QUOTE}" for i in range(n)]
+    prices = np.round(np.exp(rng.normal(1.0, 2.5, n)), 6) + 1e-6
+    updated_at = run_date.strftime(dates.date_format)
+
+    has_signal = np.zeros(n, dtype=bool)
+    has_signal[rng.choice(n, min(n, signal_symbols), replace=False)] = True
+    factors = np.where(has_signal, np.clip(rng.normal(0.0, 0.4, (3, n)), -1.0, 1.0), 0.0).round(4)
+    weights = pl.DataFrame(
+        {
+            "symbol": symbols,
+            "updated_at": [updated_at] * n,
+            "momentum_megafactor": factors[0],
+            "trend_megafactor": factors[1],
+            "carry_megafactor": factors[2],
+            "combo_weight": factors.mean(axis=0).round(4),
+            "arrival_price": prices,
+        }
+    )
+    volatilities = pl.DataFrame(
+        {
+            "symbol": symbols,
+            "updated_at": [updated_at] * n,
+            "ewvol": rng.lognormal(np.log(0.8), 0.35, n).round(4),
+        }
+    )
+
+    held = rng.random(n) < np.where(has_signal, 0.8, held_fraction)
+    stale = max(1, n // 100)
+    held_symbols = [s for s, h in zip(symbols, held, strict=True) if h] + [
+        f"X{i:05d}/{QUOTE}" for i in range(stale)
+    ]
+    held_prices = np.concatenate([prices[held], np.exp(rng.normal(1.0, 2.5, stale))])
+    sizes = rng.lognormal(0.0, 1.0, len(held_symbols)) * equity / 1_000 / held_prices
+    signs = np.where(rng.random(len(held_symbols)) < 0.7, 1.0, -1.0)
+    current_portfolio = pl.DataFrame(
+        {
+            "symbol": held_symbols,
+            "notional_size_signed": sizes * signs,
+            "size": sizes,
+            "price": held_prices * rng.normal(1.0, 0.01, len(held_symbols)),
+            "side": ["long" if s > 0 else "short" for s in signs],
+        }
+    )
+
+    return SyntheticUniverse(
+        run_date=run_date,
+        equity=equity,
+        weights=weights,
+        volatilities=volatilities,
+        current_portfolio=current_portfolio,
+        markets=_markets(rng, symbols, missing_market_fraction, inactive_market_fraction),
+    )
+
+
+def _markets(
+    rng: np.random.Generator, symbols: list[str], missing_fraction: float, inactive_fraction: float
+) -> MarketsIndex:
+    markets: dict[Symbol, MarketInfo] = {}
+    for symbol in symbols:
+        for market_symbol, market_type in ((symbol, "spot"), (f"{symbol}:{QUOTE}", "swap")):
+            if market_type == "swap" and rng.random() < missing_fraction:
+                continue
+            markets[Symbol(market_symbol)] = MarketInfo(
+                symbol=Symbol(market_symbol),
+                type=market_type,
+                active=bool(rng.random() >= inactive_fraction),
+                precision_amount=_PRECISIONS[int(rng.integers(len(_PRECISIONS)))],
+                precision_price=4,
+                contract_size=Decimal(_CONTRACT_SIZES[rng.integers(len(_CONTRACT_SIZES))])
+                if market_type == "swap"
+                else Decimal("1"),
+            )
+    return MarketsIndex.from_markets(markets)
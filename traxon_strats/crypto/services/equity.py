@@ -1,20 +1,20 @@
 from __future__ import annotations
 
-from beartype import beartype
 from traxon_core.logs.structlog import logger
 
 from traxon_strats.persistence.repositories.interfaces import AccountsRepository
+from traxon_strats.validation.typecheck import typechecked
 
 
 class EquityService:
     """Service for managing account equity and trading capital smoothing."""
 
-    @beartype
+    @typechecked
     def __init__(self, repository: AccountsRepository) -> None:
         self._repository = repository
         self._logger = logger.bind(component="EquityService")
 
-    @beartype
+    @typechecked(hot=True)
     async def calculate_trading_capital(
         self,
         account: str,
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from typing import Final
+
+from traxon_core.config import ExchangeConfig
+from traxon_core.crypto.exchanges import Exchange, ExchangeFactory
+from traxon_core.logs.structlog import logger
+
+from traxon_strats.validation.typecheck import typechecked
+
+HealthCheck = Callable[[Exchange], Awaitable[bool]]
+# Creates one connected exchange per config, given the demo flag (`ExchangeFactory.from_config`)
+CreateExchanges = Callable[[bool, list[ExchangeConfig]], Awaitable[list[Exchange]]]
+_SessionKey = tuple[bool, str]
+
+
+async def markets_loaded(exchange: Exchange) -> bool:
+    """Default health check: a usable session has its markets loaded."""
+    return bool(exchange.api.markets)
+
+
+class _Session:
+    __slots__ = ("created_at", "exchange")
+
+    def __init__(self, exchange: Exchange) -> None:
+        self.exchange: Final[Exchange] = exchange
+        self.created_at: Final[datetime] = datetime.now()
+
+    def expired(self, max_age: timedelta) -> bool:
+        return datetime.now() - self.created_at > max_age
+
+
+class ExchangePool:
+    """
+    Worker-scoped pool of exchange sessions, kept warm across strategy runs.
+
+    Sessions are keyed by demo flag and exchange config. An idle session is reused if it is
+    younger than `max_age` and passes `health_check`; otherwise it is closed and replaced.
+    Sessions released after an error are closed instead of being returned to the pool.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        max_age: timedelta = timedelta(hours=6),
+        health_check: HealthCheck = markets_loaded,
+        create_exchanges: CreateExchanges | None = None,
+    ) -> None:
+        self._max_age: Final[timedelta] = max_age
+        self._health_check: Final[HealthCheck] = health_check
+        self._create_exchanges: Final[CreateExchanges | None] = create_exchanges
+        self._idle: dict[_SessionKey, list[_Session]] = defaultdict(list)
+        self._in_use: dict[int, tuple[_SessionKey, _Session]] = {}
+        self._lock = asyncio.Lock()
+        self._logger = logger.bind(component=self.__class__.__name__)
+
+    @typechecked(hot=True)
+    async def acquire(self, demo: bool, configs: list[ExchangeConfig]) -> list[Exchange]:
+        """
+        Return one exchange per config, reusing warm sessions when possible.
+
+        The lock is only held to move sessions in and out of the pool: health checks and the
+        creation of new sessions, which loads their markets, run concurrently across callers.
+        """
+        keys = [self._key(demo, c) for c in configs]
+        sessions: list[_Session | None] = [await self._take_idle(key) for key in keys]
+
+        missing = [i for i, session in enumerate(sessions) if session is None]
+        if missing:
+            create = self._create_exchanges or ExchangeFactory.from_config
+            try:
+                created = await create(demo, [configs[i] for i in missing])
+            except BaseException:
+                # The idle sessions reserved for this call go back to the pool
+                await self.release([s.exchange for s in sessions if s is not None])
+                raise
+            async with self._lock:
+                for i, exchange in zip(missing, created, strict=True):
+                    session = _Session(exchange)
+                    self._in_use[id(exchange)] = (keys[i], session)
+                    sessions[i] = session
+            self._logger.info(f"created {len(created)} exchange sessions")
+
+        exchanges: list[Exchange] = []
+        for reserved in sessions:
+            assert reserved is not None
+            exchanges.append(reserved.exchange)
+        return exchanges
+
+    @typechecked(hot=True)
+    async def release(self, exchanges: list[Exchange], failed: bool = False) -> None:
+        """Return exchanges to the pool, closing them if the run failed or they are too old."""
+        to_close: list[Exchange] = []
+        async with self._lock:
+            for exchange in exchanges:
+                entry = self._in_use.pop(id(exchange), None)
+                if entry is None:
+                    to_close.append(exchange)
+                    continue
+                key, session = entry
+                if failed or session.expired(self._max_age):
+                    to_close.append(exchange)
+                else:
+                    self._idle[key].append(session)
+        await self._close(to_close)
+
+    @typechecked
+    async def close(self) -> None:
+        """Close every pooled session, idle or in use."""
+        async with self._lock:
+            exchanges = [s.exchange for sessions in self._idle.values() for s in sessions]
+            exchanges += [s.exchange for _, s in self._in_use.values()]
+            self._idle.clear()
+            self._in_use.clear()
+        await self._close(exchanges)
+
+    async def _take_idle(self, key: _SessionKey) -> _Session | None:
+        """Reserve a usable idle session of `key`, closing the expired and unhealthy ones on the way."""
+        while True:
+            async with self._lock:
+                idle = self._idle[key]
+                if not idle:
+                    return None
+                session = idle.pop()
+                self._in_use[id(session.exchange)] = (key, session)
+            if not session.expired(self._max_age) and await self._is_healthy(session.exchange):
+                return session
+            async with self._lock:
+                self._in_use.pop(id(session.exchange), None)
+            await self._close([session.exchange])
+
+    async def _is_healthy(self, exchange: Exchange) -> bool:
+        try:
+            return await self._health_check(exchange)
+        except Exception as e:
+            self._logger.warning(f"exchange {exchange.id} failed health check: {e}")
+            return False
+
+    async def _close(self, exchanges: list[Exchange]) -> None:
+        if not exchanges:
+            return
+        try:
+            await Exchange.close(exchanges)
+        except Exception as e:
+            self._logger.warning(f"error closing exchange sessions: {e}")
+
+    @staticmethod
+    def _key(demo: bool, config: ExchangeConfig) -> _SessionKey:
+        return demo, config.model_dump_json()
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Final, cast
+
+import polars as pl
+from traxon_core.crypto.exchanges import Exchange
+from traxon_core.crypto.models import Symbol
+from traxon_core.crypto.models.market_info import MarketInfo
+from traxon_core.logs.structlog import logger
+
+from traxon_strats.validation.typecheck import typechecked
+
+# ccxt precision modes: how an exchange expresses the precisions of its markets
+DECIMAL_PLACES: Final[int] = 2
+SIGNIFICANT_DIGITS: Final[int] = 3
+TICK_SIZE: Final[int] = 4
+
+_MARKETS_SCHEMA: Final[dict[str, pl.DataType]] = {
+    "market_symbol": pl.String(),
+    "market_idx": pl.UInt32(),
+    "type": pl.String(),
+    "active": pl.Boolean(),
+    "precision_amount": pl.Float64(),
+    "precision_price": pl.Float64(),
+    "contract_size": pl.Float64(),
+    "precision_mode": pl.UInt8(),
+}
+
+
+def _to_float(value: float | int | Decimal | None) -> float | None:
+    return None if value is None else float(value)
+
+
+def _to_precision(value: float, precision_mode: int) -> int:
+    """
+    Precisions are numbers of digits, except in `TICK_SIZE` mode where ccxt gives the tick size
+    itself. `MarketInfo` types precisions as digits, so tick sizes are passed through as the venue
+    gave them, like the markets of a live session.
+    """
+    if precision_mode == TICK_SIZE:
+        return cast(int, value)
+    return int(value)
+
+
+class MarketsIndex:
+    """
+    Symbol-indexed view over an exchange's markets.
+
+    `frame` holds one row per market (see `_MARKETS_SCHEMA`) for vectorized joins, and
+    `market_idx` points back to the `MarketInfo` objects used to build orders. Precisions are
+    read according to the exchange's `precision_mode`.
+    """
+
+    __slots__ = ("_by_symbol", "_markets", "_symbols", "fetched_at", "frame", "precision_mode")
+
+    def __init__(
+        self,
+        symbols: list[Symbol],
+        markets: list[MarketInfo],
+        fetched_at: datetime,
+        precision_mode: int = DECIMAL_PLACES,
+    ) -> None:
+        self._symbols: Final[list[Symbol]] = symbols
+        self._markets: Final[list[MarketInfo]] = markets
+        self._by_symbol: Final[dict[str, int]] = {str(s): i for i, s in enumerate(symbols)}
+        self.fetched_at: Final[datetime] = fetched_at
+        self.precision_mode: Final[int] = precision_mode
+        self.frame: Final[pl.DataFrame] = pl.DataFrame(
+            {
+                "market_symbol": [str(s) for s in symbols],
+                "market_idx": range(len(symbols)),
+                "type": [str(m.type) for m in markets],
+                "active": [bool(m.active) for m in markets],
+                "precision_amount": [_to_float(m.precision_amount) for m in markets],
+                "precision_price": [_to_float(m.precision_price) for m in markets],
+                "contract_size": [_to_float(m.contract_size) for m in markets],
+                "precision_mode": [precision_mode] * len(symbols),
+            },
+            schema=_MARKETS_SCHEMA,
+        )
+
+    @classmethod
+    def from_markets(
+        cls,
+        markets: Mapping[Symbol, MarketInfo],
+        fetched_at: datetime | None = None,
+        precision_mode: int = DECIMAL_PLACES,
+    ) -> MarketsIndex:
+        return cls(list(markets.keys()), list(markets.values()), fetched_at or datetime.now(), precision_mode)
+
+    @classmethod
+    def from_exchange(cls, exchange: Exchange) -> MarketsIndex:
+        """Index the markets loaded by an exchange session, in the exchange's precision mode."""
+        precision_mode = getattr(exchange.api, "precisionMode", None)
+        return cls.from_markets(
+            exchange.api.markets,
+            precision_mode=precision_mode if isinstance(precision_mode, int) else DECIMAL_PLACES,
+        )
+
+    @classmethod
+    def read_ipc(cls, path: Path) -> MarketsIndex:
+        """
+        Read an index written by `write_ipc`, rebuilding each `MarketInfo` from its typed columns.
+        Raises `ValueError` if some markets lack the precisions or contract size `MarketInfo` needs.
+        """
+        df = pl.read_ipc(path, columns=list(_MARKETS_SCHEMA), memory_map=False).cast(
+            pl.Schema(_MARKETS_SCHEMA)
+        )
+        incomplete = df.filter(
+            pl.any_horizontal(pl.col("precision_amount", "precision_price", "contract_size").is_null())
+        )
+        if not incomplete.is_empty():
+            raise ValueError(
+                f"markets without precision or contract size in {path}: "
+                f"{', '.join(incomplete['market_symbol'])}"
+            )
+        precision_mode = int(df["precision_mode"][0]) if df.height else DECIMAL_PLACES
+        symbols: list[Symbol] = []
+        markets: list[MarketInfo] = []
+        for row in df.sort("market_idx").iter_rows(named=True):
+            symbol = Symbol(row["market_symbol"])
+            symbols.append(symbol)
+            markets.append(
+                MarketInfo(
+                    symbol=symbol,
+                    type=row["type"],
+                    active=row["active"],
+                    precision_amount=_to_precision(row["precision_amount"], precision_mode),
+                    precision_price=_to_precision(row["precision_price"], precision_mode),
+                    contract_size=Decimal(str(row["contract_size"])),
+                )
+            )
+        fetched_at = datetime.fromtimestamp(path.stat().st_mtime)
+        return cls(symbols, markets, fetched_at, precision_mode)
+
+    def write_ipc(self, path: Path) -> None:
+        """Write the typed market columns, which carry every `MarketInfo` field the strategy reads."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        self.frame.write_ipc(tmp_path, compression="zstd")
+        tmp_path.replace(path)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def at(self, market_idx: int) -> tuple[Symbol, MarketInfo]:
+        return self._symbols[market_idx], self._markets[market_idx]
+
+    def get(self, market_symbol: str) -> MarketInfo | None:
+        idx = self._by_symbol.get(market_symbol)
+        return None if idx is None else self._markets[idx]
+
+    def is_stale(self, ttl: timedelta) -> bool:
+        return datetime.now() - self.fetched_at > ttl
+
+
+class MarketMetadataCache:
+    """
+    Markets index of each exchange session, reloaded from the venue once older than `ttl`.
+
+    Sessions load their markets when they are created, so indexes are built from those and kept
+    for as long as the session lives: pooled sessions don't rebuild them on every run. Once an
+    index is older than `ttl`, a background task reloads the session's markets from the venue
+    and rebuilds it; the current index, which is the one the session trades on, is served meanwhile.
+    """
+
+    @typechecked
+    def __init__(self, ttl: timedelta = timedelta(hours=12)) -> None:
+        self._ttl: Final[timedelta] = ttl
+        # Index of each live session, with the markets mapping it was built from
+        self._entries: weakref.WeakKeyDictionary[
+            Exchange, tuple[Mapping[Symbol, MarketInfo], MarketsIndex]
+        ] = weakref.WeakKeyDictionary()
+        self._refreshing: dict[int, asyncio.Task[None]] = {}
+        self._logger = logger.bind(component=self.__class__.__name__)
+
+    @typechecked(hot=True)
+    async def get(self, exchange: Exchange) -> MarketsIndex:
+        """Return the markets index of the exchange session, building it if needed."""
+        cached = self._entries.get(exchange)
+        # The session may have reloaded its markets by itself
+        if cached is None or cached[0] is not exchange.api.markets:
+            return self._build(exchange)
+
+        entry = cached[1]
+        key = id(exchange)
+        if entry.is_stale(self._ttl) and key not in self._refreshing:
+            self._logger.info(f"{exchange.id} - markets are stale, reloading in background")
+            task = asyncio.create_task(self._refresh(exchange))
+            self._refreshing[key] = task
+            task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+        return entry
+
+    @typechecked
+    def invalidate(self, exchange: Exchange) -> None:
+        self._entries.pop(exchange, None)
+
+    @typechecked
+    async def close(self) -> None:
+        """Wait for pending background refreshes."""
+        await asyncio.gather(*self._refreshing.values(), return_exceptions=True)
+
+    async def _refresh(self, exchange: Exchange) -> None:
+        try:
+            await exchange.api.load_markets(reload=True)
+            self._build(exchange)
+        except Exception as e:
+            self._logger.warning(f"{exchange.id} - markets reload failed: {e}")
+
+    def _build(self, exchange: Exchange) -> MarketsIndex:
+        markets = exchange.api.markets
+        entry = MarketsIndex.from_exchange(exchange)
+        if len(entry) == 0:
+            # Markets not loaded on this session, don't keep an empty index
+            return entry
+        self._entries[exchange] = (markets, entry)
+        self._logger.info(f"{exchange.id} - indexed {len(entry)} markets")
+        return entry
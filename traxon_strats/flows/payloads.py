@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import os
+import sys
+from collections.abc import Sequence
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Final
+
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import (
+    AdvancedJSONEncoder,
+    BinaryNullPayloadConverter,
+    BinaryPlainPayloadConverter,
+    BinaryProtoPayloadConverter,
+    CompositePayloadConverter,
+    DataConverter,
+    EncodingPayloadConverter,
+    JSONPlainPayloadConverter,
+    JSONProtoPayloadConverter,
+    JSONTypeConverter,
+    PayloadCodec,
+)
+
+from traxon_strats.robotwealth.yolo.stages import FrameData
+
+# Temporal payloads for DataFrames. Top-level frames are sent as raw zstd Arrow IPC, frames nested
+# in stage dataclasses as base64 IPC inside the JSON payload, and any payload above the spill
+# threshold is moved to a local blob store with only its key recorded in the workflow history.
+
+ARROW_IPC_ENCODING: Final[str] = "binary/x-arrow-ipc"
+BLOB_REF_ENCODING: Final[str] = "binary/x-blob-ref"
+# Well below Temporal's 2 MiB payload limit, and small enough to keep histories cheap to replay
+DEFAULT_SPILL_BYTES: Final[int] = 256 * 1024
+_FRAME_KEY: Final[str] = "$arrow_ipc"
+_KIND_FRAME_DATA: Final[bytes] = b"frame_data"
+
+
+def _is_dataframe(value: Any) -> bool:
+    # A DataFrame can only exist once polars is imported, so there is no need to import it here
+    polars = sys.modules.get("polars")
+    return polars is not None and isinstance(value, polars.DataFrame)
+
+
+class ArrowIpcPayloadConverter(EncodingPayloadConverter):
+    """Encodes `pl.DataFrame` and `FrameData` values as zstd-compressed Arrow IPC."""
+
+    @property
+    def encoding(self) -> str:
+        return ARROW_IPC_ENCODING
+
+    def to_payload(self, value: Any) -> Payload | None:
+        if isinstance(value, FrameData):
+            return Payload(
+                metadata={"encoding": ARROW_IPC_ENCODING.encode(), "kind": _KIND_FRAME_DATA},
+                data=value.ipc,
+            )
+        if _is_dataframe(value):
+            return Payload(metadata={"encoding": ARROW_IPC_ENCODING.encode()}, data=FrameData.of(value).ipc)
+        return None
+
+    def from_payload(self, payload: Payload, type_hint: type | None = None) -> Any:
+        data = FrameData(payload.data)
+        if type_hint is FrameData or (type_hint is None and payload.metadata.get("kind") == _KIND_FRAME_DATA):
+            return data
+        return data.frame()
+
+
+class FrameDataJSONEncoder(AdvancedJSONEncoder):
+    def default(self, o: Any) -> Any:
+        if isinstance(o, FrameData):
+            return {_FRAME_KEY: base64.b64encode(o.ipc).decode("ascii")}
+        # Datetimes are already handled by the Temporal encoder, plain dates are not
+        if isinstance(o, date) and not isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class FrameDataTypeConverter(JSONTypeConverter):
+    def to_typed_value(self, hint: type, value: Any) -> Any:
+        if hint is FrameData and isinstance(value, dict) and _FRAME_KEY in value:
+            return FrameData(base64.b64decode(value[_FRAME_KEY]))
+        if hint is date and isinstance(value, str):
+            return date.fromisoformat(value)
+        return JSONTypeConverter.Unhandled
+
+
+class FramePayloadConverter(CompositePayloadConverter):
+    """The default Temporal converters, with Arrow IPC for frames ahead of JSON."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            BinaryNullPayloadConverter(),
+            BinaryPlainPayloadConverter(),
+            ArrowIpcPayloadConverter(),
+            JSONProtoPayloadConverter(),
+            BinaryProtoPayloadConverter(),
+            JSONPlainPayloadConverter(
+                encoder=FrameDataJSONEncoder, custom_type_converters=[FrameDataTypeConverter()]
+            ),
+        )
+
+
+class LocalBlobStore:
+    """Content-addressed blobs on the local filesystem, so a retried activity reuses its blob."""
+
+    __slots__ = ("_path",)
+
+    def __init__(self, path: Path) -> None:
+        self._path: Path = path
+
+    def put(self, data: bytes) -> str:
+        key = hashlib.sha256(data).hexdigest()
+        blob = self._path / key
+        if not blob.exists():
+            self._path.mkdir(parents=True, exist_ok=True)
+            # Written aside and renamed, so that a reader never sees a partial blob
+            partial = blob.with_name(f"{key}.{os.getpid()}.partial")
+            partial.write_bytes(data)
+            partial.replace(blob)
+        return key
+
+    def get(self, key: str) -> bytes:
+        return (self._path / key).read_bytes()
+
+
+class BlobSpillCodec(PayloadCodec):
+    """Replaces payloads larger than `threshold` bytes with a reference into a `LocalBlobStore`."""
+
+    __slots__ = ("_store", "_threshold")
+
+    def __init__(self, store: LocalBlobStore, threshold: int = DEFAULT_SPILL_BYTES) -> None:
+        self._store: LocalBlobStore = store
+        self._threshold: int = threshold
+
+    async def encode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        return [await self._spill(p) if p.ByteSize() > self._threshold else p for p in payloads]
+
+    async def decode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        return [
+            await self._load(p) if p.metadata.get("encoding") == BLOB_REF_ENCODING.encode() else p
+            for p in payloads
+        ]
+
+    async def _spill(self, payload: Payload) -> Payload:
+        key = await asyncio.to_thread(self._store.put, payload.SerializeToString())
+        return Payload(metadata={"encoding": BLOB_REF_ENCODING.encode()}, data=key.encode())
+
+    async def _load(self, payload: Payload) -> Payload:
+        data = await asyncio.to_thread(self._store.get, payload.data.decode())
+        return Payload.FromString(data)
+
+
+def data_converter(blob_path: Path | None = None, spill_bytes: int = DEFAULT_SPILL_BYTES) -> DataConverter:
+    """
+    Data converter for the YOLO client and worker. Payloads only spill to `blob_path` when it is
+    set, which must then be shared by every worker of the task queue.
+    """
+    codec = BlobSpillCodec(LocalBlobStore(blob_path), spill_bytes) if blob_path is not None else None
+    return DataConverter(payload_converter_class=FramePayloadConverter, payload_codec=codec)
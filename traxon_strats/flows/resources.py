@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Final
+
+from traxon_core.crypto.data_fetchers.portfolio import PortfolioFetcher
+from traxon_core.crypto.data_fetchers.prices import PriceFetcher
+from traxon_core.persistence.db import create_database
+from traxon_core.persistence.db.base import Database
+
+from traxon_strats.crypto.services.exchange_pool import ExchangePool
+from traxon_strats.crypto.services.markets import MarketMetadataCache
+from traxon_strats.observability.memory import configure_memory_profiling
+from traxon_strats.observability.tracing import configure_tracing
+from traxon_strats.persistence.duckdb.bootstrap import DuckDbSchemaBootstrap
+from traxon_strats.persistence.duckdb.repositories.accounts import DuckDbAccountsRepository
+from traxon_strats.persistence.duckdb.repositories.run_journal import DuckDbRunJournalRepository
+from traxon_strats.persistence.duckdb.repositories.yolo import DuckDbYoloRepository
+from traxon_strats.persistence.parquet.archive import ParquetArchiveExporter
+from traxon_strats.robotwealth.yolo.config import ServicesConfig
+
+
+class WorkerResources:
+    """
+    Process-scoped resources shared by every strategy served by a worker: the database and its
+    repositories, the price and portfolio fetchers, warm exchange sessions and market metadata.
+    """
+
+    __slots__ = (
+        "accounts_repository",
+        "database",
+        "exchange_pool",
+        "market_cache",
+        "portfolio_fetcher",
+        "run_journal",
+        "schema",
+        "yolo_repository",
+    )
+
+    def __init__(self, services_config: ServicesConfig) -> None:
+        configure_tracing(services_config.trace_path)
+        configure_memory_profiling(services_config.memory_profile_path)
+        self.database: Final[Database] = create_database(services_config.database)
+        archive = (
+            ParquetArchiveExporter(self.database, services_config.archive_path)
+            if services_config.archive_path is not None
+            else None
+        )
+        self.yolo_repository: Final[DuckDbYoloRepository] = DuckDbYoloRepository(self.database, archive)
+        self.accounts_repository: Final[DuckDbAccountsRepository] = DuckDbAccountsRepository(self.database)
+        self.run_journal: Final[DuckDbRunJournalRepository] = DuckDbRunJournalRepository(self.database)
+        # Tables are initialized by the first activity of the process that needs them
+        self.schema: Final[DuckDbSchemaBootstrap] = DuckDbSchemaBootstrap(
+            self.database, [self.accounts_repository, self.run_journal, self.yolo_repository]
+        )
+        self.portfolio_fetcher: Final[PortfolioFetcher] = PortfolioFetcher(PriceFetcher())
+        self.exchange_pool: Final[ExchangePool] = ExchangePool()
+        self.market_cache: Final[MarketMetadataCache] = MarketMetadataCache()
+
+    async def close(self) -> None:
+        """Wait for market reloads in progress, then close the pooled exchange sessions."""
+        await self.market_cache.close()
+        await self.exchange_pool.close()
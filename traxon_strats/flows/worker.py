@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import signal
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import NamedTuple, Protocol
+
+from temporalio.client import Client
+from temporalio.worker import Worker
+from traxon_core.logs.structlog import logger
+
+from traxon_strats.flows.payloads import data_converter
+from traxon_strats.flows.resources import WorkerResources
+from traxon_strats.flows.yolo.activities import YoloActivities
+from traxon_strats.flows.yolo.schedule import YoloScheduleWorkflow
+from traxon_strats.flows.yolo.workflows import YoloWorkflow
+from traxon_strats.robotwealth.yolo.config import ServicesConfig, WorkerConfig, YoloConfig
+
+_logger = logger.bind(component="worker")
+
+
+class StrategySpec(NamedTuple):
+    """A strategy config served by the worker, on the task queue derived from its name."""
+
+    name: str | None
+    path: Path
+
+    @classmethod
+    def parse(cls, value: str) -> StrategySpec:
+        """Parse `[NAME=]PATH`. Named strategies get their own task queue."""
+        name, sep, path = value.rpartition("=")
+        if sep and not name:
+            raise argparse.ArgumentTypeError(f"empty strategy name in {value!r}")
+        return cls(name or None, Path(path))
+
+    def task_queue(self, base: str) -> str:
+        return base if self.name is None else f"{base}.{self.name}"
+
+
+class _Runnable(Protocol):
+    async def run(self) -> None: ...
+    async def shutdown(self) -> None: ...
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="traxon-strats-worker", description="Run a Temporal worker for the YOLO strategy."
+    )
+    parser.add_argument("--services", type=Path, required=True, help="services config (YAML)")
+    parser.add_argument(
+        "--strategy",
+        type=StrategySpec.parse,
+        action="append",
+        required=True,
+        metavar="[NAME=]PATH",
+        help="strategy config (YAML); repeat to serve several strategies, each named one on "
+        "the task queue '<task_queue>.<NAME>'",
+    )
+    parser.add_argument("--max-concurrent-activities", type=int)
+    parser.add_argument("--max-concurrent-workflow-tasks", type=int)
+    parser.add_argument("--activity-executor-workers", type=int)
+    parser.add_argument("--graceful-shutdown-seconds", type=float)
+    return parser
+
+
+def worker_config(base: WorkerConfig, args: argparse.Namespace) -> WorkerConfig:
+    """Override the configured worker settings with the ones given on the command line."""
+    overrides = {
+        name: getattr(args, name)
+        for name in WorkerConfig.model_fields
+        if getattr(args, name, None) is not None
+    }
+    return WorkerConfig.model_validate(base.model_dump() | overrides)
+
+
+async def serve(workers: Sequence[_Runnable], stop: asyncio.Event) -> None:
+    """
+    Run the workers until `stop` is set or one of them fails, then shut all of them down.
+    Shutdown waits for in-flight activities up to the workers' graceful shutdown timeout.
+    """
+    runs = [asyncio.create_task(w.run()) for w in workers]
+    stopped = asyncio.create_task(stop.wait())
+    try:
+        await asyncio.wait([stopped, *runs], return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        stopped.cancel()
+        _logger.info("shutting down workers, draining in-flight activities")
+        await asyncio.gather(*(w.shutdown() for w, run in zip(workers, runs, strict=True) if not run.done()))
+        # Surfaces the failure of a worker that stopped on its own
+        await asyncio.gather(*runs)
+
+
+async def run_worker(
+    services_config: ServicesConfig,
+    strategies: Sequence[tuple[StrategySpec, YoloConfig]],
+    stop: asyncio.Event,
+) -> None:
+    """Serve every strategy from this process, sharing the database and exchange sessions."""
+    settings = services_config.worker
+    temporal = services_config.temporal
+    executor = ThreadPoolExecutor(settings.activity_executor_workers, thread_name_prefix="activity")
+    asyncio.get_running_loop().set_default_executor(executor)
+
+    client = await Client.connect(
+        f"{temporal.host}:{temporal.port}",
+        namespace=temporal.namespace,
+        data_converter=data_converter(services_config.payload_blob_path),
+    )
+    resources = WorkerResources(services_config)
+    try:
+        workers: list[Worker] = []
+        for spec, config in strategies:
+            activities = YoloActivities(config, services_config, resources)
+            task_queue = spec.task_queue(temporal.task_queue)
+            workers.append(
+                Worker(
+                    client,
+                    task_queue=task_queue,
+                    workflows=[YoloWorkflow, YoloScheduleWorkflow],
+                    activities=activities.definitions(),
+                    activity_executor=executor,
+                    max_concurrent_activities=settings.max_concurrent_activities,
+                    max_concurrent_workflow_tasks=settings.max_concurrent_workflow_tasks,
+                    graceful_shutdown_timeout=timedelta(seconds=settings.graceful_shutdown_seconds),
+                )
+            )
+            _logger.info("serving strategy", config=str(spec.path), task_queue=task_queue)
+        await serve(workers, stop)
+    finally:
+        await resources.close()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _main(args: argparse.Namespace) -> None:
+    services_config = ServicesConfig.from_yaml(args.services)
+    services_config = services_config.model_copy(
+        update={"worker": worker_config(services_config.worker, args)}
+    )
+    strategies = [(spec, YoloConfig.from_yaml(spec.path)) for spec in args.strategy]
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+    await run_worker(services_config, strategies, stop)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    task_queues = [spec.task_queue("") for spec in args.strategy]
+    if len(set(task_queues)) != len(task_queues):
+        parser.error("strategies must have distinct names, and at most one may be unnamed")
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
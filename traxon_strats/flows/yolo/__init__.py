@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from traxon_strats.flows.yolo.activities import YoloActivities
+    from traxon_strats.flows.yolo.schedule import YoloScheduleWorkflow
+    from traxon_strats.flows.yolo.workflows import YoloWorkflow
+
+__all__ = ["YoloActivities", "YoloScheduleWorkflow", "YoloWorkflow"]
+
+# Resolved on first access, so importing the workflow does not import the activities
+_LAZY_ATTRIBUTES: Final[dict[str, str]] = {
+    "YoloActivities": "traxon_strats.flows.yolo.activities",
+    "YoloScheduleWorkflow": "traxon_strats.flows.yolo.schedule",
+    "YoloWorkflow": "traxon_strats.flows.yolo.workflows",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -1,47 +1,202 @@
 from __future__ import annotations
 
-from beartype import beartype
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Final
+
 from temporalio import activity
-from traxon_core.crypto.data_fetchers.portfolio import PortfolioFetcher
-from traxon_core.crypto.data_fetchers.prices import PriceFetcher
-from traxon_core.persistence.db import create_database
 
-from traxon_strats.crypto.services.equity import EquityService
-from traxon_strats.persistence.duckdb.repositories.accounts import DuckDbAccountsRepository
-from traxon_strats.persistence.duckdb.repositories.yolo import DuckDbYoloRepository
-from traxon_strats.robotwealth.yolo.config import ServicesConfig, YoloConfig
-from traxon_strats.robotwealth.yolo.strategy import YoloStrategy
+from traxon_strats.robotwealth.yolo.progress import RunCheckpoint
+from traxon_strats.robotwealth.yolo.stages import BatchResult, OrderBatch, VenueTarget
+from traxon_strats.validation.typecheck import typechecked
+
+if TYPE_CHECKING:
+    from traxon_strats.crypto.services.exchange_pool import ExchangePool
+    from traxon_strats.crypto.services.markets import MarketMetadataCache
+    from traxon_strats.flows.resources import WorkerResources
+    from traxon_strats.persistence.duckdb.bootstrap import DuckDbSchemaBootstrap
+    from traxon_strats.persistence.duckdb.repositories.run_journal import DuckDbRunJournalRepository
+    from traxon_strats.persistence.duckdb.repositories.yolo import DuckDbYoloRepository
+    from traxon_strats.robotwealth.yolo.config import ServicesConfig, YoloConfig
+    from traxon_strats.robotwealth.yolo.strategy import YoloStrategy
+
+# Used when the activity is started without a heartbeat timeout
+_DEFAULT_HEARTBEAT_TIMEOUT: Final[timedelta] = timedelta(seconds=30)
+# Longest a run may go without progress before the keep-alive stops vouching for it
+_PHASE_DEADLINE: Final[timedelta] = timedelta(minutes=10)
 
 
 class YoloActivities:
-    def __init__(self, config: YoloConfig, services_config: ServicesConfig):
-        db = create_database(services_config.database)
-        yolo_repo = DuckDbYoloRepository(db)
-        accounts_repo = DuckDbAccountsRepository(db)
-        price_fetcher = PriceFetcher()
-        portfolio_fetcher = PortfolioFetcher(price_fetcher)
-        equity_service = EquityService(accounts_repo)
+    """
+    Temporal activities of the YOLO strategy.
+
+    The strategy stack (polars, pandera, httpx, the exchange clients) is imported when the
+    activities are built rather than when this module is imported, so importing it stays cheap
+    for the worker and the workflow sandbox.
+    """
 
+    exchange_pool: ExchangePool
+    market_cache: MarketMetadataCache
+    resources: WorkerResources
+    run_journal: DuckDbRunJournalRepository
+    schema: DuckDbSchemaBootstrap
+    strategy: YoloStrategy
+    yolo_repository: DuckDbYoloRepository
+
+    def __init__(
+        self,
+        config: YoloConfig,
+        services_config: ServicesConfig,
+        resources: WorkerResources | None = None,
+    ) -> None:
+        """
+        Build the activities of one strategy config. Workers serving several strategies pass
+        their shared `resources`, which they then close themselves.
+        """
+        from traxon_strats.crypto.services.equity import EquityService
+        from traxon_strats.flows.resources import WorkerResources
+        from traxon_strats.robotwealth.yolo.strategy import YoloStrategy
+
+        self._owned_resources = resources is None
+        self.resources = resources if resources is not None else WorkerResources(services_config)
+        self.exchange_pool = self.resources.exchange_pool
+        self.market_cache = self.resources.market_cache
+        self.run_journal = self.resources.run_journal
+        self.schema = self.resources.schema
+        self.yolo_repository = self.resources.yolo_repository
         self.strategy = YoloStrategy(
             config=config,
             services_config=services_config,
-            portfolio_fetcher=portfolio_fetcher,
-            yolo_repository=yolo_repo,
-            equity_service=equity_service,
+            portfolio_fetcher=self.resources.portfolio_fetcher,
+            yolo_repository=self.yolo_repository,
+            equity_service=EquityService(self.resources.accounts_repository),
+            market_cache=self.market_cache,
+            exchange_pool=self.exchange_pool,
+            run_journal=self.run_journal,
         )
 
+    def definitions(self) -> list[Callable[..., Any]]:
+        """The activities to register with a worker."""
+        return [
+            self.init_tables,
+            self.prune_history,
+            self.warm_up,
+            self.fetch_strategy_params,
+            self.run_strategy,
+            self.compute_targets,
+            self.build_orders,
+            self.execute_order_batch,
+            self.validate_venue,
+        ]
+
+    async def close(self) -> None:
+        """Release worker-scoped resources on shutdown, unless they were shared with us."""
+        if self._owned_resources:
+            await self.resources.close()
+
     @activity.defn
-    @beartype
+    @typechecked
     async def init_tables(self) -> None:
-        await self.strategy._yolo_repository.init_tables()
-        await self.strategy._equity_service._repository.init_tables()
+        """Kept for workflow histories recorded before tables were bootstrapped by the worker."""
+        await self.schema.run()
+
+    @activity.defn
+    @typechecked
+    async def prune_history(self) -> None:
+        await self.schema.run()
+        await self.yolo_repository.prune_history()
 
     @activity.defn
-    @beartype
+    @typechecked
+    async def warm_up(self) -> None:
+        await self.schema.run()
+        await self.strategy.warm_up()
+
+    @activity.defn
+    @typechecked
     async def fetch_strategy_params(self) -> None:
+        await self.schema.run()
         await self.strategy.fetch_strategy_params()
 
     @activity.defn
-    @beartype
+    @typechecked
     async def run_strategy(self) -> None:
-        await self.strategy.run_strategy()
+        """
+        Run the strategy, heartbeating its checkpoint. A retried attempt resumes from the last
+        checkpoint heartbeated by the previous one.
+        """
+        info = activity.info()
+        details: dict[str, Any] | None = info.heartbeat_details[0] if info.heartbeat_details else None
+        heartbeat = _CheckpointHeartbeat(details, _PHASE_DEADLINE)
+        heartbeat.beat()
+        interval = (info.heartbeat_timeout or _DEFAULT_HEARTBEAT_TIMEOUT) / 3
+        keep_alive = asyncio.create_task(heartbeat.keep_alive(interval))
+        try:
+            await self.schema.run()
+            resume_from = RunCheckpoint.from_dict(details) if details is not None else None
+            await self.strategy.run_strategy(resume_from, heartbeat)
+        finally:
+            keep_alive.cancel()
+
+    @activity.defn
+    @typechecked
+    async def compute_targets(self) -> list[VenueTarget]:
+        await self.schema.run()
+        return await self.strategy.compute_targets()
+
+    @activity.defn
+    @typechecked
+    async def build_orders(self, target: VenueTarget) -> list[OrderBatch]:
+        await self.schema.run()
+        return await self.strategy.build_orders(target)
+
+    @activity.defn
+    @typechecked
+    async def execute_order_batch(self, batch: OrderBatch) -> BatchResult:
+        return await self.strategy.execute_order_batch(batch)
+
+    @activity.defn
+    @typechecked
+    async def validate_venue(self, target: VenueTarget, results: list[BatchResult]) -> bool:
+        await self.schema.run()
+        return await self.strategy.validate_venue(target, results)
+
+
+class _CheckpointHeartbeat:
+    """
+    Heartbeats the latest run checkpoint on every update and at a fixed interval in between,
+    so long phases such as order execution still prove the worker alive.
+
+    The keep-alive stops once the run has made no progress for `phase_deadline`, so a run stuck
+    in a phase is caught by the heartbeat timeout and retried from its checkpoint.
+    """
+
+    def __init__(self, details: dict[str, Any] | None, phase_deadline: timedelta) -> None:
+        # Starts from the previous attempt's checkpoint, so a crash before any progress keeps it
+        self._details = details
+        self._phase_deadline = phase_deadline
+        self._progressed_at = time.monotonic()
+
+    def __call__(self, checkpoint: RunCheckpoint) -> None:
+        self._details = checkpoint.to_dict()
+        self._progressed_at = time.monotonic()
+        self.beat()
+
+    async def keep_alive(self, interval: timedelta) -> None:
+        stalled = False
+        while True:
+            await asyncio.sleep(interval.total_seconds())
+            if time.monotonic() - self._progressed_at <= self._phase_deadline.total_seconds():
+                stalled = False
+                self.beat()
+            elif not stalled:
+                stalled = True
+                activity.logger.warning(f"no run progress for {self._phase_deadline}, heartbeats paused")
+
+    def beat(self) -> None:
+        if self._details is None:
+            activity.heartbeat()
+        else:
+            activity.heartbeat(self._details)
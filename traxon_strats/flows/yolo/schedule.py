@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+
+from temporalio import workflow
+from temporalio.common import RetryPolicy
+from temporalio.exceptions import ActivityError, ChildWorkflowError
+
+from traxon_strats.flows.yolo.workflows import YoloWorkflow, YoloWorkflowParams
+
+
+@dataclass(frozen=True)
+class YoloScheduleParams:
+    # Time of day (UTC, "HH:MM") at which RobotWealth data is expected and the rebalance starts
+    rebalance_time: str = "00:05"
+    # Exchange sessions and market metadata are loaded this long before the rebalance
+    warm_up_lead_seconds: int = 10 * 60
+    # Daily runs before the workflow continues as new, bounding its history
+    runs_per_history: int = 7
+    run: YoloWorkflowParams = field(default_factory=YoloWorkflowParams)
+
+
+def next_rebalance(now: datetime, rebalance_time: str) -> datetime:
+    """The first rebalance at `rebalance_time` (UTC) after `now`."""
+    at = time.fromisoformat(rebalance_time).replace(tzinfo=now.tzinfo)
+    rebalance_at = datetime.combine(now.date(), at)
+    return rebalance_at if rebalance_at > now else rebalance_at + timedelta(days=1)
+
+
+@workflow.defn
+class YoloScheduleWorkflow:
+    """
+    Long-running daily schedule of `YoloWorkflow`.
+
+    Sleeps until shortly before the rebalance time, warms the worker up, and starts the daily run
+    as a child workflow right on time; its fetch step retries until the day's data is published.
+    A failed day is logged and does not stop the schedule.
+    """
+
+    @workflow.run
+    async def run(self, params: YoloScheduleParams | None = None) -> None:
+        params = params or YoloScheduleParams()
+        for _ in range(params.runs_per_history):
+            rebalance_at = next_rebalance(workflow.now(), params.rebalance_time)
+            await self._sleep_until(rebalance_at - timedelta(seconds=params.warm_up_lead_seconds))
+            await self._warm_up()
+            await self._sleep_until(rebalance_at)
+            await self._rebalance(rebalance_at, params.run)
+            if workflow.info().is_continue_as_new_suggested():
+                break
+        workflow.continue_as_new(params)
+
+    @staticmethod
+    async def _sleep_until(at: datetime) -> None:
+        delay = at - workflow.now()
+        if delay > timedelta(0):
+            await workflow.sleep(delay)
+
+    @staticmethod
+    async def _warm_up() -> None:
+        # Best effort: the run opens whatever the warm-up could not
+        try:
+            await workflow.execute_local_activity(
+                "warm_up",
+                start_to_close_timeout=timedelta(minutes=2),
+                retry_policy=RetryPolicy(maximum_attempts=2),
+            )
+        except ActivityError as e:
+            workflow.logger.warning(f"yolo warm-up failed: {e.cause or e}")
+
+    @staticmethod
+    async def _rebalance(rebalance_at: datetime, params: YoloWorkflowParams) -> None:
+        try:
+            await workflow.execute_child_workflow(
+                YoloWorkflow.run,
+                params,
+                id=f"{workflow.info().workflow_id}-{rebalance_at.date().isoformat()}",
+            )
+        except ChildWorkflowError as e:
+            workflow.logger.error(f"yolo run of {rebalance_at.date()} failed: {e.cause or e}")
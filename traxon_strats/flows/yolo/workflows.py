@@ -1,18 +1,36 @@
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 from datetime import timedelta
+from typing import Final
 
 from temporalio import workflow
 from temporalio.common import RetryPolicy
+from temporalio.exceptions import ApplicationError
 
 with workflow.unsafe.imports_passed_through():
-    pass
+    from traxon_strats.robotwealth.yolo.stages import BatchResult, OrderBatch, VenueTarget
+
+# Marks histories recorded since setup moved to local activities, so older ones still replay
+_LOCAL_SETUP_PATCH: Final[str] = "local-setup-activities"
+# Marks histories recorded since runs fan out into stage activities, older ones ran `run_strategy`
+_FAN_OUT_PATCH: Final[str] = "fan-out-targets"
+
+
+@dataclass(frozen=True)
+class YoloWorkflowParams:
+    # Run each stage as its own activity and execute symbols in parallel batches
+    fan_out: bool = True
+    # Order batches executing at once, across all venues
+    max_concurrent_batches: int = 8
 
 
 @workflow.defn
 class YoloWorkflow:
     @workflow.run
-    async def run(self) -> None:
+    async def run(self, params: YoloWorkflowParams | None = None) -> None:
+        params = params or YoloWorkflowParams()
         retry_policy = RetryPolicy(
             maximum_attempts=3,
             maximum_interval=timedelta(seconds=5),
@@ -27,18 +45,99 @@ class YoloWorkflow:
         # In Temporal, we execute activities by name or reference.
         # The actual instantiation of YoloActivities happens on the Worker side.
 
-        await workflow.execute_activity(
-            "init_tables",
-            start_to_close_timeout=timedelta(seconds=30),
-            retry_policy=retry_policy,
-        )
+        if workflow.patched(_LOCAL_SETUP_PATCH):
+            # Tables are bootstrapped once per worker process, and the cheap local setup runs as a
+            # local activity on the worker that runs the workflow, without a task queue round trip
+            await workflow.execute_local_activity(
+                "prune_history",
+                start_to_close_timeout=timedelta(minutes=1),
+                retry_policy=retry_policy,
+            )
+        else:
+            await workflow.execute_activity(
+                "init_tables",
+                start_to_close_timeout=timedelta(seconds=30),
+                retry_policy=retry_policy,
+            )
+        # Calls the RobotWealth API and may retry for minutes, which local activities are not fit for
         await workflow.execute_activity(
             "fetch_strategy_params",
             start_to_close_timeout=timedelta(seconds=30),
             retry_policy=api_retry_policy,
         )
-        await workflow.execute_activity(
-            "run_strategy",
-            start_to_close_timeout=timedelta(minutes=30),
+        if not (params.fan_out and workflow.patched(_FAN_OUT_PATCH)):
+            await workflow.execute_activity(
+                "run_strategy",
+                start_to_close_timeout=timedelta(minutes=30),
+                # Heartbeats carry the run checkpoint, so a retry resumes where the failed attempt stopped
+                heartbeat_timeout=timedelta(seconds=30),
+                retry_policy=retry_policy,
+            )
+            return None
+
+        targets: list[VenueTarget] = await workflow.execute_activity(
+            "compute_targets",
+            start_to_close_timeout=timedelta(minutes=5),
+            retry_policy=retry_policy,
+            result_type=list[VenueTarget],
+        )
+        semaphore = asyncio.Semaphore(params.max_concurrent_batches)
+        # Venues are isolated from each other, failures are raised once all of them are done
+        outcomes = await asyncio.gather(
+            *(self._rebalance_venue(target, semaphore, retry_policy) for target in targets),
+            return_exceptions=True,
+        )
+        failed_venues = [
+            t.venue for t, o in zip(targets, outcomes, strict=True) if isinstance(o, BaseException)
+        ]
+        failed_batches = sum(o for o in outcomes if isinstance(o, int))
+        if failed_venues or failed_batches:
+            raise ApplicationError(
+                f"yolo strategy failed on {len(failed_venues)} of {len(targets)} exchanges "
+                f"and {failed_batches} order batches",
+                failed_venues,
+            )
+        return None
+
+    async def _rebalance_venue(
+        self, target: VenueTarget, semaphore: asyncio.Semaphore, retry_policy: RetryPolicy
+    ) -> int:
+        """Build, execute and validate the orders of one venue. Returns the number of failed batches."""
+        batches: list[OrderBatch] = await workflow.execute_activity(
+            "build_orders",
+            target,
+            start_to_close_timeout=timedelta(minutes=2),
             retry_policy=retry_policy,
+            result_type=list[OrderBatch],
         )
+        if not batches:
+            return 0
+
+        async def execute(batch: OrderBatch) -> BatchResult:
+            async with semaphore:
+                result: BatchResult = await workflow.execute_activity(
+                    "execute_order_batch",
+                    batch,
+                    start_to_close_timeout=timedelta(minutes=10),
+                    retry_policy=retry_policy,
+                    result_type=BatchResult,
+                )
+            return result
+
+        # A failing batch is retried on its own and does not hold back the other symbols
+        outcomes = await asyncio.gather(*(execute(b) for b in batches), return_exceptions=True)
+        results = [o for o in outcomes if isinstance(o, BatchResult)]
+        failed = len(outcomes) - len(results)
+        for batch, outcome in zip(batches, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                workflow.logger.error(f"{batch.venue} {batch.symbol} orders failed: {outcome}")
+
+        if results:
+            await workflow.execute_activity(
+                "validate_venue",
+                args=[target, results],
+                start_to_close_timeout=timedelta(minutes=2),
+                retry_policy=retry_policy,
+                result_type=bool,
+            )
+        return failed
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Final
+
+import polars as pl
+
+DEFAULT_MAX_ROWS: Final[int] = 50
+DEFAULT_MAX_COLS: Final[int] = 20
+DEFAULT_MAX_CHARS: Final[int] = 2000
+
+
+class DeferredFrame:
+    """
+    Log value wrapping a DataFrame, sorted and rendered only when a sink emits the record.
+
+    Structlog renders event values with `repr` (console) or `__structlog__` (JSON), so a record
+    dropped by the level filter never pays for the sort or the table formatting. The rendered
+    table is truncated to `max_rows` rows and `max_cols` columns.
+    """
+
+    __slots__ = ("_frame", "_max_cols", "_max_rows", "_sort_by")
+
+    def __init__(
+        self,
+        frame: pl.DataFrame,
+        sort_by: str | Sequence[str] | None = None,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_cols: int = DEFAULT_MAX_COLS,
+    ) -> None:
+        self._frame: Final[pl.DataFrame] = frame
+        self._sort_by: Final[str | Sequence[str] | None] = sort_by
+        self._max_rows: Final[int] = max_rows
+        self._max_cols: Final[int] = max_cols
+
+    def render(self) -> str:
+        frame = self._frame if self._sort_by is None else self._frame.sort(self._sort_by)
+        with pl.Config(tbl_rows=self._max_rows, tbl_cols=self._max_cols):
+            return str(frame)
+
+    def __repr__(self) -> str:
+        return self.render()
+
+    __str__ = __repr__
+    __structlog__ = render
+
+
+class DeferredRepr:
+    """Log value rendering `repr(value)` only when emitted, truncated to `max_chars` characters."""
+
+    __slots__ = ("_max_chars", "_value")
+
+    def __init__(self, value: object, max_chars: int = DEFAULT_MAX_CHARS) -> None:
+        self._value: Final[object] = value
+        self._max_chars: Final[int] = max_chars
+
+    def render(self) -> str:
+        text = repr(self._value)
+        if len(text) <= self._max_chars:
+            return text
+        return f"{text[: self._max_chars]}... ({len(text) - self._max_chars} more chars)"
+
+    def __repr__(self) -> str:
+        return self.render()
+
+    __str__ = __repr__
+    __structlog__ = render
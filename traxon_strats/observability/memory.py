@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import threading
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Final, NamedTuple, TypeVar, cast
+
+import polars as pl
+from traxon_core.logs.structlog import logger
+
+import traxon_strats
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_MIB: Final[int] = 1024 * 1024
+_PAGE_SIZE: Final[int] = 4096
+_PACKAGE_DIR: Final[str] = str(Path(traxon_strats.__file__).parent) + os.sep
+# Allocations of the profiler itself (snapshots, reports) are left out of the reports
+_IGNORED: Final[frozenset[str]] = frozenset({tracemalloc.__file__, __file__})
+_LATEST_SNAPSHOT: Final[str] = "latest.snapshot"
+
+
+class Allocation(NamedTuple):
+    """Growth of the memory allocated at a location (or by a component) between two snapshots."""
+
+    location: str
+    size_diff: int
+    count_diff: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"location": self.location, "mib": round(self.size_diff / _MIB, 3), "count": self.count_diff}
+
+
+def _rss_bytes() -> int | None:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+@functools.cache
+def _component(filename: str) -> str | None:
+    """Module of this package defined in `filename`, if any."""
+    if not filename.startswith(_PACKAGE_DIR):
+        return None
+    module = filename[len(_PACKAGE_DIR) :].removesuffix(".py").replace(os.sep, ".")
+    return f"{traxon_strats.__name__}.{module}"
+
+
+def top_allocations(
+    snapshot: tracemalloc.Snapshot, previous: tracemalloc.Snapshot, limit: int
+) -> list[Allocation]:
+    """Source lines whose allocations grew the most since `previous`."""
+    allocations: list[Allocation] = []
+    for stat in snapshot.compare_to(previous, "lineno"):
+        if len(allocations) == limit or stat.size_diff <= 0:
+            break
+        if stat.traceback[0].filename not in _IGNORED:
+            allocations.append(Allocation(str(stat.traceback[0]), stat.size_diff, stat.count_diff))
+    return allocations
+
+
+def component_allocations(
+    snapshot: tracemalloc.Snapshot, previous: tracemalloc.Snapshot, limit: int
+) -> list[Allocation]:
+    """
+    Growth since `previous` attributed to the modules of this package: allocations made by
+    libraries (Polars, the HTTP client, DuckDB...) count for the innermost module that called them.
+    """
+    sizes: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+    for stat in snapshot.compare_to(previous, "traceback"):
+        # Frames go from the oldest to the most recent
+        if stat.traceback[-1].filename in _IGNORED:
+            continue
+        component = next(
+            (c for c in map(_component, (f.filename for f in reversed(stat.traceback))) if c is not None),
+            "<other>",
+        )
+        if component == __name__:
+            continue
+        sizes[component][0] += stat.size_diff
+        sizes[component][1] += stat.count_diff
+    ranked = sorted(sizes.items(), key=lambda item: item[1][0], reverse=True)
+    return [Allocation(c, size, count) for c, (size, count) in ranked[:limit] if size > 0]
+
+
+def frame_sizes(frames: dict[str, pl.DataFrame | None]) -> dict[str, dict[str, Any]]:
+    """Rows, chunks and Arrow buffer size of each frame, which `tracemalloc` does not see."""
+    return {
+        name: {"rows": df.height, "chunks": df.n_chunks(), "mib": round(df.estimated_size() / _MIB, 3)}
+        for name, df in frames.items()
+        if df is not None
+    }
+
+
+class _Run:
+    """Checkpoints of one profiled run."""
+
+    def __init__(self, name: str, top: int) -> None:
+        self.name: Final[str] = name
+        self.started_at: Final[datetime] = datetime.now()
+        self.checkpoints: list[dict[str, Any]] = []
+        self._top: Final[int] = top
+        self._lock = threading.Lock()
+        self.first: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+        self._previous: tracemalloc.Snapshot = self.first
+        tracemalloc.reset_peak()
+
+    def checkpoint(
+        self, phase: str, frames: dict[str, pl.DataFrame | None]
+    ) -> tuple[tracemalloc.Snapshot, dict[str, Any]]:
+        """Record a checkpoint; returns its snapshot and report entry."""
+        with self._lock:
+            snapshot = tracemalloc.take_snapshot()
+            traced, peak = tracemalloc.get_traced_memory()
+            rss = _rss_bytes()
+            checkpoint = {
+                "phase": phase,
+                "at": datetime.now().isoformat(timespec="milliseconds"),
+                "traced_mib": round(traced / _MIB, 3),
+                # Peak of the traced heap since the previous checkpoint
+                "peak_mib": round(peak / _MIB, 3),
+                "rss_mib": None if rss is None else round(rss / _MIB, 3),
+                "frames": frame_sizes(frames),
+                "top_allocations": [
+                    a.to_dict() for a in top_allocations(snapshot, self._previous, self._top)
+                ],
+                "components": [
+                    a.to_dict() for a in component_allocations(snapshot, self._previous, self._top)
+                ],
+            }
+            self.checkpoints.append(checkpoint)
+            self._previous = snapshot
+            tracemalloc.reset_peak()
+            return snapshot, checkpoint
+
+
+class MemoryProfiler:
+    """
+    Opt-in memory profiling of strategy runs.
+
+    While a profiled run is in progress, `checkpoint` takes a `tracemalloc` snapshot at each phase
+    boundary and records the traced heap, the RSS, the size of the frames at hand and the top
+    allocators since the previous boundary. Each run writes a JSON report under `<path>/<run>/`,
+    including the growth since the previous run of the same name in this process.
+
+    Tracing starts with the first profiled run and goes on until profiling is disabled, so that a
+    run is diffed against a snapshot of the same tracing session and slow leaks add up across runs.
+    `tracemalloc` traces the whole process, so concurrent runs see each other's allocations.
+    """
+
+    def __init__(self) -> None:
+        self._path: Path | None = None
+        self._frames = 25
+        self._top = 15
+        self._current: ContextVar[_Run | None] = ContextVar("memory_profile_run", default=None)
+        # Final snapshot of the last run of each name, taken in the current tracing session
+        self._last_snapshots: dict[str, tracemalloc.Snapshot] = {}
+        self._started_tracing = False
+        self._lock = threading.Lock()
+        self._logger = logger.bind(component="memory")
+
+    def configure(self, path: Path | None, frames: int = 25, top: int = 15) -> None:
+        """
+        Profile runs into `path`, with tracebacks of up to `frames` frames; `None` disables profiling
+        and stops the tracing it started.
+        """
+        if path is None:
+            self._stop_tracing()
+        self._path = path
+        self._frames = frames
+        self._top = top
+
+    @property
+    def enabled(self) -> bool:
+        return self._path is not None
+
+    @contextmanager
+    def profile(self, name: str) -> Iterator[None]:
+        """Profile the enclosed run; does nothing unless profiling is enabled, or within another run."""
+        path = self._path
+        if path is None or self._current.get() is not None:
+            yield
+            return
+        self._start_tracing()
+        run = _Run(name, self._top)
+        token = self._current.set(run)
+        try:
+            yield
+        finally:
+            self._current.reset(token)
+            last, _ = run.checkpoint("end", {})
+            self._finish(run, last, path / name)
+
+    def checkpoint(self, phase: str, **frames: pl.DataFrame | None) -> None:
+        """Record a phase boundary of the current profiled run, if any."""
+        run = self._current.get()
+        if run is None:
+            return
+        try:
+            _, checkpoint = run.checkpoint(phase, frames)
+            self._logger.info(
+                f"{run.name} memory at {phase}",
+                traced_mib=checkpoint["traced_mib"],
+                peak_mib=checkpoint["peak_mib"],
+                rss_mib=checkpoint["rss_mib"],
+                frames_mib=round(sum(f["mib"] for f in checkpoint["frames"].values()), 3),
+            )
+        except Exception as e:
+            self._logger.warning(f"error taking memory checkpoint {phase}: {e}")
+
+    def _finish(self, run: _Run, last: tracemalloc.Snapshot, directory: Path) -> None:
+        """
+        Write the run report and keep its final snapshot for the next run to diff against. The
+        snapshot is also written to `latest.snapshot`, for offline inspection.
+        """
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            report: dict[str, Any] = {
+                "run": run.name,
+                "started_at": run.started_at.isoformat(timespec="seconds"),
+                "checkpoints": run.checkpoints,
+                "run_growth": {
+                    "top_allocations": [a.to_dict() for a in top_allocations(last, run.first, self._top)],
+                    "components": [a.to_dict() for a in component_allocations(last, run.first, self._top)],
+                },
+            }
+            previous = self._last_snapshots.get(run.name)
+            self._last_snapshots[run.name] = last
+            if previous is not None:
+                report["since_previous_run"] = {
+                    "traced_mib": round(
+                        sum(s.size_diff for s in last.compare_to(previous, "filename")) / _MIB, 3
+                    ),
+                    "top_allocations": [a.to_dict() for a in top_allocations(last, previous, self._top)],
+                    "components": [a.to_dict() for a in component_allocations(last, previous, self._top)],
+                }
+            last.dump(str(directory / _LATEST_SNAPSHOT))
+            path = directory / f"{run.started_at:%Y%m%dT%H%M%S}.json"
+            path.write_text(json.dumps(report, indent=2))
+            self._logger.info(f"wrote {run.name} memory profile to {path}")
+        except Exception as e:
+            self._logger.warning(f"error writing memory profile of {run.name}: {e}")
+
+    def _start_tracing(self) -> None:
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self._frames)
+                self._started_tracing = True
+                # Snapshots of an earlier session are not comparable with the new one
+                self._last_snapshots.clear()
+
+    def _stop_tracing(self) -> None:
+        with self._lock:
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+            self._last_snapshots.clear()
+
+
+memory_profiler: Final[MemoryProfiler] = MemoryProfiler()
+
+
+def configure_memory_profiling(path: Path | None = None) -> None:
+    """Profile strategy runs into `path`; profiling is disabled when it is `None`."""
+    memory_profiler.configure(path)
+
+
+def memory_checkpoint(phase: str, **frames: pl.DataFrame | None) -> None:
+    """Record a phase boundary of the current profiled run, with the frames at hand."""
+    memory_profiler.checkpoint(phase, **frames)
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    """Decorator profiling each call as a run named `name`, when memory profiling is enabled."""
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with memory_profiler.profile(name):
+                    return await func(*args, **kwargs)
+
+            return cast(F, async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with memory_profiler.profile(name):
+                return func(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
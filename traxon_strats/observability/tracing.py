@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import secrets
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Final, Protocol, TypeVar, cast
+
+import polars as pl
+from traxon_core.logs.structlog import logger
+
+F = TypeVar("F", bound=Callable[..., Any])
+AttributeValue = str | int | float | bool
+
+_PAGE_SIZE: Final[int] = 4096
+
+
+def _memory_bytes() -> int | None:
+    """Traced heap size when `tracemalloc` is on, otherwise the process RSS (Linux only)."""
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+class Span:
+    """A timed unit of work. Spans nest through a context variable, across `await`s and tasks."""
+
+    __slots__ = (
+        "_memory_start",
+        "_perf_start",
+        "attributes",
+        "duration_ms",
+        "end_ns",
+        "error",
+        "memory_delta",
+        "name",
+        "parent_id",
+        "rows",
+        "span_id",
+        "start_ns",
+        "trace_id",
+    )
+
+    def __init__(self, name: str, parent: Span | None, attributes: dict[str, AttributeValue]) -> None:
+        self.name: Final[str] = name
+        self.trace_id: Final[str] = parent.trace_id if parent is not None else secrets.token_hex(16)
+        self.span_id: Final[str] = secrets.token_hex(8)
+        self.parent_id: Final[str | None] = parent.span_id if parent is not None else None
+        self.attributes: dict[str, AttributeValue] = attributes
+        self.rows: int | None = None
+        self.error: str | None = None
+        self.start_ns: int = time.time_ns()
+        self.end_ns: int = self.start_ns
+        self.duration_ms: float = 0.0
+        self.memory_delta: int | None = None
+        self._perf_start: int = time.perf_counter_ns()
+        self._memory_start: int | None = _memory_bytes()
+
+    def set(self, **attributes: AttributeValue) -> None:
+        self.attributes.update(attributes)
+
+    def record_rows(self, value: object) -> None:
+        """Record the row count of a DataFrame result; other values are ignored."""
+        if isinstance(value, pl.DataFrame):
+            self.rows = value.height
+
+    def _finish(self) -> None:
+        self.end_ns = time.time_ns()
+        self.duration_ms = round((time.perf_counter_ns() - self._perf_start) / 1e6, 3)
+        memory = _memory_bytes()
+        if memory is not None and self._memory_start is not None:
+            self.memory_delta = memory - self._memory_start
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+
+class LogSpanExporter:
+    """Emit each finished span as a structured `span` log event."""
+
+    def __init__(self) -> None:
+        self._logger = logger.bind(component="tracing")
+
+    def export(self, span: Span) -> None:
+        self._logger.info(
+            "span",
+            span=span.name,
+            duration_ms=span.duration_ms,
+            rows=span.rows,
+            memory_delta=span.memory_delta,
+            error=span.error,
+            **span.attributes,
+        )
+
+
+class JsonlSpanExporter:
+    """
+    Append finished spans to a JSON-lines file, one OTLP/JSON span object per line.
+
+    Each line follows the `Span` message of the OTLP JSON encoding (hex ids, unix-nano
+    timestamps, typed attribute values), so it can be loaded by OTLP-aware tooling.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path: Final[Path] = path
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    def export(self, span: Span) -> None:
+        attributes: dict[str, AttributeValue] = dict(span.attributes, duration_ms=span.duration_ms)
+        if span.rows is not None:
+            attributes["rows"] = span.rows
+        if span.memory_delta is not None:
+            attributes["memory_delta"] = span.memory_delta
+        record: dict[str, Any] = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()],
+            # OTLP status codes: 1 = ok, 2 = error
+            "status": {"code": 2, "message": span.error} if span.error is not None else {"code": 1},
+        }
+        if span.parent_id is not None:
+            record["parentSpanId"] = span.parent_id
+        line = json.dumps(record)
+        with self._lock, self._path.open("a") as f:
+            f.write(line + "\n")
+
+
+def _otlp_value(value: AttributeValue) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Tracer:
+    """Creates spans and hands them to the exporters once finished."""
+
+    def __init__(self, exporters: list[SpanExporter]) -> None:
+        self._exporters: list[SpanExporter] = exporters
+        self._current: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+    def configure(self, exporters: list[SpanExporter]) -> None:
+        self._exporters = exporters
+
+    def current(self) -> Span | None:
+        return self._current.get()
+
+    @contextmanager
+    def span(self, name: str, **attributes: AttributeValue) -> Iterator[Span]:
+        span = Span(name, self._current.get(), attributes)
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self._current.reset(token)
+            span._finish()
+            self._export(span)
+
+    def _export(self, span: Span) -> None:
+        for exporter in self._exporters:
+            try:
+                exporter.export(span)
+            except Exception as e:
+                logger.warning(f"error exporting span {span.name}: {e}")
+
+
+tracer: Final[Tracer] = Tracer([LogSpanExporter()])
+
+
+def configure_tracing(path: Path | None = None) -> None:
+    """Export spans as log events and, when `path` is given, to an OTLP/JSON lines file."""
+    exporters: list[SpanExporter] = [LogSpanExporter()]
+    if path is not None:
+        exporters.append(JsonlSpanExporter(path))
+    tracer.configure(exporters)
+
+
+def current_span() -> Span:
+    """The innermost open span, or a detached one (never exported) when there is none."""
+    return tracer.current() or Span("detached", None, {})
+
+
+def span(name: str, **attributes: AttributeValue) -> AbstractContextManager[Span]:
+    """Open a span on the global tracer."""
+    return tracer.span(name, **attributes)
+
+
+def traced(name: str | None = None, **attributes: AttributeValue) -> Callable[[F], F]:
+    """
+    Decorator wrapping each call in a span, named after the function unless `name` is given.
+    DataFrame results have their row count recorded.
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with tracer.span(span_name, **attributes) as s:
+                    result = await func(*args, **kwargs)
+                    s.record_rows(result)
+                    return result
+
+            return cast(F, async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with tracer.span(span_name, **attributes) as s:
+                result = func(*args, **kwargs)
+                s.record_rows(result)
+                return result
+
+        return cast(F, wrapper)
+
+    return decorator
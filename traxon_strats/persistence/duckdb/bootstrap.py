@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Final
+
+from traxon_core.logs.structlog import logger
+from traxon_core.persistence.db.base import Database
+
+from traxon_strats.observability.tracing import traced
+from traxon_strats.persistence.repositories.interfaces import (
+    AccountsRepository,
+    RunJournalRepository,
+    YoloRepository,
+)
+from traxon_strats.validation.typecheck import typechecked
+
+# Bump whenever a repository changes its tables, so that workers rerun `init_tables` once
+SCHEMA_VERSION: Final[int] = 1
+
+TableRepository = AccountsRepository | RunJournalRepository | YoloRepository
+
+
+class DuckDbSchemaBootstrap:
+    """
+    Creates and migrates the repository tables once per process.
+
+    The applied version is recorded in the `schema_version` table, so a database that is already
+    at `SCHEMA_VERSION` is left untouched. Concurrent callers wait for the first one to finish.
+    """
+
+    _TABLE_NAME: Final[str] = "schema_version"
+
+    @typechecked
+    def __init__(
+        self,
+        database: Database,
+        repositories: Sequence[TableRepository],
+        version: int = SCHEMA_VERSION,
+    ) -> None:
+        self._database: Final[Database] = database
+        self._repositories: Final[tuple[TableRepository, ...]] = tuple(repositories)
+        self._version: Final[int] = version
+        self._lock: Final[asyncio.Lock] = asyncio.Lock()
+        self._done: bool = False
+        self._logger = logger.bind(component=self.__class__.__name__)
+
+    async def run(self) -> bool:
+        """Bring the tables to the current version. Returns whether any repository was initialized."""
+        if self._done:
+            return False
+        async with self._lock:
+            if self._done:
+                return False
+            migrated = await self._migrate()
+            self._done = True
+            return migrated
+
+    @traced("schema.bootstrap")
+    async def _migrate(self) -> bool:
+        create_table_sql = f"""
+            CREATE TABLE IF NOT EXISTS {self._TABLE_NAME} (
+                version INTEGER NOT NULL,
+                applied_at TIMESTAMP NOT NULL
+            )
+        """
+        self._database.execute(create_table_sql)
+        row = self._database.execute(f"SELECT max(version) FROM {self._TABLE_NAME}").fetchone()
+        current: int | None = row[0] if row is not None else None
+        if current is not None and current >= self._version:
+            self._logger.debug("schema up to date", version=current)
+            return False
+
+        for repository in self._repositories:
+            await repository.init_tables()
+        self._database.execute(
+            f"INSERT INTO {self._TABLE_NAME} (version, applied_at) VALUES (?, ?)",
+            [self._version, datetime.now()],
+        ).commit()
+        self._logger.info("schema initialized", previous=current, version=self._version)
+        return True
@@ -5,9 +5,12 @@ from typing import Final
 
 import pandera.polars as pa
 import polars as pl
-from beartype import beartype
 from traxon_core.persistence.db.base import Database
 
+from traxon_strats.observability.tracing import traced
+from traxon_strats.validation.schemas import validate
+from traxon_strats.validation.typecheck import typechecked
+
 
 class AccountsSchema(pa.DataFrameModel):
     name: pl.String
@@ -20,11 +23,12 @@ class DuckDbAccountsRepository:
 
     _TABLE_NAME: Final[str] = "accounts"
 
-    @beartype
+    @typechecked
     def __init__(self, database: Database) -> None:
         self._database: Final[Database] = database
 
-    @beartype
+    @traced()
+    @typechecked
     async def init_tables(self) -> None:
         """Initialize accounts table with primary key constraint."""
         create_table_sql = f"""
@@ -37,7 +41,8 @@ class DuckDbAccountsRepository:
         """
         self._database.execute(create_table_sql).commit()
 
-    @beartype
+    @traced()
+    @typechecked(hot=True)
     async def store_equity(self, name: str, equity: float) -> None:
         """Store equity for account at current timestamp."""
         if len(name) == 0:
@@ -52,7 +57,8 @@ class DuckDbAccountsRepository:
         updated_at = datetime.now()
         self._database.execute(insert_sql, [name, updated_at, float(equity)]).commit()
 
-    @beartype
+    @traced()
+    @typechecked(hot=True)
     async def get_latest_equity(self, name: str) -> float | None:
         """Get most recent equity for account."""
         if len(name) == 0:
@@ -72,7 +78,8 @@ class DuckDbAccountsRepository:
 
         return float(str(result[0]))
 
-    @beartype
+    @traced()
+    @typechecked
     async def get_equity_history(self, name: str) -> pl.DataFrame:
         """Get complete equity history for account."""
         if len(name) == 0:
@@ -89,5 +96,5 @@ class DuckDbAccountsRepository:
         if df.is_empty():
             return pl.DataFrame(schema=AccountsSchema.to_schema().columns)
 
-        validated_df = AccountsSchema.validate(df)
+        validated_df = validate(AccountsSchema, df, boundary=True)
         return validated_df
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import functools
+import io
+from typing import Final
+
+import polars as pl
+from traxon_core.persistence.db.base import Database
+
+from traxon_strats.observability.tracing import traced
+from traxon_strats.persistence.repositories.interfaces import RunJournalEntry
+from traxon_strats.robotwealth.yolo.data_schemas import TargetPortfolioSchema
+from traxon_strats.validation.schemas import validate
+from traxon_strats.validation.typecheck import typechecked
+
+
+@functools.cache
+def _target_portfolio_schema() -> dict[str, pl.DataType]:
+    """Polars schema of `TargetPortfolioSchema`, built on first read rather than at import."""
+    return {name: column.dtype.type for name, column in TargetPortfolioSchema.to_schema().columns.items()}
+
+
+class DuckDbRunJournalRepository:
+    """DuckDB implementation of the strategy run journal."""
+
+    _TABLE_NAME: Final[str] = "yolo_runs"
+
+    @typechecked
+    def __init__(self, database: Database) -> None:
+        self._database: Final[Database] = database
+
+    @traced()
+    @typechecked
+    async def init_tables(self) -> None:
+        create_table_sql = f"""
+            CREATE TABLE IF NOT EXISTS {self._TABLE_NAME} (
+                account VARCHAR NOT NULL,
+                fingerprint VARCHAR NOT NULL,
+                created_at TIMESTAMP NOT NULL,
+                has_orders BOOLEAN NOT NULL,
+                target_portfolio VARCHAR NOT NULL,
+                PRIMARY KEY (account, fingerprint)
+            )
+        """
+        self._database.execute(create_table_sql).commit()
+
+    @traced()
+    @typechecked(hot=True)
+    async def store_run(self, entry: RunJournalEntry) -> None:
+        """Store a run, replacing any previous run with the same account and fingerprint."""
+        if len(entry.account) == 0:
+            raise ValueError("Account name cannot be empty")
+
+        insert_sql = f"""
+            INSERT OR REPLACE INTO {self._TABLE_NAME}
+                (account, fingerprint, created_at, has_orders, target_portfolio)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        params = [
+            entry.account,
+            entry.fingerprint,
+            entry.created_at,
+            entry.has_orders,
+            entry.target_portfolio.write_json(),
+        ]
+        self._database.execute(insert_sql, params).commit()
+
+    @traced()
+    @typechecked(hot=True)
+    async def get_run(self, account: str, fingerprint: str) -> RunJournalEntry | None:
+        """Get the run recorded for the given inputs, if any."""
+        query_sql = f"""
+            SELECT account, fingerprint, created_at, has_orders, target_portfolio
+            FROM {self._TABLE_NAME}
+            WHERE account = ? AND fingerprint = ?
+        """
+        result = self._database.execute(query_sql, [account, fingerprint]).fetchone()
+        if result is None:
+            return None
+
+        target_portfolio = pl.read_json(io.StringIO(str(result[4])), schema=_target_portfolio_schema())
+        return RunJournalEntry(
+            account=str(result[0]),
+            fingerprint=str(result[1]),
+            created_at=result[2],
+            has_orders=bool(result[3]),
+            target_portfolio=validate(TargetPortfolioSchema, target_portfolio, boundary=True),
+        )
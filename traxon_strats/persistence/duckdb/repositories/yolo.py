@@ -4,15 +4,18 @@ from datetime import date, datetime, timedelta
 from typing import Final
 
 import polars as pl
-from beartype import beartype
 from traxon_core import dates
 from traxon_core.logs.structlog import logger
 from traxon_core.persistence.db.base import Database
 
+from traxon_strats.observability.tracing import traced
+from traxon_strats.persistence.parquet.archive import ParquetArchiveExporter
 from traxon_strats.robotwealth.yolo.data_schemas import (
     YoloVolatilitiesSchema,
     YoloWeightsSchema,
 )
+from traxon_strats.validation.schemas import validate
+from traxon_strats.validation.typecheck import typechecked
 
 
 class DuckDbYoloRepository:
@@ -20,12 +23,15 @@ class DuckDbYoloRepository:
 
     _WEIGHTS_TABLE_NAME: Final[str] = "weights"
     _VOLATILITIES_TABLE_NAME: Final[str] = "volatilities"
+    _RETENTION: Final[timedelta] = timedelta(days=365 * 2)
 
-    @beartype
-    def __init__(self, database: Database) -> None:
+    @typechecked
+    def __init__(self, database: Database, archive: ParquetArchiveExporter | None = None) -> None:
         self._database: Final[Database] = database
+        self._archive: Final[ParquetArchiveExporter | None] = archive
 
-    @beartype
+    @traced()
+    @typechecked
     async def init_tables(self) -> None:
         create_weights_sql = f"""
             CREATE TABLE IF NOT EXISTS {self._WEIGHTS_TABLE_NAME} (
@@ -50,9 +56,16 @@ class DuckDbYoloRepository:
 
         self._database.execute(create_weights_sql)
         self._database.execute(create_vol_sql)
+        self._database.commit()
 
-        # Delete old rows
-        cutoff_date: str = (datetime.now() - timedelta(days=365 * 2)).strftime(dates.date_format)
+    @traced()
+    @typechecked
+    async def prune_history(self) -> None:
+        """Archive and delete rows older than the retention period."""
+        cutoff = datetime.now() - self._RETENTION
+        if self._archive is not None:
+            await self._archive.export(end=cutoff.date())
+        cutoff_date: str = cutoff.strftime(dates.date_format)
         del_weights_sql = f"DELETE FROM {self._WEIGHTS_TABLE_NAME} WHERE updated_at < ?"
         del_vol_sql = f"DELETE FROM {self._VOLATILITIES_TABLE_NAME} WHERE updated_at < ?"
 
@@ -60,7 +73,8 @@ class DuckDbYoloRepository:
         self._database.execute(del_vol_sql, [cutoff_date])
         self._database.commit()
 
-    @beartype
+    @traced()
+    @typechecked
     async def store_weights(self, weights: pl.DataFrame) -> None:
         """Store weights DataFrame in DB."""
         with self._database.transaction():
@@ -69,7 +83,8 @@ class DuckDbYoloRepository:
                 f"insert or replace into {self._WEIGHTS_TABLE_NAME} select * from _weights_tmp",
             )
 
-    @beartype
+    @traced()
+    @typechecked
     async def store_volatilities(self, volatilities: pl.DataFrame) -> None:
         """Store volatilities DataFrame in DB."""
         with self._database.transaction():
@@ -78,7 +93,8 @@ class DuckDbYoloRepository:
                 f"insert or replace into {self._VOLATILITIES_TABLE_NAME} select * from _volatilities_tmp",
             )
 
-    @beartype
+    @traced()
+    @typechecked
     async def get_weights(self, _date: date) -> pl.DataFrame:
         """Retrieve weights for a given date."""
         query_sql = f"""
@@ -90,10 +106,11 @@ class DuckDbYoloRepository:
         if df.is_empty():
             return pl.DataFrame(schema=YoloWeightsSchema.to_schema().columns)
 
-        validated_df = YoloWeightsSchema.validate(df)
+        validated_df = validate(YoloWeightsSchema, df, boundary=True)
         return validated_df
 
-    @beartype
+    @traced()
+    @typechecked
     async def get_volatilities(self, _date: date) -> pl.DataFrame:
         """Retrieve volatilities for a given date."""
         query_sql = f"""
@@ -105,5 +122,5 @@ class DuckDbYoloRepository:
         if df.is_empty():
             return pl.DataFrame(schema=YoloVolatilitiesSchema.to_schema().columns)
 
-        validated_df = YoloVolatilitiesSchema.validate(df)
+        validated_df = validate(YoloVolatilitiesSchema, df, boundary=True)
         return validated_df
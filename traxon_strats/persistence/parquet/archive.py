@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+from typing import Final, NamedTuple
+
+import polars as pl
+from traxon_core import dates
+from traxon_core.logs.structlog import logger
+from traxon_core.persistence.db.base import Database
+
+from traxon_strats.validation.typecheck import typechecked
+
+PARTITION_COLUMN: Final[str] = "date"
+# Date each table has been exported up to, so that tables which are never pruned are not re-exported
+WATERMARKS_TABLE: Final[str] = "archive_watermarks"
+
+
+class ArchiveTable(NamedTuple):
+    """A DuckDB table exported to the archive, partitioned by the date of `date_column`."""
+
+    name: str
+    date_column: str
+
+
+YOLO_ARCHIVE_TABLES: Final[tuple[ArchiveTable, ...]] = (
+    ArchiveTable("weights", "updated_at"),
+    ArchiveTable("volatilities", "updated_at"),
+    ArchiveTable("accounts", "updated_at"),
+    ArchiveTable("yolo_runs", "created_at"),
+)
+
+
+class ParquetArchiveExporter:
+    """
+    Exports strategy tables from the DuckDB database to a hive-partitioned Parquet archive.
+
+    Layout: `<root>/<table>/date=YYYY-MM-DD/data.parquet`. Each partition is rewritten as a
+    whole, so exporting the same date range twice is idempotent.
+
+    Exports without a start date are incremental: each table resumes from its watermark in
+    `archive_watermarks`, which then moves up to the end date.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        database: Database,
+        root: Path,
+        tables: tuple[ArchiveTable, ...] = YOLO_ARCHIVE_TABLES,
+    ) -> None:
+        self._database: Final[Database] = database
+        self._root: Final[Path] = root
+        self._tables: Final[tuple[ArchiveTable, ...]] = tables
+        self._logger = logger.bind(component=self.__class__.__name__)
+
+    @typechecked
+    async def export(self, start: date | None = None, end: date | None = None) -> int:
+        """
+        Export rows dated within [start, end) for every table. Returns the number of rows written.
+
+        Without `start`, each table is exported from its watermark; explicit ranges (backfills)
+        leave the watermarks alone.
+        """
+        incremental = start is None
+        if incremental:
+            self._database.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {WATERMARKS_TABLE} (
+                    table_name VARCHAR PRIMARY KEY,
+                    exported_until DATE NOT NULL
+                )
+                """
+            )
+        total = 0
+        for table in self._tables:
+            table_start = self._watermark(table) if incremental else start
+            if table_start is not None and end is not None and table_start >= end:
+                continue
+            total += self._export_table(table, table_start, end)
+            if incremental and end is not None:
+                self._database.execute(
+                    f"INSERT OR REPLACE INTO {WATERMARKS_TABLE} (table_name, exported_until) VALUES (?, ?)",
+                    [table.name, end],
+                )
+        self._database.commit()
+        return total
+
+    def _watermark(self, table: ArchiveTable) -> date | None:
+        row = self._database.execute(
+            f"SELECT exported_until FROM {WATERMARKS_TABLE} WHERE table_name = ?", [table.name]
+        ).fetchone()
+        if row is None:
+            return None
+        exported_until: date = row[0]
+        return exported_until
+
+    def _export_table(self, table: ArchiveTable, start: date | None, end: date | None) -> int:
+        partition_expr = f"strftime(CAST({table.date_column} AS DATE), '%Y-%m-%d')"
+        filters: list[str] = []
+        params: list[str] = []
+        if start is not None:
+            filters.append(f"CAST({table.date_column} AS DATE) >= CAST(? AS DATE)")
+            params.append(start.strftime(dates.date_format))
+        if end is not None:
+            filters.append(f"CAST({table.date_column} AS DATE) < CAST(? AS DATE)")
+            params.append(end.strftime(dates.date_format))
+        where_sql = f"WHERE {' AND '.join(filters)}" if filters else ""
+
+        query_sql = f"""
+            SELECT *, {partition_expr} AS {PARTITION_COLUMN}
+            FROM {table.name}
+            {where_sql}
+        """
+        df: pl.DataFrame = self._database.execute(query_sql, params).fetchdf()
+        if df.is_empty():
+            return 0
+
+        for (partition,), part in df.partition_by(PARTITION_COLUMN, as_dict=True).items():
+            self._write_partition(table.name, str(partition), part.drop(PARTITION_COLUMN))
+
+        self._logger.info(f"archived {df.height} rows from {table.name}")
+        return df.height
+
+    def _write_partition(self, table: str, partition: str, df: pl.DataFrame) -> None:
+        partition_dir = self._root / table / f"{PARTITION_COLUMN}={partition}"
+        partition_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never observe a half-written partition
+        tmp_path = partition_dir / "data.parquet.tmp"
+        df.write_parquet(tmp_path, compression="zstd", statistics=True)
+        tmp_path.replace(partition_dir / "data.parquet")
+
+
+class ParquetArchiveReader:
+    """Reads the hive-partitioned Parquet archive written by `ParquetArchiveExporter`."""
+
+    @typechecked
+    def __init__(self, root: Path) -> None:
+        self._root: Final[Path] = root
+
+    @typechecked
+    def scan(self, table: str, start: date | None = None, end: date | None = None) -> pl.LazyFrame:
+        """
+        Lazily scan an archived table.
+
+        The date bounds are applied on the partition column, so Polars prunes whole partitions
+        and only reads the columns selected downstream.
+        """
+        lf = pl.scan_parquet(
+            self._root / table / "**" / "*.parquet",
+            hive_partitioning=True,
+            hive_schema={PARTITION_COLUMN: pl.Date},
+        )
+        if start is not None:
+            lf = lf.filter(pl.col(PARTITION_COLUMN) >= start)
+        if end is not None:
+            lf = lf.filter(pl.col(PARTITION_COLUMN) < end)
+        return lf
+
+    @typechecked
+    def duckdb_source(self, table: str) -> str:
+        """SQL table function reading an archived table, with hive partition pruning enabled."""
+        glob = (self._root / table / "*" / "*.parquet").as_posix()
+        return f"read_parquet('{glob}', hive_partitioning = true)"
+
+    @typechecked
+    def register_views(
+        self, database: Database, tables: tuple[ArchiveTable, ...] = YOLO_ARCHIVE_TABLES
+    ) -> None:
+        """Expose each archived table as an `archive_<table>` view in the given DuckDB database."""
+        for table in tables:
+            if not (self._root / table.name).exists():
+                continue
+            database.execute(
+                f"CREATE OR REPLACE VIEW archive_{table.name} AS SELECT * FROM {self.duckdb_source(table.name)}"
+            )
+        database.commit()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from datetime import date
-from typing import Protocol, runtime_checkable
+from datetime import date, datetime
+from typing import NamedTuple, Protocol, runtime_checkable
 
 import polars as pl
 
@@ -25,3 +25,22 @@ class YoloRepository(Protocol):
     async def store_volatilities(self, volatilities: pl.DataFrame) -> None: ...
     async def get_weights(self, _date: date) -> pl.DataFrame: ...
     async def get_volatilities(self, _date: date) -> pl.DataFrame: ...
+
+
+class RunJournalEntry(NamedTuple):
+    """A completed strategy run, keyed by the fingerprint of its inputs."""
+
+    account: str
+    fingerprint: str
+    created_at: datetime
+    has_orders: bool
+    target_portfolio: pl.DataFrame
+
+
+@runtime_checkable
+class RunJournalRepository(Protocol):
+    """Protocol for the strategy run journal."""
+
+    async def init_tables(self) -> None: ...
+    async def store_run(self, entry: RunJournalEntry) -> None: ...
+    async def get_run(self, account: str, fingerprint: str) -> RunJournalEntry | None: ...
@@ -1,15 +1,15 @@
-from typing import Any, Final, Self, TypeVar
+from typing import Any, Final, Self, TypeVar, cast
 
 import httpx
 import pandera.polars as pa
 import polars as pl
-from beartype import beartype
 from httpx_retry import AsyncRetryTransport, RetryPolicy
 from pandera.typing.polars import DataFrame
 from pydantic import BaseModel
 from traxon_core.errors import NonRecoverableError
 from traxon_core.logs.structlog import logger
 
+from traxon_strats.observability.log_payload import DeferredFrame, DeferredRepr
 from traxon_strats.robotwealth.api_client.errors import RWApiError, RwApiUnsuccessfulResponse
 from traxon_strats.robotwealth.api_client.models import (
     StatusResponse,
@@ -23,6 +23,8 @@ from traxon_strats.robotwealth.api_client.yolo import (
     YoloWeightsResponse,
     YoloWeightsSchema,
 )
+from traxon_strats.validation.schemas import validate
+from traxon_strats.validation.typecheck import typechecked
 
 JsonResponse = dict[str, object]
 ResponseT = TypeVar("ResponseT", bound=BaseModel)
@@ -36,7 +38,7 @@ class RWApiClient:
     _logger: Any
     _BASE_URL: Final[str] = "https://api.robotwealth.com/v1"
 
-    @beartype
+    @typechecked
     def __init__(self, api_key: str) -> None:
         self._api_key = api_key
         self._logger = logger.bind(component=self.__class__.__name__)
@@ -70,7 +72,7 @@ class RWApiClient:
 
         raise ValueError(f"Ticker {ticker} does not end with a known quote currency")
 
-    @beartype
+    @typechecked(hot=True)
     async def _get(self, path: str) -> JsonResponse:
         url: str = f"{self._BASE_URL}{path}"
         self._logger.debug("sending GET request", url=url)
@@ -78,7 +80,7 @@ class RWApiClient:
             response: httpx.Response = await self._client.get(url, timeout=10)
             response.raise_for_status()
             json_response: JsonResponse = response.json()
-            self._logger.debug("received response", url=url, res=json_response)
+            self._logger.debug("received response", url=url, res=DeferredRepr(json_response))
             return json_response
         except httpx.HTTPStatusError as e:
             api_err = RWApiError(f"HTTP error {e.response.status_code}: {e.response.text}")
@@ -89,7 +91,7 @@ class RWApiClient:
         except Exception as e:
             raise NonRecoverableError(RWApiError(f"Request failed: {e}")) from e
 
-    @beartype
+    @typechecked(hot=True)
     async def _fetch_and_validate(
         self,
         url: str,
@@ -111,7 +113,7 @@ class RWApiClient:
         else:
             df = pl.DataFrame(data)
 
-        self._logger.debug("raw df", df=df)
+        self._logger.debug("raw df", df=DeferredFrame(df))
 
         # Rename and sanitize columns
         if "ticker" in df.columns:
@@ -122,16 +124,16 @@ class RWApiClient:
         if "date" in df.columns:
             df = df.rename({"date": "updated_at"})
 
-        validated_df: DataFrame[SchemaT] = schema_type.validate(df)
-        self._logger.debug("validated df", df=validated_df)
+        validated_df = cast(DataFrame[SchemaT], validate(schema_type, df, boundary=True))
+        self._logger.debug("validated df", df=DeferredFrame(validated_df))
         return validated_df
 
-    @beartype
+    @typechecked
     async def get_status(self) -> StatusResponse:
         data = await self._get("/status")
         return StatusResponse.model_validate(data)
 
-    @beartype
+    @typechecked
     async def get_yolo_factors(self) -> DataFrame[YoloFactorsSchema]:
         return await self._fetch_and_validate(
             f"/yolo/factors?api_key={self._api_key}",
@@ -139,7 +141,7 @@ class RWApiClient:
             YoloFactorsSchema,
         )
 
-    @beartype
+    @typechecked
     async def get_yolo_weights(self) -> DataFrame[YoloWeightsSchema]:
         return await self._fetch_and_validate(
             f"/yolo/weights?api_key={self._api_key}",
@@ -147,7 +149,7 @@ class RWApiClient:
             YoloWeightsSchema,
         )
 
-    @beartype
+    @typechecked
     async def get_yolo_volatilities(self) -> DataFrame[YoloVolatilitiesSchema]:
         return await self._fetch_and_validate(
             f"/yolo/volatilities?api_key={self._api_key}",
@@ -155,7 +157,7 @@ class RWApiClient:
             YoloVolatilitiesSchema,
         )
 
-    @beartype
+    @typechecked
     async def get_rp_weights(self) -> DataFrame[RPWeightsSchema]:
         return await self._fetch_and_validate(
             f"/rpschteroids/weights?api_key={self._api_key}",
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Self
+from typing import Literal, Self
 
-from beartype import beartype
 from pydantic import BaseModel, ConfigDict, Field
 from traxon_core import config
 from traxon_core.config import CacheConfig, DatabaseConfig, ExchangeConfig, ExecutorConfig
 
+from traxon_strats.validation.typecheck import typechecked
 
-@beartype
+
+@typechecked
 class TemporalConfig(BaseModel):
     model_config = ConfigDict(frozen=True)
     host: str = Field(pattern=r"^(?:[a-zA-Z0-9\-\.]+|\d{1,3}(?:\.\d{1,3}){3})$", min_length=1)
@@ -18,16 +19,42 @@ class TemporalConfig(BaseModel):
     task_queue: str
 
 
-@beartype
+@typechecked
+class WorkerConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    max_concurrent_activities: int = Field(default=100, ge=1)
+    max_concurrent_workflow_tasks: int = Field(default=100, ge=2)
+    # Threads of the default executor, used by sync activities and blocking I/O such as payload spills
+    activity_executor_workers: int = Field(default=8, ge=1)
+    # Time given to in-flight activities to finish on shutdown before they are cancelled
+    graceful_shutdown_seconds: float = Field(default=60.0, ge=0.0)
+
+
+@typechecked
 class ServicesConfig(BaseModel):
     model_config = ConfigDict(frozen=True)
     temporal: TemporalConfig
     robot_wealth_api_key: str = Field(repr=True, min_length=1)
     database: DatabaseConfig
     cache: CacheConfig
+    archive_path: Path | None = None
+    # When set, every venue run is captured as a replayable bundle under this directory
+    capture_path: Path | None = None
+    # Spans are always logged; when set, they are also appended to this OTLP/JSON lines file
+    trace_path: Path | None = None
+    # When set, strategy runs are memory profiled and their reports written under this directory
+    memory_profile_path: Path | None = None
+    # When set, large Temporal payloads are stored here and only referenced from the workflow history
+    payload_blob_path: Path | None = None
+    worker: WorkerConfig = WorkerConfig()
+
+    @classmethod
+    def from_yaml(cls, path: str | Path) -> Self:
+        data = config.load_from_yaml(path)
+        return cls.model_validate(data)
 
 
-@beartype
+@typechecked
 class YoloSettingsConfig(BaseModel):
     model_config = ConfigDict(frozen=True)
     dry_run: bool
@@ -39,13 +66,16 @@ class YoloSettingsConfig(BaseModel):
     trend_factor: float = Field(ge=0.0, le=5.0)
     carry_factor: float = Field(ge=0.0, le=5.0)
     executor: ExecutorConfig
+    min_order_value: float = Field(default=0.0, ge=0.0)
+    # "incremental" applies executor fills to the pre-trade portfolio instead of refetching it
+    validation_mode: Literal["full", "incremental"] = "full"
 
 
-@beartype
+@typechecked
 class YoloConfig(BaseModel):
     model_config = ConfigDict(frozen=True)
     settings: YoloSettingsConfig
-    exchanges: list[ExchangeConfig] = Field(min_length=1, max_length=1)
+    exchanges: list[ExchangeConfig] = Field(min_length=1)
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> Self:
@@ -13,6 +13,7 @@ __all__ = [
     "YoloWeightsSchema",
     "TargetWeightsSchema",
     "TargetPortfolioSchema",
+    "OrderLegsSchema",
 ]
 
 
@@ -43,3 +44,33 @@ class TargetPortfolioSchema(pa.DataFrameModel):
     delta: pl.Float64
     delta_value: pl.Float64
     updated_at: pl.String
+
+
+class OrderLegsSchema(pa.DataFrameModel):
+    """
+    Order legs derived from the target portfolio.
+    One row per order to build; direction flips produce a `close` and an `open` leg.
+    """
+
+    symbol: pl.String
+    market_symbol: pl.String
+    leg: pl.String = pa.Field(isin=["close", "open", "trade"])
+    bucket: pl.String = pa.Field(isin=["updates", "new"])
+    side_size: pl.Float64
+    size: pl.Float64 = pa.Field(nullable=True)
+    price: pl.Float64 = pa.Field(nullable=True)
+    value: pl.Float64 = pa.Field(nullable=True)
+    notes: pl.String
+
+
+class FillsSchema(pa.DataFrameModel):
+    """
+    Fills reported by the order executor, one row per order.
+    `filled_size_signed` is null when the executor did not report a usable fill amount; `complete`
+    is false when the order may still fill (e.g. it is still open).
+    """
+
+    symbol: pl.String
+    filled_size_signed: pl.Float64 = pa.Field(nullable=True)
+    price: pl.Float64 = pa.Field(nullable=True)
+    complete: pl.Boolean
@@ -12,3 +12,7 @@ class YoloNoApiDataError(YoloStrategyError):
 
 class YoloApiDataNotUpToDateError(YoloStrategyError):
     """Raised when API data is not up-to-date."""
+
+
+class YoloInvalidAmountError(YoloStrategyError):
+    """Raised when a size, price or value can't be turned into an order amount."""
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Final, Required, TypedDict
+
+import polars as pl
+
+from traxon_strats.crypto.services.markets import MarketsIndex
+from traxon_strats.robotwealth.yolo.data_schemas import FillsSchema
+from traxon_strats.validation.schemas import validate
+
+# Order statuses after which the filled amount can no longer change
+_FINAL_STATUSES: Final[list[str]] = ["closed", "canceled", "cancelled", "expired", "rejected"]
+_SIDE_SIGNS: Final[dict[str, float]] = {"buy": 1.0, "sell": -1.0}
+_REPORT_SCHEMA: Final[dict[str, pl.DataType]] = {
+    "market_symbol": pl.String(),
+    "sign": pl.Float64(),
+    "filled": pl.Float64(),
+    "average": pl.Float64(),
+    "status": pl.String(),
+}
+
+
+class ExecutedOrder(TypedDict, total=False):
+    """
+    An order reported by `DefaultOrderExecutor.execute_orders`: a ccxt order structure, of which
+    only these fields are read. `filled` is in contracts on derivative markets.
+    """
+
+    symbol: Required[str]
+    side: str | None
+    filled: float | None
+    average: float | None
+    status: str | None
+
+
+ExecutionReport = list[ExecutedOrder]
+
+
+def fills_from_report(report: ExecutionReport, markets: MarketsIndex) -> pl.DataFrame | None:
+    """
+    Normalise the executor's report into a `FillsSchema` frame, with filled amounts in base currency.
+
+    Contract amounts are converted with the contract size of the order's market in `markets`. Fills
+    that cannot be converted (unknown market, or a derivative without a contract size) are left
+    without an amount, so `unresolved_symbols` reports them. Returns `None` for an empty report, in
+    which case the caller should refetch the whole portfolio.
+    """
+    if not report:
+        return None
+    orders = pl.DataFrame(
+        [
+            (
+                o["symbol"],
+                _SIDE_SIGNS.get(o.get("side") or ""),
+                o.get("filled"),
+                o.get("average"),
+                o.get("status"),
+            )
+            for o in report
+        ],
+        schema=_REPORT_SCHEMA,
+        orient="row",
+    )
+    # Spot amounts are already in base currency
+    contract_size = pl.when(pl.col("type") == "spot").then(pl.lit(1.0)).otherwise(pl.col("contract_size"))
+    fills = orders.join(
+        markets.frame.select("market_symbol", "type", "contract_size"),
+        on="market_symbol",
+        how="left",
+        maintain_order="left",
+    ).select(
+        # Perp symbols (`BASE/QUOTE:SETTLE`) fold into the same row as spot, like the portfolio frame
+        pl.col("market_symbol").str.split(":").list.first().alias("symbol"),
+        (pl.col("sign") * pl.col("filled") * contract_size).alias("filled_size_signed"),
+        pl.col("average").alias("price"),
+        pl.col("status").is_in(_FINAL_STATUSES).fill_null(False).alias("complete"),
+    )
+    return validate(FillsSchema, fills, boundary=True)
+
+
+def unresolved_symbols(fills: pl.DataFrame, expected: Iterable[str]) -> list[str]:
+    """Symbols that were expected to trade but have no fill report, or only ambiguous ones."""
+    ambiguous = fills.filter(~pl.col("complete") | pl.col("filled_size_signed").is_null())["symbol"]
+    reported = set(fills["symbol"].to_list())
+    return sorted({s for s in expected if s not in reported} | set(ambiguous.to_list()))
+
+
+def apply_fills(current_portfolio: pl.DataFrame, fills: pl.DataFrame) -> pl.DataFrame:
+    """
+    Apply fills to a frame built by `YoloPortfolioSizer.portfolio_frame`.
+
+    Symbols not held before the trade are added, priced at the average fill price when known.
+    Fills without a reported amount are ignored; use `unresolved_symbols` to find them.
+    """
+    deltas = (
+        fills.filter(pl.col("filled_size_signed").is_not_null())
+        .group_by("symbol")
+        .agg(
+            pl.col("filled_size_signed").sum().alias("filled"),
+            pl.col("price").mean().alias("fill_price"),
+        )
+    )
+    columns = current_portfolio.columns
+    df = current_portfolio.join(deltas, on="symbol", how="full", coalesce=True)
+    signed = pl.col("notional_size_signed").fill_null(0.0) + pl.col("filled").fill_null(0.0)
+    return (
+        df.with_columns(signed.alias("notional_size_signed"))
+        .with_columns(
+            pl.col("notional_size_signed").abs().alias("size"),
+            pl.coalesce("price", "fill_price").alias("price"),
+            pl.when(pl.col("notional_size_signed") < 0)
+            .then(pl.lit("short"))
+            .otherwise(pl.lit("long"))
+            .alias("side"),
+        )
+        .select(columns)
+    )
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import date
+from typing import Final
+
+import polars as pl
+
+from traxon_strats.robotwealth.yolo.config import YoloSettingsConfig
+
+# Rounding applied before hashing, so float noise below these resolutions doesn't change the fingerprint
+_EQUITY_DECIMALS: Final[int] = 2
+_SIZE_DECIMALS: Final[int] = 10
+
+
+def run_fingerprint(
+    run_date: date,
+    settings: YoloSettingsConfig,
+    equity: float,
+    current_portfolio: pl.DataFrame,
+) -> str:
+    """
+    Hash the inputs that determine a run's target portfolio and orders.
+
+    Covers the signal date, the strategy settings, the trading capital and the held sizes per
+    symbol (as built by `YoloPortfolioSizer.portfolio_frame`). Mark prices are left out, so a
+    rerun shortly after still matches even though prices have moved.
+    """
+    positions = (
+        current_portfolio.select("symbol", pl.col("notional_size_signed").round(_SIZE_DECIMALS))
+        .filter(pl.col("notional_size_signed") != 0)
+        .sort("symbol")
+        .rows()
+    )
+    payload = {
+        "date": run_date.isoformat(),
+        "settings": settings.model_dump(mode="json"),
+        "equity": round(equity, _EQUITY_DECIMALS),
+        "positions": positions,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from decimal import Decimal
+from typing import Final
+
+import polars as pl
+
+from traxon_strats.robotwealth.yolo.errors import YoloInvalidAmountError
+
+# 12 decimal places covers exchange amount/price precisions while leaving 26 integer digits
+DECIMAL_SCALE: Final[int] = 12
+DECIMAL_DTYPE: Final[pl.Decimal] = pl.Decimal(precision=38, scale=DECIMAL_SCALE)
+# Smallest magnitude that doesn't fit in `DECIMAL_DTYPE`
+DECIMAL_LIMIT: Final[Decimal] = Decimal(10) ** (38 - DECIMAL_SCALE)
+
+
+def _as_decimal(value: Decimal | float | int | None) -> Decimal | None:
+    if value is None or isinstance(value, Decimal):
+        return value
+    # Floats go through their shortest repr rather than their binary expansion
+    return Decimal(repr(value)) if isinstance(value, float) else Decimal(value)
+
+
+def _representable(value: Decimal | float | int | None) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float) and not math.isfinite(value):
+        return False
+    if isinstance(value, Decimal) and not value.is_finite():
+        return False
+    return abs(Decimal(value)) < DECIMAL_LIMIT
+
+
+def decimal_series(
+    name: str, values: Sequence[Decimal | float | int | None], symbols: Sequence[str] | None = None
+) -> pl.Series:
+    """
+    Build a fixed-point column straight from `Decimal` values, without going through float.
+
+    Raises `YoloInvalidAmountError`, naming the `symbols` of the offending rows when given, if any
+    value is not finite or too large for `DECIMAL_DTYPE`.
+    """
+    invalid = [i for i, v in enumerate(values) if not _representable(v)]
+    if invalid:
+        where = [symbols[i] if symbols is not None else f"row {i}" for i in invalid]
+        raise YoloInvalidAmountError(
+            f"{name} is not finite or out of the fixed-point range for {', '.join(where)}: "
+            f"{', '.join(str(values[i]) for i in invalid)}"
+        )
+    return pl.Series(name, [_as_decimal(v) for v in values], DECIMAL_DTYPE, strict=True)
+
+
+def to_decimal(df: pl.DataFrame, *columns: str) -> pl.DataFrame:
+    """
+    Cast float columns to fixed-point in a single pass.
+
+    The cast rounds to `DECIMAL_SCALE` places, so reading the columns back (e.g. with
+    `iter_rows`) yields `Decimal` objects free of binary float artefacts. Nulls stay null, any
+    other value that doesn't fit raises `YoloInvalidAmountError` naming the column and symbols.
+    """
+    limit = float(DECIMAL_LIMIT)
+    for column in columns:
+        invalid = df.filter(pl.col(column).is_not_null() & ~(pl.col(column).abs() < limit))
+        if not invalid.is_empty():
+            where = invalid["symbol"] if "symbol" in invalid.columns else pl.Series(range(invalid.height))
+            raise YoloInvalidAmountError(
+                f"{column} is not finite or out of the fixed-point range for "
+                f"{', '.join(map(str, where))}: {', '.join(map(str, invalid[column]))}"
+            )
+    return df.with_columns(pl.col(*columns).cast(DECIMAL_DTYPE, strict=True))
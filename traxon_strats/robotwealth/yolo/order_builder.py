@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from decimal import Decimal
+from typing import Final, NamedTuple
 
 import polars as pl
-from beartype import beartype
 from traxon_core.crypto.exchanges import Exchange
 from traxon_core.crypto.models import (
     BaseQuote,
@@ -15,109 +14,330 @@ from traxon_core.crypto.models import (
     OrderSizingStrategyFixed,
     OrdersToExecute,
     SizedOrderBuilder,
-    Symbol,
 )
 from traxon_core.crypto.utils import log_prefix
-from traxon_core.floats import float_is_zero
 from traxon_core.logs.structlog import logger
 
-from traxon_strats.robotwealth.yolo.data_schemas import TargetPortfolioSchema
+from traxon_strats.crypto.services.markets import (
+    SIGNIFICANT_DIGITS,
+    TICK_SIZE,
+    MarketMetadataCache,
+    MarketsIndex,
+)
+from traxon_strats.observability.log_payload import DeferredFrame
+from traxon_strats.observability.tracing import traced
+from traxon_strats.robotwealth.yolo.data_schemas import OrderLegsSchema, TargetPortfolioSchema
+from traxon_strats.robotwealth.yolo.errors import YoloInvalidAmountError
+from traxon_strats.robotwealth.yolo.fixed_point import to_decimal
+from traxon_strats.validation.schemas import validate
+from traxon_strats.validation.typecheck import typechecked
+
+# Tolerance used to treat a float column value as zero (mirrors `traxon_core.floats.float_is_zero`)
+_ZERO_TOLERANCE: Final[float] = 1e-9
+
+
+def _market_symbol(signed_size: pl.Expr) -> pl.Expr:
+    """Spot market (`BASE/QUOTE`) for long sizes, perp market (`BASE/QUOTE:QUOTE`) otherwise."""
+    base_quote = pl.col("symbol").str.split(":").list.first()
+    quote = base_quote.str.split("/").list.last()
+    return (
+        pl.when(signed_size > 0)
+        .then(base_quote)
+        .otherwise(pl.concat_str([base_quote, pl.lit(":"), quote]))
+        .alias("market_symbol")
+    )
+
+
+class OrderPlan(NamedTuple):
+    """Order legs planned from a target portfolio, before any order object is created."""
+
+    legs: pl.DataFrame
+    skipped: pl.DataFrame
+    missing_markets: list[str]
 
 
 class YoloOrderBuilder:
     """Builder for YOLO strategy orders."""
 
-    @beartype
+    @typechecked
+    def __init__(
+        self,
+        market_cache: MarketMetadataCache | None = None,
+        min_order_value: float = 0.0,
+    ) -> None:
+        self._market_cache = market_cache
+        self._min_order_value = min_order_value
+
+    @traced()
+    @typechecked(hot=True)
     async def prepare_orders(
         self,
         exchange: Exchange,
         target_portfolio: pl.DataFrame,
     ) -> OrdersToExecute:
         """Translate target portfolio into actionable orders."""
-        target_portfolio = TargetPortfolioSchema.validate(target_portfolio)
+        markets = await self.markets_index(exchange)
+        plan = self.plan_orders(target_portfolio, markets)
+        self.log_plan(exchange, plan)
+        return self._build_orders(exchange, plan.legs, markets)
 
-        updates_by_symbol: dict[BaseQuote, list[OrderBuilder]] = defaultdict(list)
-        new_by_symbol: dict[BaseQuote, list[OrderBuilder]] = defaultdict(list)
-
-        def _symbol_from_row(_symbol_str: str, _target_value: float) -> Symbol:
-            sym = Symbol(_symbol_str)
-            if _target_value > 0:
-                return Symbol(f"{sym.base}/{sym.quote}")
-            else:
-                return Symbol(f"{sym.base}/{sym.quote}:{sym.quote}")
-
-        for row in target_portfolio.to_dicts():
-            delta = float(row["delta"])
-
-            if float_is_zero(delta):
-                continue
+    @typechecked(hot=True)
+    def orders_for_legs(
+        self, exchange: Exchange, legs: pl.DataFrame, markets: MarketsIndex
+    ) -> OrdersToExecute:
+        """
+        Build the orders of legs planned by `plan_orders`, possibly in another process.
 
-            symbol_str = str(row["symbol"])
-            notional_size_signed = float(row["notional_size_signed"])
-            target_size_signed = float(row["target_size_signed"])
-            price = float(row["price"])
-            arrival_price = float(row["arrival_price"])
-            delta_value = float(row["delta_value"])
+        Market indices are resolved again against `markets`; legs whose market is gone are dropped.
+        """
+        legs, missing_markets = self._match_markets(
+            legs.drop("market_idx", strict=False), markets.frame.select("market_symbol", "market_idx")
+        )
+        for market_symbol in missing_markets:
+            logger.warning(f"{log_prefix(exchange, market_symbol)} - market not found")
+        return self._build_orders(exchange, legs, markets)
 
-            # The direction is flipping if the current and target portfolio have opposite signs
-            direction_flip: bool = notional_size_signed * target_size_signed < 0
+    @staticmethod
+    def log_plan(exchange: Exchange, plan: OrderPlan) -> None:
+        """Log the markets missing from the exchange and the legs that were skipped."""
+        for market_symbol in plan.missing_markets:
+            logger.warning(f"{log_prefix(exchange, market_symbol)} - market not found")
+        if not plan.skipped.is_empty():
+            logger.info(
+                f"{log_prefix(exchange, '')} - skipped {plan.skipped.height} orders",
+                df=DeferredFrame(
+                    plan.skipped.select(
+                        "market_symbol", "leg", "side_size", "value", "rounded_value", "reason"
+                    )
+                ),
+            )
 
-            if direction_flip:
-                # 1. Close current position
-                current_symbol = _symbol_from_row(symbol_str, notional_size_signed)
-                market_info = exchange.api.markets.get(current_symbol)
-                if market_info is None:
-                    logger.warning(f"{log_prefix(exchange, str(current_symbol))} - market not found")
-                    continue
+    @staticmethod
+    def _build_orders(exchange: Exchange, legs: pl.DataFrame, markets: MarketsIndex) -> OrdersToExecute:
+        # Sizes, prices and values reach the order builders as Decimal in one columnar cast
+        legs = to_decimal(legs, "size", "price", "value")
+        # Close legs are sized, the others are valued at the leg price
+        amount = pl.when(pl.col("leg") == "close").then(pl.col("size")).otherwise(pl.col("value"))
+        incomplete = legs.filter(amount.is_null() | pl.col("price").is_null())
+        if not incomplete.is_empty():
+            raise YoloInvalidAmountError(
+                f"missing order size, value or price for {', '.join(incomplete['market_symbol'])}"
+            )
 
-                order1 = SizedOrderBuilder(
+        updates_by_symbol: dict[BaseQuote, list[OrderBuilder]] = defaultdict(list)
+        new_by_symbol: dict[BaseQuote, list[OrderBuilder]] = defaultdict(list)
+        for leg in legs.iter_rows(named=True):
+            symbol, market_info = markets.at(leg["market_idx"])
+            order: OrderBuilder
+            if leg["leg"] == "close":
+                order = SizedOrderBuilder(
                     exchange_id=exchange.id,
                     market=market_info,
-                    side=OrderSide.from_size(-notional_size_signed),  # Opposite to the current position
-                    execution_type=OrderExecutionType.MAKER,
-                    size=Decimal(str(notional_size_signed)),  # Current position size
-                    notes="direction flip",
-                )
-                updates_by_symbol[current_symbol.base_quote].append(order1)
-
-                # 2. Open new position
-                target_symbol = _symbol_from_row(symbol_str, target_size_signed)
-                market_info2 = exchange.api.markets.get(target_symbol)
-                if market_info2 is None:
-                    logger.warning(f"{log_prefix(exchange, str(target_symbol))} - market not found")
-                    continue
-
-                order2 = DynamicSizeOrderBuilder(
-                    exchange_id=exchange.id,
-                    market=market_info2,
-                    side=OrderSide.from_size(target_size_signed),
+                    side=OrderSide.from_size(leg["side_size"]),
                     execution_type=OrderExecutionType.MAKER,
-                    sizing_strategy=OrderSizingStrategyFixed(Decimal(str(price))),
-                    value=Decimal(str(abs(row["target_value"]))),
-                    notes="direction flip",
+                    size=leg["size"],
+                    notes=leg["notes"],
                 )
-                new_by_symbol[target_symbol.base_quote].append(order2)
             else:
-                target_symbol = _symbol_from_row(symbol_str, target_size_signed)
-                market_info = exchange.api.markets.get(target_symbol)
-                if market_info is None:
-                    logger.warning(f"{log_prefix(exchange, str(target_symbol))} - market not found")
-                    continue
-
                 order = DynamicSizeOrderBuilder(
                     exchange_id=exchange.id,
                     market=market_info,
-                    side=OrderSide.from_size(delta),
+                    side=OrderSide.from_size(leg["side_size"]),
                     execution_type=OrderExecutionType.MAKER,
-                    sizing_strategy=OrderSizingStrategyFixed(Decimal(str(arrival_price))),
-                    value=Decimal(str(delta_value)),
-                    notes="",
+                    sizing_strategy=OrderSizingStrategyFixed(leg["price"]),
+                    value=leg["value"],
+                    notes=leg["notes"],
                 )
-                if float_is_zero(notional_size_signed):
-                    order.notes = "new"
-                    new_by_symbol[target_symbol.base_quote].append(order)
-                else:
-                    order.notes = "adjustment"
-                    updates_by_symbol[target_symbol.base_quote].append(order)
+            bucket = updates_by_symbol if leg["bucket"] == "updates" else new_by_symbol
+            bucket[symbol.base_quote].append(order)
 
         return OrdersToExecute(updates=updates_by_symbol, new=new_by_symbol)
+
+    @traced()
+    @typechecked(hot=True)
+    def plan_orders(self, target_portfolio: pl.DataFrame, markets: MarketsIndex) -> OrderPlan:
+        """Expand the target portfolio into tradable legs on `markets`, without touching the exchange."""
+        target_portfolio = validate(TargetPortfolioSchema, target_portfolio)
+
+        legs = self.build_order_legs(target_portfolio)
+        legs, missing_markets = self._match_markets(legs, markets.frame.select("market_symbol", "market_idx"))
+        legs, skipped = self.filter_tradable_legs(legs, markets.frame, self._min_order_value)
+        return OrderPlan(legs, skipped, missing_markets)
+
+    @typechecked(hot=True)
+    async def markets_index(self, exchange: Exchange) -> MarketsIndex:
+        """Markets of `exchange`, indexed once per session when a metadata cache is configured."""
+        if self._market_cache is None:
+            return MarketsIndex.from_exchange(exchange)
+        return await self._market_cache.get(exchange)
+
+    @staticmethod
+    def build_order_legs(target_portfolio: pl.DataFrame) -> pl.DataFrame:
+        """
+        Classify each target portfolio row and expand it into order legs, validated against
+        `OrderLegsSchema`.
+
+        - Rows with a zero delta are skipped.
+        - Direction flips close the current position (sized) and open the target one (dynamic).
+        - Otherwise a single dynamic leg is created, tagged as `new` or `adjustment`.
+        """
+        df = target_portfolio.with_row_index("row_nr").filter(pl.col("delta").abs() >= _ZERO_TOLERANCE)
+
+        current = pl.col("notional_size_signed")
+        target = pl.col("target_size_signed")
+        # The direction is flipping if the current and target portfolio have opposite signs
+        flips = df.filter(current * target < 0)
+        trades = df.filter(current * target >= 0)
+        no_value = pl.lit(None, dtype=pl.Float64)
+
+        close_legs = flips.select(
+            "row_nr",
+            "symbol",
+            _market_symbol(current),
+            pl.lit("close").alias("leg"),
+            pl.lit("updates").alias("bucket"),
+            (-current).alias("side_size"),  # Opposite to the current position
+            current.alias("size"),  # Current position size
+            pl.col("price"),
+            no_value.alias("value"),
+            pl.lit("direction flip").alias("notes"),
+        )
+        open_legs = flips.select(
+            "row_nr",
+            "symbol",
+            _market_symbol(target),
+            pl.lit("open").alias("leg"),
+            pl.lit("new").alias("bucket"),
+            target.alias("side_size"),
+            no_value.alias("size"),
+            pl.col("price"),
+            pl.col("target_value").abs().alias("value"),
+            pl.lit("direction flip").alias("notes"),
+        )
+        is_new = current.abs() < _ZERO_TOLERANCE
+        trade_legs = trades.select(
+            "row_nr",
+            "symbol",
+            _market_symbol(target),
+            pl.lit("trade").alias("leg"),
+            pl.when(is_new).then(pl.lit("new")).otherwise(pl.lit("updates")).alias("bucket"),
+            pl.col("delta").alias("side_size"),
+            no_value.alias("size"),
+            pl.col("arrival_price").alias("price"),
+            pl.col("delta_value").alias("value"),
+            pl.when(is_new).then(pl.lit("new")).otherwise(pl.lit("adjustment")).alias("notes"),
+        )
+
+        legs = (
+            pl.concat([close_legs, open_legs, trade_legs])
+            .with_columns(pl.col("leg").replace_strict({"close": 0, "open": 1, "trade": 1}).alias("_leg_nr"))
+            .sort("row_nr", "_leg_nr")
+            .drop("row_nr", "_leg_nr")
+        )
+        return validate(OrderLegsSchema, legs)
+
+    @staticmethod
+    def filter_tradable_legs(
+        legs: pl.DataFrame,
+        markets: pl.DataFrame,
+        min_order_value: float,
+    ) -> tuple[pl.DataFrame, pl.DataFrame]:
+        """
+        Split matched legs into tradable and skipped ones, before any order object is created.
+
+        Leg sizes are converted to contracts, rounded down to the market amount precision and
+        written back to the legs (`size` for close legs, `value` otherwise). Legs on inactive
+        markets, legs that round to zero and legs worth less than `min_order_value` are returned
+        in the second frame with a `reason` column, along with the open leg of any flip whose close
+        leg was skipped.
+        """
+        contract_size = pl.col("contract_size").fill_null(1.0)
+        precision = pl.col("precision_amount")
+        base_size = (
+            pl.when(pl.col("leg") == "close")
+            .then(pl.col("size").abs())
+            .otherwise(pl.col("value") / pl.col("price"))
+        )
+        contracts = base_size / contract_size
+        step = (
+            pl.when(pl.col("precision_mode") == TICK_SIZE)
+            .then(pl.when(precision > 0).then(precision))
+            .when(pl.col("precision_mode") == SIGNIFICANT_DIGITS)
+            .then(
+                pl.when((precision > 0) & (contracts > 0)).then(
+                    pl.lit(10.0).pow(contracts.log10().floor() - precision + 1)
+                )
+            )
+            .otherwise(pl.lit(10.0).pow(-precision))
+        )
+        # The epsilon keeps exact multiples (e.g. 0.3 / 0.1) from being floored one step down
+        rounded_contracts = (
+            pl.when(step.is_null()).then(contracts).otherwise((contracts / step + 1e-9).floor() * step)
+        )
+        rounded_size = rounded_contracts * contract_size
+
+        df = legs.join(
+            markets.select("market_idx", "active", "precision_amount", "precision_mode", "contract_size"),
+            on="market_idx",
+            how="left",
+            maintain_order="left",
+        ).with_columns(
+            pl.when(pl.col("leg") == "close")
+            .then(pl.col("size").sign() * rounded_size)
+            .otherwise(pl.col("size"))
+            .alias("size"),
+            pl.when(pl.col("leg") == "close")
+            .then(pl.col("value"))
+            .otherwise(rounded_size * pl.col("price"))
+            .alias("value"),
+            (rounded_size * pl.col("price")).alias("rounded_value"),
+        )
+        reason = (
+            pl.when(pl.col("active").not_())
+            .then(pl.lit("market inactive"))
+            .when(pl.col("rounded_value") <= 0)
+            .then(pl.lit("below amount precision"))
+            .when(pl.col("rounded_value") < min_order_value)
+            .then(pl.lit("below minimum order value"))
+            .otherwise(pl.lit(None, dtype=pl.String))
+        )
+        df = df.with_columns(reason.alias("reason")).drop(
+            "active", "precision_amount", "precision_mode", "contract_size"
+        )
+
+        # Opening the new side of a flip only makes sense if the current position is closed
+        unclosed = df.filter(pl.col("reason").is_not_null() & (pl.col("leg") == "close")).select("symbol")
+        if not unclosed.is_empty():
+            df = df.with_columns(
+                pl.when(
+                    pl.col("reason").is_null()
+                    & (pl.col("leg") == "open")
+                    & pl.col("symbol").is_in(unclosed["symbol"].implode())
+                )
+                .then(pl.lit("close leg skipped"))
+                .otherwise(pl.col("reason"))
+                .alias("reason")
+            )
+
+        skipped = df.filter(pl.col("reason").is_not_null())
+        tradable = df.filter(pl.col("reason").is_null()).drop("rounded_value", "reason")
+        return tradable, skipped
+
+    @staticmethod
+    def _match_markets(legs: pl.DataFrame, markets: pl.DataFrame) -> tuple[pl.DataFrame, list[str]]:
+        """
+        Attach the market index to each leg, dropping legs without a market on the exchange.
+        Also returns the missing market symbols.
+        """
+        legs = legs.join(markets, on="market_symbol", how="left", maintain_order="left")
+
+        missing = legs.filter(pl.col("market_idx").is_null())
+        if missing.is_empty():
+            return legs, []
+
+        # Opening the new side of a flip only makes sense if the current position can be closed
+        unclosable = missing.filter(pl.col("leg") == "close").select("symbol")
+        legs = legs.filter(pl.col("market_idx").is_not_null()).join(
+            unclosable, on="symbol", how="anti", maintain_order="left"
+        )
+        return legs, missing["market_symbol"].unique(maintain_order=True).to_list()
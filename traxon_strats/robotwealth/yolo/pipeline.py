@@ -10,6 +10,7 @@ from traxon_strats.robotwealth.api_client.yolo import YoloVolatilitiesSchema, Yo
 from traxon_strats.robotwealth.yolo.config import YoloSettingsConfig
 from traxon_strats.robotwealth.yolo.data_schemas import TargetWeightsSchema
 from traxon_strats.robotwealth.yolo.errors import YoloApiDataNotUpToDateError
+from traxon_strats.validation.schemas import validate
 
 
 @runtime_checkable
@@ -47,8 +48,8 @@ class RobotWealthSignalStep:
         if weights.is_empty() or volatilities.is_empty():
             raise YoloApiDataNotUpToDateError()
 
-        self.api_weights = YoloWeightsSchema.validate(weights)
-        self.api_volatilities = YoloVolatilitiesSchema.validate(volatilities)
+        self.api_weights = validate(YoloWeightsSchema, weights)
+        self.api_volatilities = validate(YoloVolatilitiesSchema, volatilities)
 
     async def run(self, weights: pl.DataFrame) -> pl.DataFrame:
         """
@@ -101,4 +102,4 @@ class RobotWealthSignalStep:
                 .alias("weight")
             )
 
-        return TargetWeightsSchema.validate(df)
+        return validate(TargetWeightsSchema, df)
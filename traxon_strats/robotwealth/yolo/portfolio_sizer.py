@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+from decimal import Decimal
+
 import polars as pl
 from traxon_core.crypto.models import Portfolio, PositionSide
 from traxon_core.floats import float_is_zero
 
+from traxon_strats.observability.tracing import traced
 from traxon_strats.robotwealth.yolo.config import YoloSettingsConfig
 from traxon_strats.robotwealth.yolo.data_schemas import (
     TargetPortfolioSchema,
     TargetWeightsSchema,
 )
+from traxon_strats.robotwealth.yolo.fixed_point import decimal_series
+from traxon_strats.validation.schemas import validate
 
 
 class YoloPortfolioSizer:
@@ -22,8 +27,18 @@ class YoloPortfolioSizer:
         settings: YoloSettingsConfig,
     ) -> pl.DataFrame:
         """Calculate target portfolio, sizes, and deltas (orders) from weights."""
-        target_weights = TargetWeightsSchema.validate(target_weights)
-        current_portfolio = self._portfolio_to_pl(portfolio)
+        return self.size_frame(equity, target_weights, self.portfolio_frame(portfolio), settings)
+
+    @traced()
+    def size_frame(
+        self,
+        equity: float,
+        target_weights: pl.DataFrame,
+        current_portfolio: pl.DataFrame,
+        settings: YoloSettingsConfig,
+    ) -> pl.DataFrame:
+        """Like `size_portfolio`, but takes the current portfolio as built by `portfolio_frame`."""
+        target_weights = validate(TargetWeightsSchema, target_weights)
 
         # Merge weights and current portfolio
         df = target_weights.join(current_portfolio, on="symbol", how="left")
@@ -66,7 +81,8 @@ class YoloPortfolioSizer:
 
         df = df.with_columns([(pl.col("delta").abs() * pl.col("price")).alias("delta_value")])
 
-        return TargetPortfolioSchema.validate(
+        return validate(
+            TargetPortfolioSchema,
             df.select(
                 [
                     "symbol",
@@ -79,56 +95,48 @@ class YoloPortfolioSizer:
                     "delta",
                     "delta_value",
                 ]
-            )
+            ),
         )
 
-    def _portfolio_to_pl(self, portfolio: Portfolio) -> pl.DataFrame:
-        data = []
+    def portfolio_frame(self, portfolio: Portfolio) -> pl.DataFrame:
+        """Aggregate balances and perp positions into one row per `BASE/QUOTE` symbol."""
+        symbols: list[str] = []
+        sides: list[str] = []
+        prices: list[Decimal] = []
+        sizes: list[Decimal] = []
+        notionals: list[Decimal] = []
         for bal in portfolio.balances:
-            data.append(
-                {
-                    "symbol": f"{bal.symbol.base}/{bal.symbol.quote}",
-                    "side": "long",
-                    "price": float(bal.current_price),
-                    "size": float(bal.size),
-                    "notional_size_signed": float(bal.notional_size),
-                }
-            )
+            symbols.append(f"{bal.symbol.base}/{bal.symbol.quote}")
+            sides.append("long")
+            prices.append(bal.current_price)
+            sizes.append(bal.size)
+            notionals.append(bal.notional_size)
         for pos in portfolio.perps:
-            signed_size = (
-                float(pos.notional_size) if pos.side == PositionSide.LONG else -float(pos.notional_size)
-            )
-            data.append(
-                {
-                    "symbol": f"{pos.symbol.base}/{pos.symbol.quote}",
-                    "side": pos.side.value,
-                    "price": float(pos.current_price),
-                    "size": float(pos.size),
-                    "notional_size_signed": signed_size,
-                }
-            )
-
-        if not data:
-            return pl.DataFrame(
-                schema={
-                    "symbol": pl.String,
-                    "side": pl.String,
-                    "price": pl.Float64,
-                    "size": pl.Float64,
-                    "notional_size_signed": pl.Float64,
-                }
-            )
-
-        df = pl.DataFrame(data)
+            symbols.append(f"{pos.symbol.base}/{pos.symbol.quote}")
+            sides.append(pos.side.value)
+            prices.append(pos.current_price)
+            sizes.append(pos.size)
+            notionals.append(pos.notional_size if pos.side == PositionSide.LONG else -pos.notional_size)
+
+        # Balances are aggregated in fixed-point and converted to float once for the sizing math
+        df = pl.DataFrame(
+            [
+                pl.Series("symbol", symbols, pl.String),
+                pl.Series("side", sides, pl.String),
+                decimal_series("price", prices, symbols),
+                decimal_series("size", sizes, symbols),
+                decimal_series("notional_size_signed", notionals, symbols),
+            ]
+        )
         df = df.group_by("symbol").agg(
             [
                 pl.col("notional_size_signed").sum(),
                 pl.col("size").sum(),
-                pl.col("price").mean(),
+                pl.col("price").cast(pl.Float64).mean(),
                 pl.col("side").first(),
             ]
         )
-        return df
+        return df.with_columns(pl.col("notional_size_signed", "size").cast(pl.Float64))
 
     @staticmethod
     def calculate_position_size(
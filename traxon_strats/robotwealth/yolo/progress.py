@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import date
+from typing import Any, Literal, NamedTuple
+
+# Venue phases, in order. A venue is only resumed from `executed` (validate only) or `done` (skip).
+VenuePhase = Literal["setup", "sized", "executing", "executed", "done"]
+ProgressCallback = Callable[["RunCheckpoint"], None]
+
+
+class VenueProgress(NamedTuple):
+    phase: VenuePhase
+    orders_submitted: int = 0
+    fills_seen: int = 0
+
+
+class RunCheckpoint:
+    """
+    Progress of a strategy run, per exchange id.
+
+    `YoloStrategy.run_strategy` reports it after each venue phase and accepts a previous one to
+    resume a retried run: venues that are `done` are skipped and venues whose orders were
+    `executed` are validated without trading again. It serialises to plain JSON types, so it can
+    be carried as activity heartbeat details.
+    """
+
+    __slots__ = ("_on_change", "run_date", "venues")
+
+    def __init__(
+        self,
+        run_date: date,
+        venues: Mapping[str, VenueProgress] | None = None,
+        on_change: ProgressCallback | None = None,
+    ) -> None:
+        self.run_date: date = run_date
+        self.venues: dict[str, VenueProgress] = dict(venues or {})
+        self._on_change: ProgressCallback | None = on_change
+
+    def phase(self, exchange_id: str) -> VenuePhase | None:
+        progress = self.venues.get(exchange_id)
+        return progress.phase if progress is not None else None
+
+    def update(
+        self,
+        exchange_id: str,
+        phase: VenuePhase,
+        orders_submitted: int | None = None,
+        fills_seen: int | None = None,
+    ) -> None:
+        """Move a venue to `phase`, keeping the counts that are not given, and notify the callback."""
+        current = self.venues.get(exchange_id, VenueProgress(phase))
+        self.venues[exchange_id] = VenueProgress(
+            phase,
+            current.orders_submitted if orders_submitted is None else orders_submitted,
+            current.fills_seen if fills_seen is None else fills_seen,
+        )
+        if self._on_change is not None:
+            self._on_change(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "run_date": self.run_date.isoformat(),
+            "venues": {exchange_id: progress._asdict() for exchange_id, progress in self.venues.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], on_change: ProgressCallback | None = None) -> RunCheckpoint:
+        venues = {exchange_id: VenueProgress(**progress) for exchange_id, progress in data["venues"].items()}
+        return cls(date.fromisoformat(data["run_date"]), venues, on_change)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Final, NamedTuple
+
+import polars as pl
+from traxon_core.logs.structlog import logger
+
+from traxon_strats.crypto.services.markets import MarketsIndex
+from traxon_strats.robotwealth.yolo.config import YoloSettingsConfig
+from traxon_strats.robotwealth.yolo.order_builder import YoloOrderBuilder
+from traxon_strats.robotwealth.yolo.pipeline import RobotWealthSignalStep
+from traxon_strats.robotwealth.yolo.portfolio_sizer import YoloPortfolioSizer
+from traxon_strats.validation.typecheck import typechecked
+
+BUNDLE_VERSION: Final[int] = 2
+_MANIFEST: Final[str] = "manifest.json"
+_MARKETS: Final[str] = "markets.arrow"
+# Frames stored in a bundle, one Arrow IPC file each
+_FRAMES: Final[tuple[str, ...]] = (
+    "weights",
+    "volatilities",
+    "current_portfolio",
+    "target_weights",
+    "target_portfolio",
+    "orders",
+)
+
+
+class RunBundle(NamedTuple):
+    """
+    Inputs and outputs of a single venue run, as captured by `YoloStrategy`.
+
+    Inputs are what the compute path reads from the outside world: the stored signals, the
+    trading capital, the current portfolio (as built by `YoloPortfolioSizer.portfolio_frame`) and
+    the exchange markets. Outputs are the target weights, target portfolio and order legs.
+    """
+
+    exchange_id: str
+    run_date: date
+    captured_at: datetime
+    settings: YoloSettingsConfig
+    equity: float
+    weights: pl.DataFrame
+    volatilities: pl.DataFrame
+    current_portfolio: pl.DataFrame
+    markets: MarketsIndex
+    target_weights: pl.DataFrame
+    target_portfolio: pl.DataFrame
+    orders: pl.DataFrame
+
+    def write(self, path: Path) -> None:
+        """Write the bundle as a directory of zstd-compressed Arrow IPC files plus a manifest."""
+        path.mkdir(parents=True, exist_ok=True)
+        for name in _FRAMES:
+            getattr(self, name).write_ipc(path / f"{name}.arrow", compression="zstd")
+        self.markets.write_ipc(path / _MARKETS)
+        manifest = {
+            "version": BUNDLE_VERSION,
+            "exchange_id": self.exchange_id,
+            "run_date": self.run_date.isoformat(),
+            "captured_at": self.captured_at.isoformat(),
+            "equity": self.equity,
+            "settings": self.settings.model_dump(mode="json"),
+        }
+        # The manifest goes last, so a bundle without one is known to be incomplete
+        (path / _MANIFEST).write_text(json.dumps(manifest, indent=2))
+
+    @classmethod
+    def read(cls, path: Path) -> RunBundle:
+        manifest: dict[str, Any] = json.loads((path / _MANIFEST).read_text())
+        if manifest["version"] != BUNDLE_VERSION:
+            raise ValueError(f"unsupported bundle version {manifest['version']} in {path}")
+        frames = {name: pl.read_ipc(path / f"{name}.arrow", memory_map=False) for name in _FRAMES}
+        return cls(
+            exchange_id=manifest["exchange_id"],
+            run_date=date.fromisoformat(manifest["run_date"]),
+            captured_at=datetime.fromisoformat(manifest["captured_at"]),
+            settings=YoloSettingsConfig.model_validate(manifest["settings"]),
+            equity=float(manifest["equity"]),
+            markets=MarketsIndex.read_ipc(path / _MARKETS),
+            **frames,
+        )
+
+
+class ReplayResult(NamedTuple):
+    target_weights: pl.DataFrame
+    target_portfolio: pl.DataFrame
+    orders: pl.DataFrame
+
+    def mismatches(self, bundle: RunBundle) -> list[str]:
+        """Names of the outputs that differ from the ones captured in `bundle`."""
+        return [name for name in self._fields if not getattr(self, name).equals(getattr(bundle, name))]
+
+
+class InMemoryYoloRepository:
+    """Read-only `YoloRepository` serving fixed signals, such as the ones stored in a bundle."""
+
+    def __init__(self, weights: pl.DataFrame, volatilities: pl.DataFrame) -> None:
+        self._weights: Final[pl.DataFrame] = weights
+        self._volatilities: Final[pl.DataFrame] = volatilities
+
+    async def init_tables(self) -> None:
+        return None
+
+    async def store_weights(self, weights: pl.DataFrame) -> None:
+        return None
+
+    async def store_volatilities(self, volatilities: pl.DataFrame) -> None:
+        return None
+
+    async def get_weights(self, _date: date) -> pl.DataFrame:
+        return self._weights
+
+    async def get_volatilities(self, _date: date) -> pl.DataFrame:
+        return self._volatilities
+
+
+@typechecked
+async def replay(bundle: RunBundle) -> ReplayResult:
+    """Run the bundle inputs through the signal pipeline, sizer and order planner, without any I/O."""
+    step = RobotWealthSignalStep(
+        bundle.settings, InMemoryYoloRepository(bundle.weights, bundle.volatilities), bundle.run_date
+    )
+    await step.setup()
+    target_weights = await step.run(pl.DataFrame())
+
+    target_portfolio = YoloPortfolioSizer().size_frame(
+        bundle.equity, target_weights, bundle.current_portfolio, bundle.settings
+    )
+    order_builder = YoloOrderBuilder(min_order_value=bundle.settings.min_order_value)
+    plan = order_builder.plan_orders(target_portfolio, bundle.markets)
+    return ReplayResult(target_weights, target_portfolio, plan.legs)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Replay captured bundles and report the ones whose outputs no longer match."""
+    parser = argparse.ArgumentParser(description="Replay captured YOLO runs offline.")
+    parser.add_argument("bundles", nargs="+", type=Path, help="bundle directories")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for path in args.bundles:
+        bundle = RunBundle.read(path)
+        mismatches = asyncio.run(replay(bundle)).mismatches(bundle)
+        if mismatches:
+            failed += 1
+            logger.warning(f"replay of {path} differs from capture", outputs=mismatches)
+        else:
+            logger.info(f"replay of {path} matches capture")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import polars as pl
+
+# Payloads passed between the fine-grained workflow activities. They are dataclasses, which the
+# Temporal data converter decodes from type hints. Frames travel as `FrameData`, which only
+# imports polars when a frame is encoded or decoded, so this module stays light for the workflow.
+
+
+class FrameData:
+    """
+    A DataFrame in transit, held as zstd-compressed Arrow IPC bytes.
+
+    Decoding is deferred to `frame()`: the workflow passes frames from one activity to the next
+    without ever materialising them. See `traxon_strats.flows.payloads` for the Temporal codec.
+    """
+
+    __slots__ = ("ipc",)
+
+    def __init__(self, ipc: bytes) -> None:
+        self.ipc: bytes = ipc
+
+    @classmethod
+    def of(cls, frame: pl.DataFrame) -> FrameData:
+        buffer = io.BytesIO()
+        frame.write_ipc(buffer, compression="zstd")
+        return cls(buffer.getvalue())
+
+    def frame(self) -> pl.DataFrame:
+        import polars as pl
+
+        return pl.read_ipc(io.BytesIO(self.ipc), memory_map=False)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FrameData) and other.ipc == self.ipc
+
+    def __hash__(self) -> int:
+        return hash(self.ipc)
+
+    def __repr__(self) -> str:
+        return f"FrameData({len(self.ipc)} bytes)"
+
+
+@dataclass(frozen=True)
+class VenueTarget:
+    """Sized target of one exchange, as produced by `YoloStrategy.compute_targets`."""
+
+    venue: str
+    # Date of the signals the target was sized from, shared by the later stages of the run
+    run_date: date
+    equity: float
+    # Fingerprint of the run inputs, if journaling is enabled
+    fingerprint: str | None
+    # The inputs are unchanged since a run with nothing to trade
+    skip: bool
+    target_weights: FrameData
+    current_portfolio: FrameData
+    target_portfolio: FrameData
+
+
+@dataclass(frozen=True)
+class OrderBatch:
+    """Order legs of one exchange and symbol, executed as a unit."""
+
+    venue: str
+    symbol: str
+    legs: FrameData
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    venue: str
+    symbol: str
+    orders_submitted: int
+    # `FillsSchema` frame, or `None` when the executor reported no usable fills
+    fills: FrameData | None
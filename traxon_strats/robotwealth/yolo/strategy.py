@@ -1,19 +1,33 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Final
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime
+from typing import Any, Final, NamedTuple, Protocol
 
 import polars as pl
-from beartype import beartype
 from traxon_core import dates
+from traxon_core.config import ExchangeConfig, ExecutorConfig
 from traxon_core.crypto.data_fetchers.portfolio import PortfolioFetcher
 from traxon_core.crypto.exchanges import Exchange, ExchangeFactory
+from traxon_core.crypto.models import OrdersToExecute
 from traxon_core.crypto.order_executor import DefaultOrderExecutor
+from traxon_core.crypto.utils import log_prefix
 from traxon_core.logs.notifiers import notifier
 from traxon_core.logs.structlog import logger
 
 from traxon_strats.crypto.services.equity import EquityService
-from traxon_strats.persistence.repositories.interfaces import YoloRepository
+from traxon_strats.crypto.services.exchange_pool import CreateExchanges, ExchangePool
+from traxon_strats.crypto.services.markets import MarketMetadataCache
+from traxon_strats.observability.log_payload import DeferredFrame
+from traxon_strats.observability.memory import memory_checkpoint, profiled
+from traxon_strats.observability.tracing import current_span, span, traced
+from traxon_strats.persistence.repositories.interfaces import (
+    RunJournalEntry,
+    RunJournalRepository,
+    YoloRepository,
+)
 from traxon_strats.robotwealth.api_client import RWApiClient
 from traxon_strats.robotwealth.yolo.config import ServicesConfig, YoloConfig
 from traxon_strats.robotwealth.yolo.errors import (
@@ -21,9 +35,52 @@ from traxon_strats.robotwealth.yolo.errors import (
     YoloNoApiDataError,
     YoloStrategyError,
 )
+from traxon_strats.robotwealth.yolo.fills import (
+    ExecutionReport,
+    apply_fills,
+    fills_from_report,
+    unresolved_symbols,
+)
+from traxon_strats.robotwealth.yolo.fingerprint import run_fingerprint
 from traxon_strats.robotwealth.yolo.order_builder import YoloOrderBuilder
 from traxon_strats.robotwealth.yolo.pipeline import RobotWealthSignalStep, SignalStep
 from traxon_strats.robotwealth.yolo.portfolio_sizer import YoloPortfolioSizer
+from traxon_strats.robotwealth.yolo.progress import ProgressCallback, RunCheckpoint
+from traxon_strats.robotwealth.yolo.replay import RunBundle
+from traxon_strats.robotwealth.yolo.stages import BatchResult, FrameData, OrderBatch, VenueTarget
+from traxon_strats.validation.typecheck import typechecked
+
+
+class OrderExecutor(Protocol):
+    """Executes orders on a set of exchanges, like `DefaultOrderExecutor`."""
+
+    async def execute_orders(self, exchanges: list[Exchange], orders: OrdersToExecute) -> ExecutionReport: ...
+
+
+OrderExecutorFactory = Callable[[ExecutorConfig], OrderExecutor]
+
+
+class _VenueSetup(NamedTuple):
+    equity: float
+    current_portfolio: pl.DataFrame
+    # Fingerprint of the run inputs and the journaled run that matches it, if journaling is enabled
+    fingerprint: str | None
+    previous_run: RunJournalEntry | None
+
+
+class _BatchSession:
+    """Exchange session shared by the order batches of a venue that execute at the same time."""
+
+    __slots__ = ("exchange", "failed", "users")
+
+    def __init__(self, exchange: Exchange) -> None:
+        self.exchange: Final[Exchange] = exchange
+        self.users = 0
+        self.failed = False
+
+
+def _order_count(orders: OrdersToExecute) -> int:
+    return sum(len(o) for bucket in (orders.updates, orders.new) for o in bucket.values())
 
 
 class YoloStrategy:
@@ -33,14 +90,20 @@ class YoloStrategy:
         "_portfolio_fetcher",
         "_yolo_repository",
         "_equity_service",
+        "_exchange_pool",
+        "_create_exchanges",
+        "_order_executor",
+        "_run_journal",
         "_calculator",
         "_order_builder",
         "_pipeline",
         "_portfolio_sizer",
+        "_batch_sessions",
+        "_batch_session_locks",
         "_logger",
     )
 
-    @beartype
+    @typechecked
     def __init__(
         self,
         config: YoloConfig,
@@ -49,30 +112,41 @@ class YoloStrategy:
         yolo_repository: YoloRepository,
         equity_service: EquityService,
         pipeline: list[SignalStep] | None = None,
+        market_cache: MarketMetadataCache | None = None,
+        exchange_pool: ExchangePool | None = None,
+        run_journal: RunJournalRepository | None = None,
+        create_exchanges: CreateExchanges | None = None,
+        order_executor: OrderExecutorFactory | None = None,
     ) -> None:
         self._config: Final[YoloConfig] = config
         self._services_config: Final[ServicesConfig] = services_config
         self._portfolio_fetcher: Final[PortfolioFetcher] = portfolio_fetcher
         self._yolo_repository = yolo_repository
         self._equity_service = equity_service
-        self._order_builder = YoloOrderBuilder()
+        self._exchange_pool = exchange_pool
+        # Exchanges and executors are created through these when given, so that runs can target a fake venue
+        self._create_exchanges: Final[CreateExchanges | None] = create_exchanges
+        self._order_executor: Final[OrderExecutorFactory | None] = order_executor
+        self._run_journal = run_journal
+        self._order_builder = YoloOrderBuilder(market_cache, config.settings.min_order_value)
         self._portfolio_sizer = YoloPortfolioSizer()
-        self._pipeline: list[SignalStep] = (
-            [RobotWealthSignalStep(config.settings, yolo_repository, datetime.today())]
-            if pipeline is None or not pipeline
-            else pipeline
-        )
+        # Without a custom pipeline, the RobotWealth step is built per run for the date of that run
+        self._pipeline: list[SignalStep] | None = pipeline or None
+        self._batch_sessions: dict[str, _BatchSession] = {}
+        self._batch_session_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._logger = logger.bind(component=self.__class__.__name__)
 
-    @beartype
+    @profiled("fetch_strategy_params")
+    @typechecked
     async def fetch_strategy_params(self) -> None:
         """Fetch weights and volatilities from RWApi, store in DB."""
-        today = datetime.today()
-        today_str = datetime.today().strftime(dates.date_format)
+        today = self._run_date()
+        today_str = today.strftime(dates.date_format)
 
         # Return early if we already have today's data
         weights_pl = await self._yolo_repository.get_weights(today)
         volatilities_pl = await self._yolo_repository.get_volatilities(today)
+        memory_checkpoint("repository", weights=weights_pl, volatilities=volatilities_pl)
         if not weights_pl.is_empty() and not volatilities_pl.is_empty():
             self._logger.info("yolo strategy params already in DB for today")
             return None
@@ -81,7 +155,7 @@ class YoloStrategy:
         async with RWApiClient(self._services_config.robot_wealth_api_key) as client:
             # Fetch weights
             weights = await client.get_yolo_weights()
-            self._logger.info("yolo weights:", df=weights.sort("symbol"))
+            self._logger.info("yolo weights:", df=DeferredFrame(weights, sort_by="symbol"))
             if weights.is_empty():
                 self._logger.warning("yolo weights are empty")
                 raise YoloNoApiDataError()
@@ -90,10 +164,11 @@ class YoloStrategy:
                 self._logger.warning("yolo weights are not from today")
                 raise YoloApiDataNotUpToDateError()
             await self._yolo_repository.store_weights(weights)
+            memory_checkpoint("weights", weights=weights)
 
             # Fetch volatilities
             volatilities = await client.get_yolo_volatilities()
-            self._logger.info("yolo volatilities:", df=volatilities.sort("symbol"))
+            self._logger.info("yolo volatilities:", df=DeferredFrame(volatilities, sort_by="symbol"))
             if volatilities.is_empty():
                 self._logger.warning("yolo weights or volatilities are empty")
                 raise YoloNoApiDataError()
@@ -101,93 +176,665 @@ class YoloStrategy:
                 self._logger.warning("yolo volatilities are not from today")
                 raise YoloApiDataNotUpToDateError()
             await self._yolo_repository.store_volatilities(volatilities)
+            memory_checkpoint("volatilities", volatilities=volatilities)
 
         self._logger.info(f"fetched yolo strategy params for {today_str}")
         return None
 
-    @beartype
-    async def run_strategy(self) -> None:
-        exchange = await self._get_exchange()
+    @traced("yolo.warm_up")
+    @typechecked
+    async def warm_up(self) -> None:
+        """
+        Open the exchange sessions and load their markets ahead of a scheduled run. Only useful
+        with an exchange pool, which keeps the sessions warm until the run takes them.
+        """
+        exchanges = await self._get_exchanges()
+        failed = True
+        try:
+            await asyncio.gather(*(self._order_builder.markets_index(e) for e in exchanges))
+            failed = False
+        finally:
+            await self._release_exchanges(exchanges, failed)
+        self._logger.info(f"warmed up {len(exchanges)} exchanges")
+
+    @traced("yolo.run_strategy")
+    @profiled("run_strategy")
+    @typechecked
+    async def run_strategy(
+        self,
+        resume_from: RunCheckpoint | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> None:
+        """
+        Run the strategy on every configured exchange.
+
+        Target weights are computed once and shared. Each venue is then sized, traded and
+        validated concurrently; a failing venue does not stop the others, but the run raises
+        `YoloStrategyError` once all venues are done.
+
+        Progress is reported to `on_progress` after each venue phase. Given the checkpoint of an
+        interrupted run of the same day, venues already done are skipped and venues whose orders
+        were executed are only validated.
+        """
+        run_date = self._run_date()
+        checkpoint = self._checkpoint(run_date, resume_from, on_progress)
+        # The signal pipeline only depends on the repository, so it runs while the exchanges are set up
+        pipeline_task = asyncio.create_task(self._compute_target_weights(run_date))
+        try:
+            with span("yolo.exchanges"):
+                exchanges = await self._get_exchanges()
+        except BaseException:
+            pipeline_task.cancel()
+            raise
+        memory_checkpoint("exchanges")
+
+        done = [e for e in exchanges if checkpoint.phase(f"{e.id}") == "done"]
+        if done:
+            self._logger.info("resuming run, skipping completed exchanges", exchanges=[e.id for e in done])
+            await self._release_exchanges(done, failed=False)
+            exchanges = [e for e in exchanges if checkpoint.phase(f"{e.id}") != "done"]
+            if not exchanges:
+                pipeline_task.cancel()
+                return None
+
         try:
-            # Get account equity
-            account_equity = await exchange.fetch_account_equity()
-            equity = await self._equity_service.calculate_trading_capital(
-                account=f"yolo.{exchange.id}",
-                max_leverage=self._config.settings.max_leverage,
-                equity_buffer=self._config.settings.equity_buffer,
-                current_equity=float(account_equity.total_equity),
+            # Venue setups are isolated from each other while the pipeline keeps running
+            setups = await asyncio.gather(
+                *(self._setup_venue(e, run_date) for e in exchanges), return_exceptions=True
             )
+            target_weights: pl.DataFrame | None = None
+            if all(isinstance(s, _VenueSetup) and s.previous_run is not None for s in setups):
+                pipeline_task.cancel()
+                self._logger.info("inputs unchanged since last run, cancelling signal pipeline")
+            else:
+                target_weights = await pipeline_task
+        except Exception as e:
+            pipeline_task.cancel()
+            await self._release_exchanges(exchanges, failed=True)
+            await self._report_error("error running yolo strategy", e)
+            raise YoloStrategyError() from e
+        self._logger.info("run setup complete", exchanges=[e.id for e in exchanges])
+        memory_checkpoint("setup", target_weights=target_weights)
 
-            # Calculate orders
-            portfolios = await self._portfolio_fetcher.fetch_portfolios([exchange])
-            portfolio = portfolios[0]  # Yolo works with a single exchange
+        results = await asyncio.gather(
+            *(
+                self._run_venue(exchange, run_date, setup, target_weights, checkpoint)
+                for exchange, setup in zip(exchanges, setups, strict=True)
+            ),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            raise YoloStrategyError(
+                f"yolo strategy failed on {len(errors)} of {len(exchanges)} exchanges"
+            ) from errors[0]
 
-            self._logger.info("current portfolio:", exchange=exchange.id)
+        self._logger.info("yolo strategy run complete")
+        self._logger.info("==============================")
+        return None
 
-            # Pipeline
-            self._logger.info("executing yolo signal pipeline")
-            for step in self._pipeline:
-                await step.setup()
+    @traced("yolo.compute_targets")
+    @typechecked
+    async def compute_targets(self) -> list[VenueTarget]:
+        """
+        Size the target portfolio of every configured exchange, as the first stage of the
+        fine-grained workflow. Runs the same setup as `run_strategy` and releases the exchanges.
+        """
+        run_date = self._run_date()
+        pipeline_task = asyncio.create_task(self._compute_target_weights(run_date))
+        try:
+            with span("yolo.exchanges"):
+                exchanges = await self._get_exchanges()
+        except BaseException:
+            pipeline_task.cancel()
+            raise
 
-            target_weights = pl.DataFrame()
-            for step in self._pipeline:
-                target_weights = await step.run(target_weights)
+        failed = True
+        try:
+            setups: list[_VenueSetup] = await self._gather(
+                *(self._setup_venue(e, run_date) for e in exchanges)
+            )
+            target_weights: pl.DataFrame | None = None
+            if all(s.previous_run is not None for s in setups):
+                self._logger.info("inputs unchanged since last run, cancelling signal pipeline")
+            else:
+                target_weights = await pipeline_task
+
+            targets: list[VenueTarget] = []
+            for config, exchange, setup in zip(self._config.exchanges, exchanges, setups, strict=True):
+                target_portfolio, venue_weights = self._size_venue(exchange.id, setup, target_weights)
+                targets.append(
+                    VenueTarget(
+                        venue=self._venue(config),
+                        run_date=run_date,
+                        equity=setup.equity,
+                        fingerprint=setup.fingerprint,
+                        skip=setup.previous_run is not None and not setup.previous_run.has_orders,
+                        target_weights=FrameData.of(venue_weights),
+                        current_portfolio=FrameData.of(setup.current_portfolio),
+                        target_portfolio=FrameData.of(target_portfolio),
+                    )
+                )
+            failed = False
+            return targets
+        except Exception as e:
+            await self._report_error("error computing yolo targets", e)
+            raise YoloStrategyError() from e
+        finally:
+            pipeline_task.cancel()
+            await self._release_exchanges(exchanges, failed)
+
+    @traced("yolo.build_orders")
+    @typechecked
+    async def build_orders(self, target: VenueTarget) -> list[OrderBatch]:
+        """
+        Plan the order legs of a venue target, grouped into one batch per symbol so that the
+        workflow can execute symbols independently. Journals and captures the run like `run_strategy`.
+        """
+        if target.skip:
+            self._logger.info("inputs unchanged since a run with nothing to trade", exchange=target.venue)
+            return []
+
+        exchange = await self._get_venue(target.venue)
+        failed = True
+        try:
+            target_portfolio = target.target_portfolio.frame()
+            markets = await self._order_builder.markets_index(exchange)
+            plan = self._order_builder.plan_orders(target_portfolio, markets)
+            self._order_builder.log_plan(exchange, plan)
+            if target.fingerprint is not None:
+                await self._journal_run(
+                    exchange, target.fingerprint, target_portfolio, not plan.legs.is_empty()
+                )
+            if self._services_config.capture_path is not None:
+                await self._capture_run(
+                    exchange,
+                    target.run_date,
+                    target.equity,
+                    target.current_portfolio.frame(),
+                    target.target_weights.frame(),
+                    target_portfolio,
+                )
+            failed = False
+        except Exception as e:
+            await self._report_error(log_prefix(exchange, "error building yolo orders"), e)
+            raise
+        finally:
+            await self._release_exchanges([exchange], failed)
+
+        if plan.legs.is_empty():
+            self._logger.info("no orders to place", exchange=exchange.id)
+            return []
+        self._logger.info("yolo orders:", exchange=exchange.id, df=DeferredFrame(plan.legs))
+        if self._config.settings.dry_run:
+            self._logger.info("dry run enabled, skipping order execution", exchange=exchange.id)
+            return []
+        return [
+            OrderBatch(target.venue, symbol, FrameData.of(legs))
+            for (symbol,), legs in plan.legs.group_by("symbol", maintain_order=True)
+        ]
 
-            target_portfolio = self._portfolio_sizer.size_portfolio(
-                equity, target_weights, portfolio, self._config.settings
+    @traced("yolo.execute_batch")
+    @typechecked
+    async def execute_order_batch(self, batch: OrderBatch) -> BatchResult:
+        """Build and execute the orders of a batch planned by `build_orders`."""
+        current_span().set(exchange=batch.venue, symbol=batch.symbol)
+        exchange = await self._acquire_batch_session(batch.venue)
+        failed = True
+        try:
+            markets = await self._order_builder.markets_index(exchange)
+            orders = self._order_builder.orders_for_legs(exchange, batch.legs.frame(), markets)
+            executor = self._executor()
+            report = await executor.execute_orders([exchange], orders)
+            fills = fills_from_report(report, markets)
+            failed = False
+            return BatchResult(
+                batch.venue,
+                batch.symbol,
+                _order_count(orders),
+                None if fills is None else FrameData.of(fills),
+            )
+        except Exception as e:
+            await self._report_error(log_prefix(exchange, f"error executing {batch.symbol} orders"), e)
+            raise
+        finally:
+            await self._release_batch_session(batch.venue, failed)
+
+    @traced("yolo.validate_venue")
+    @typechecked
+    async def validate_venue(self, target: VenueTarget, results: list[BatchResult]) -> bool:
+        """
+        Check the portfolio of a venue against its target once its batches have executed.
+        Fills are only applied incrementally if every batch reported them.
+        """
+        exchange = await self._get_venue(target.venue)
+        failed = True
+        try:
+            batch_fills = [r.fills for r in results]
+            fills = (
+                pl.concat([f.frame() for f in batch_fills if f is not None])
+                if batch_fills and None not in batch_fills
+                else None
             )
+            converged = await self._validate_venue(
+                exchange,
+                target.run_date,
+                target.equity,
+                target.target_weights.frame(),
+                target.current_portfolio.frame(),
+                target.target_portfolio.frame(),
+                fills,
+            )
+            failed = False
+            return converged
+        except Exception as e:
+            await self._report_error(log_prefix(exchange, "error validating yolo portfolio"), e)
+            raise
+        finally:
+            await self._release_exchanges([exchange], failed)
+
+    @traced("yolo.venue.setup")
+    async def _setup_venue(self, exchange: Exchange, run_date: date) -> _VenueSetup:
+        current_span().set(exchange=f"{exchange.id}")
+        # Account equity and portfolio are independent of each other
+        equity, current_portfolio = await self._gather(
+            self._get_trading_capital(exchange), self._fetch_portfolio_frame(exchange)
+        )
+        if self._run_journal is None:
+            return _VenueSetup(equity, current_portfolio, None, None)
+
+        fingerprint = run_fingerprint(run_date, self._config.settings, equity, current_portfolio)
+        try:
+            previous_run = await self._run_journal.get_run(self._account(exchange), fingerprint)
+        except Exception as e:
+            self._logger.warning(f"error reading run journal: {e}", exchange=exchange.id)
+            previous_run = None
+        return _VenueSetup(equity, current_portfolio, fingerprint, previous_run)
+
+    @traced("yolo.venue")
+    async def _run_venue(
+        self,
+        exchange: Exchange,
+        run_date: date,
+        setup: _VenueSetup | BaseException,
+        target_weights: pl.DataFrame | None,
+        checkpoint: RunCheckpoint,
+    ) -> None:
+        """Size, trade and validate a single exchange, releasing it when done."""
+        current_span().set(exchange=f"{exchange.id}")
+        failed = False
+        try:
+            if isinstance(setup, BaseException):
+                raise setup
+            equity, current_portfolio, fingerprint, previous_run = setup
+            # Orders went out before the run was interrupted, so the portfolio just fetched is post-trade
+            executed = checkpoint.phase(f"{exchange.id}") == "executed"
 
-            self._logger.info("target portfolio:", df=target_portfolio.sort("symbol"))
+            self._logger.info("current portfolio:", exchange=exchange.id)
+            if previous_run is not None and not previous_run.has_orders:
+                self._logger.info("inputs unchanged since a run with nothing to trade", exchange=exchange.id)
+                checkpoint.update(f"{exchange.id}", "done")
+                return None
+
+            target_portfolio, target_weights = self._size_venue(exchange.id, setup, target_weights)
             orders = await self._order_builder.prepare_orders(exchange, target_portfolio)
+            memory_checkpoint(
+                f"planned:{exchange.id}",
+                current_portfolio=current_portfolio,
+                target_weights=target_weights,
+                target_portfolio=target_portfolio,
+            )
+            if executed:
+                self._logger.info(
+                    "orders executed before the run was interrupted, validating", exchange=exchange.id
+                )
+                await self._check_converged(
+                    exchange, run_date, equity, current_portfolio, target_portfolio, orders
+                )
+                checkpoint.update(f"{exchange.id}", "done")
+                return None
+
+            checkpoint.update(f"{exchange.id}", "sized")
+            if fingerprint is not None:
+                await self._journal_run(exchange, fingerprint, target_portfolio, not orders.is_empty())
+            if self._services_config.capture_path is not None:
+                await self._capture_run(
+                    exchange, run_date, equity, current_portfolio, target_weights, target_portfolio
+                )
 
             if not orders.is_empty():
-                await orders.log_as_df("yolo orders")
+                await orders.log_as_df(log_prefix(exchange, "yolo orders"))
             else:
-                self._logger.info("no orders to place")
+                self._logger.info("no orders to place", exchange=exchange.id)
 
-            # Execute orders
             if self._config.settings.dry_run:
-                self._logger.info("dry run enabled, skipping order execution")
+                self._logger.info("dry run enabled, skipping order execution", exchange=exchange.id)
             else:
-                executor = DefaultOrderExecutor(self._config.settings.executor)
-                await executor.execute_orders([exchange], orders)
-
-            # Validate portfolio
-            if not self._config.settings.dry_run and not orders.is_empty():
-                portfolios = await self._portfolio_fetcher.fetch_portfolios([exchange])
-                portfolio = portfolios[0]
-
-                # Pipeline
-                target_weights = pl.DataFrame()
-                for step in self._pipeline:
-                    target_weights = await step.run(target_weights)
-                target_portfolio = self._portfolio_sizer.size_portfolio(
-                    equity, target_weights, portfolio, self._config.settings
+                checkpoint.update(f"{exchange.id}", "executing", orders_submitted=_order_count(orders))
+                with span("yolo.execute", exchange=f"{exchange.id}"):
+                    executor = self._executor()
+                    report = await executor.execute_orders([exchange], orders)
+                fills = fills_from_report(report, await self._order_builder.markets_index(exchange))
+                checkpoint.update(
+                    f"{exchange.id}", "executed", fills_seen=0 if fills is None else fills.height
                 )
+                memory_checkpoint(f"executed:{exchange.id}", fills=fills)
 
-                orders = await self._order_builder.prepare_orders(exchange, target_portfolio)
+                # Validate portfolio
                 if not orders.is_empty():
-                    self._logger.warning("portfolio do not match target after order execution")
-                    await orders.log_as_df("yolo remaining orders")
-                else:
-                    self._logger.info("all portfolio match target after order execution")
+                    await self._validate_venue(
+                        exchange, run_date, equity, target_weights, current_portfolio, target_portfolio, fills
+                    )
+                    memory_checkpoint(f"validated:{exchange.id}")
+            checkpoint.update(f"{exchange.id}", "done")
+        except Exception as e:
+            failed = True
+            await self._report_error(log_prefix(exchange, "error running yolo strategy"), e)
+            raise
+        finally:
+            await self._release_exchanges([exchange], failed)
 
-            self._logger.info("yolo strategy run complete")
-            self._logger.info("==============================")
+    def _size_venue(
+        self, exchange_id: object, setup: _VenueSetup, target_weights: pl.DataFrame | None
+    ) -> tuple[pl.DataFrame, pl.DataFrame]:
+        """Target portfolio and weights of a venue, reusing the journaled target if the inputs are unchanged."""
+        if setup.previous_run is not None:
+            self._logger.info("inputs unchanged since last run, reusing its target", exchange=exchange_id)
+            target_portfolio = setup.previous_run.target_portfolio
+            target_weights = self._weights_from_target(target_portfolio, setup.equity)
+        else:
+            assert target_weights is not None
+            target_portfolio = self._portfolio_sizer.size_frame(
+                setup.equity, target_weights, setup.current_portfolio, self._config.settings
+            )
 
-            return None
+        self._logger.info(
+            "target portfolio:",
+            exchange=exchange_id,
+            df=DeferredFrame(target_portfolio, sort_by="symbol"),
+        )
+        return target_portfolio, target_weights
+
+    @traced("yolo.validate")
+    async def _validate_venue(
+        self,
+        exchange: Exchange,
+        run_date: date,
+        equity: float,
+        target_weights: pl.DataFrame,
+        pre_trade: pl.DataFrame,
+        target_portfolio: pl.DataFrame,
+        fills: pl.DataFrame | None,
+    ) -> bool:
+        """Check the post-trade portfolio against the target, logging any remaining orders."""
+        current_portfolio = await self._post_trade_portfolio(exchange, pre_trade, target_portfolio, fills)
+
+        # Target weights only depend on stored signals, so they are reused as-is
+        target_portfolio = self._portfolio_sizer.size_frame(
+            equity, target_weights, current_portfolio, self._config.settings
+        )
+
+        orders = await self._order_builder.prepare_orders(exchange, target_portfolio)
+        return await self._check_converged(
+            exchange, run_date, equity, current_portfolio, target_portfolio, orders
+        )
+
+    async def _check_converged(
+        self,
+        exchange: Exchange,
+        run_date: date,
+        equity: float,
+        current_portfolio: pl.DataFrame,
+        target_portfolio: pl.DataFrame,
+        orders: OrdersToExecute,
+    ) -> bool:
+        """
+        Log the orders still needed to reach the target, journaling the portfolio once there are none.
+        Returns whether the portfolio matches the target.
+        """
+        if not orders.is_empty():
+            self._logger.warning("portfolio do not match target after order execution", exchange=exchange.id)
+            await orders.log_as_df(log_prefix(exchange, "yolo remaining orders"))
+            return False
+
+        self._logger.info("all portfolio match target after order execution", exchange=exchange.id)
+        # A rerun from the converged portfolio has nothing to do
+        if self._run_journal is not None:
+            converged = run_fingerprint(run_date, self._config.settings, equity, current_portfolio)
+            await self._journal_run(exchange, converged, target_portfolio, False)
+        return True
+
+    async def _post_trade_portfolio(
+        self,
+        exchange: Exchange,
+        pre_trade: pl.DataFrame,
+        target_portfolio: pl.DataFrame,
+        fills: pl.DataFrame | None,
+    ) -> pl.DataFrame:
+        """
+        Portfolio frame after execution, used to detect drift from the target.
+
+        In incremental mode, reported fills are applied to the pre-trade frame and the portfolio is
+        only refetched when some traded symbols have missing or ambiguous fills; those symbols are
+        then taken from the fresh portfolio. Legs the order plan skipped are not expected to fill.
+        """
+        if fills is None or self._config.settings.validation_mode != "incremental":
+            return await self._fetch_portfolio_frame(exchange)
+
+        markets = await self._order_builder.markets_index(exchange)
+        traded = self._order_builder.plan_orders(target_portfolio, markets).legs["symbol"].unique().to_list()
+        unresolved = unresolved_symbols(fills, traded)
+        portfolio = apply_fills(pre_trade, fills)
+        if not unresolved:
+            self._logger.info(f"portfolio updated from {fills.height} fills", exchange=exchange.id)
+            return portfolio
+
+        self._logger.info(
+            "refetching portfolio for unresolved fills", exchange=exchange.id, symbols=unresolved
+        )
+        fetched = await self._fetch_portfolio_frame(exchange)
+        return pl.concat(
+            [
+                portfolio.filter(~pl.col("symbol").is_in(unresolved)),
+                fetched.filter(pl.col("symbol").is_in(unresolved)),
+            ]
+        )
+
+    @traced("yolo.portfolio")
+    async def _fetch_portfolio_frame(self, exchange: Exchange) -> pl.DataFrame:
+        portfolios = await self._portfolio_fetcher.fetch_portfolios([exchange])
+        return self._portfolio_sizer.portfolio_frame(portfolios[0])
+
+    async def _journal_run(
+        self, exchange: Exchange, fingerprint: str, target_portfolio: pl.DataFrame, has_orders: bool
+    ) -> None:
+        assert self._run_journal is not None
+        entry = RunJournalEntry(
+            self._account(exchange), fingerprint, datetime.now(), has_orders, target_portfolio
+        )
+        try:
+            await self._run_journal.store_run(entry)
         except Exception as e:
-            _log = f"error running yolo strategy: {e}"
-            self._logger.error(_log, exc_info=True)
-            await notifier.notify(_log)
-            raise YoloStrategyError() from e
-        finally:
-            await Exchange.close([exchange])
-
-    @beartype
-    async def _get_exchange(self) -> Exchange:
-        """Extract and validate a single exchange from config."""
-        exchanges = await ExchangeFactory.from_config(self._config.settings.demo, self._config.exchanges)
-        if len(exchanges) != 1:
-            raise ValueError("Yolo strategy supports exactly one exchange.")
-        return exchanges[0]
+            self._logger.warning(f"error writing run journal: {e}", exchange=exchange.id)
+
+    async def _capture_run(
+        self,
+        exchange: Exchange,
+        run_date: date,
+        equity: float,
+        current_portfolio: pl.DataFrame,
+        target_weights: pl.DataFrame,
+        target_portfolio: pl.DataFrame,
+    ) -> None:
+        """Snapshot the venue run into a replayable bundle under `capture_path`."""
+        assert self._services_config.capture_path is not None
+        try:
+            weights, volatilities = await self._gather(
+                self._yolo_repository.get_weights(run_date),
+                self._yolo_repository.get_volatilities(run_date),
+            )
+            markets = await self._order_builder.markets_index(exchange)
+            plan = self._order_builder.plan_orders(target_portfolio, markets)
+            bundle = RunBundle(
+                exchange_id=f"{exchange.id}",
+                run_date=run_date,
+                captured_at=datetime.now(),
+                settings=self._config.settings,
+                equity=equity,
+                weights=weights,
+                volatilities=volatilities,
+                current_portfolio=current_portfolio,
+                markets=markets,
+                target_weights=target_weights,
+                target_portfolio=target_portfolio,
+                orders=plan.legs,
+            )
+            path = (
+                self._services_config.capture_path
+                / bundle.exchange_id
+                / f"{bundle.captured_at:%Y%m%dT%H%M%S}"
+            )
+            await asyncio.to_thread(bundle.write, path)
+            self._logger.info(f"captured run bundle to {path}", exchange=exchange.id)
+        except Exception as e:
+            self._logger.warning(f"error capturing run bundle: {e}", exchange=exchange.id)
+
+    def _checkpoint(
+        self, run_date: date, resume_from: RunCheckpoint | None, on_progress: ProgressCallback | None
+    ) -> RunCheckpoint:
+        """Checkpoint to resume from, dropping one left by a run of another day."""
+        if resume_from is None or resume_from.run_date != run_date:
+            return RunCheckpoint(run_date, on_change=on_progress)
+        self._logger.info("resuming interrupted run", venues=resume_from.to_dict()["venues"])
+        return RunCheckpoint(run_date, resume_from.venues, on_progress)
+
+    def _run_date(self) -> date:
+        """
+        Date of the signals a run reads, resolved once when the run starts: the date of a custom
+        pipeline's RobotWealth step, otherwise today.
+        """
+        for step in self._pipeline or ():
+            if isinstance(step, RobotWealthSignalStep):
+                today = step.today
+                return today.date() if isinstance(today, datetime) else today
+        return date.today()
+
+    def _signal_steps(self, run_date: date) -> list[SignalStep]:
+        if self._pipeline is not None:
+            return self._pipeline
+        return [RobotWealthSignalStep(self._config.settings, self._yolo_repository, run_date)]
+
+    @staticmethod
+    def _weights_from_target(target_portfolio: pl.DataFrame, equity: float) -> pl.DataFrame:
+        """Recover the target weights a target portfolio was sized from."""
+        return target_portfolio.select(
+            "symbol",
+            (pl.col("target_value") / equity).alias("weight"),
+            "arrival_price",
+            "updated_at",
+        )
+
+    @staticmethod
+    def _account(exchange: Exchange) -> str:
+        return f"yolo.{exchange.id}"
+
+    async def _report_error(self, message: str, error: BaseException) -> None:
+        _log = f"{message}: {error}"
+        self._logger.error(_log, exc_info=error)
+        await notifier.notify(_log)
+
+    @traced("yolo.equity")
+    async def _get_trading_capital(self, exchange: Exchange) -> float:
+        account_equity = await exchange.fetch_account_equity()
+        return await self._equity_service.calculate_trading_capital(
+            account=self._account(exchange),
+            max_leverage=self._config.settings.max_leverage,
+            equity_buffer=self._config.settings.equity_buffer,
+            current_equity=float(account_equity.total_equity),
+        )
+
+    @traced("yolo.pipeline")
+    async def _compute_target_weights(self, run_date: date) -> pl.DataFrame:
+        self._logger.info("executing yolo signal pipeline", run_date=run_date)
+        steps = self._signal_steps(run_date)
+        for step in steps:
+            with span("yolo.pipeline.setup", step=type(step).__name__):
+                await step.setup()
+        return await self._run_pipeline(steps)
+
+    async def _run_pipeline(self, steps: list[SignalStep]) -> pl.DataFrame:
+        target_weights = pl.DataFrame()
+        for step in steps:
+            with span("yolo.pipeline.run", step=type(step).__name__) as s:
+                target_weights = await step.run(target_weights)
+                s.record_rows(target_weights)
+        return target_weights
+
+    @staticmethod
+    async def _gather(*awaitables: Awaitable[Any]) -> list[Any]:
+        """Like `asyncio.gather`, but cancels the remaining awaitables as soon as one fails."""
+        tasks = [asyncio.ensure_future(a) for a in awaitables]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    @staticmethod
+    def _venue(config: ExchangeConfig) -> str:
+        return f"{config.exchange_id}"
+
+    async def _get_venue(self, venue: str) -> Exchange:
+        """Create (or take from the pool) the exchange of a single configured venue."""
+        configs = [c for c in self._config.exchanges if self._venue(c) == venue]
+        if not configs:
+            raise ValueError(f"exchange {venue} is not configured.")
+        [exchange] = await self._get_exchanges(configs[:1])
+        return exchange
+
+    async def _acquire_batch_session(self, venue: str) -> Exchange:
+        """The venue session of the batches executing right now, created by the first of them."""
+        async with self._batch_session_locks[venue]:
+            session = self._batch_sessions.get(venue)
+            if session is None:
+                session = _BatchSession(await self._get_venue(venue))
+                self._batch_sessions[venue] = session
+            session.users += 1
+            return session.exchange
+
+    async def _release_batch_session(self, venue: str, failed: bool) -> None:
+        """Release the venue session once its last batch is done, dropping it if any batch failed."""
+        async with self._batch_session_locks[venue]:
+            session = self._batch_sessions[venue]
+            session.users -= 1
+            session.failed |= failed
+            if session.users > 0:
+                return
+            del self._batch_sessions[venue]
+        await self._release_exchanges([session.exchange], session.failed)
+
+    @typechecked
+    async def _get_exchanges(self, configs: list[ExchangeConfig] | None = None) -> list[Exchange]:
+        """Create (or take from the pool) one exchange per config, all configured venues by default."""
+        configs = self._config.exchanges if configs is None else configs
+        if self._exchange_pool is not None:
+            exchanges = await self._exchange_pool.acquire(self._config.settings.demo, configs)
+        else:
+            create = self._create_exchanges or ExchangeFactory.from_config
+            exchanges = await create(self._config.settings.demo, configs)
+        if len(exchanges) != len(configs):
+            await self._release_exchanges(exchanges, failed=True)
+            raise ValueError(f"expected {len(configs)} exchanges, got {len(exchanges)}.")
+        return exchanges
+
+    def _executor(self) -> OrderExecutor:
+        create = self._order_executor or DefaultOrderExecutor
+        return create(self._config.settings.executor)
+
+    async def _release_exchanges(self, exchanges: list[Exchange], failed: bool) -> None:
+        """Return pooled exchanges to the pool (dropping them after errors), or close them."""
+        if self._exchange_pool is not None:
+            await self._exchange_pool.release(exchanges, failed=failed)
+        else:
+            await Exchange.close(exchanges)
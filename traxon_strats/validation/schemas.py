@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import os
+import weakref
+from typing import Final, Literal, NamedTuple, cast, get_args
+
+import pandera.polars as pa
+import polars as pl
+
+ValidationLevel = Literal["full", "boundary", "sampled"]
+
+VALIDATION_LEVEL_ENV: Final[str] = "TRAXON_VALIDATION_LEVEL"
+# Rows checked by internal validations in `sampled` mode
+SAMPLE_ROWS: Final[int] = 100
+
+
+def validation_level() -> ValidationLevel:
+    """
+    Validation level from `TRAXON_VALIDATION_LEVEL`, `full` by default.
+
+    - `full`: every call site validates (frames already validated against the schema are skipped).
+    - `boundary`: only frames entering from the outside (API, database, exchange) are validated.
+    - `sampled`: boundaries are fully validated, internal call sites check a sample of rows.
+    """
+    level = os.environ.get(VALIDATION_LEVEL_ENV, "full").strip().lower()
+    if level not in get_args(ValidationLevel):
+        raise ValueError(
+            f"invalid {VALIDATION_LEVEL_ENV} {level!r}, expected one of {get_args(ValidationLevel)}"
+        )
+    return cast(ValidationLevel, level)
+
+
+class _Entry(NamedTuple):
+    ref: weakref.ref[pl.DataFrame]
+    signature: tuple[int, tuple[tuple[str, pl.DataType], ...]]
+    schemas: set[type[pa.DataFrameModel]]
+
+
+def _signature(frame: pl.DataFrame) -> tuple[int, tuple[tuple[str, pl.DataType], ...]]:
+    return frame.height, tuple(frame.schema.items())
+
+
+class ValidatedFrames:
+    """
+    Registry of frames that have passed a schema, keyed by object identity.
+
+    Polars frames are immutable through the expression API, so a frame that passed a schema
+    still satisfies it as long as it is alive and keeps its shape. Entries hold a weak reference
+    (dropped with the frame) plus the row count and column schema, which catches in-place
+    renames and appends. In-place cell assignment is not tracked.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, _Entry] = {}
+
+    def is_validated(self, frame: pl.DataFrame, schema: type[pa.DataFrameModel]) -> bool:
+        entry = self._entries.get(id(frame))
+        return (
+            entry is not None
+            and entry.ref() is frame
+            and schema in entry.schemas
+            and entry.signature == _signature(frame)
+        )
+
+    def mark(self, frame: pl.DataFrame, schema: type[pa.DataFrameModel]) -> None:
+        key = id(frame)
+        signature = _signature(frame)
+        entry = self._entries.get(key)
+        if entry is not None and entry.ref() is frame and entry.signature == signature:
+            entry.schemas.add(schema)
+            return
+
+        def _drop(ref: weakref.ref[pl.DataFrame]) -> None:
+            current = self._entries.get(key)
+            if current is not None and current.ref is ref:
+                del self._entries[key]
+
+        self._entries[key] = _Entry(weakref.ref(frame, _drop), signature, {schema})
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+validated_frames: Final[ValidatedFrames] = ValidatedFrames()
+
+
+def validate(schema: type[pa.DataFrameModel], frame: pl.DataFrame, *, boundary: bool = False) -> pl.DataFrame:
+    """
+    Validate `frame` against `schema`, unless it already passed it.
+
+    `boundary` marks frames entering from outside the process, which are always validated;
+    internal call sites follow `validation_level()`.
+    """
+    if validated_frames.is_validated(frame, schema):
+        return frame
+
+    level = validation_level()
+    if not boundary and level == "boundary":
+        return frame
+    if not boundary and level == "sampled" and frame.height > SAMPLE_ROWS:
+        # The schemas do not coerce, so the sample passing means the frame's dtypes are valid
+        schema.validate(frame.sample(SAMPLE_ROWS, seed=0))
+        validated = frame
+    else:
+        validated = schema.validate(frame)
+
+    validated_frames.mark(validated, schema)
+    if validated is not frame:
+        validated_frames.mark(frame, schema)
+    return validated
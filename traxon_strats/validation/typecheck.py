@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from typing import Any, Final, Literal, TypeVar, cast, get_args, overload
+
+from beartype import beartype
+
+T = TypeVar("T", bound=Callable[..., Any] | type)
+TypecheckMode = Literal["full", "reduced", "off"]
+
+TYPECHECK_ENV: Final[str] = "TRAXON_TYPECHECK"
+
+
+def typecheck_mode() -> TypecheckMode:
+    """
+    Runtime type-checking mode from `TRAXON_TYPECHECK`, `full` by default.
+
+    - `full`: every `@typechecked` callable is checked by beartype (tests, staging).
+    - `reduced`: callables marked `hot` are left unchecked, the rest are checked.
+    - `off`: nothing is checked.
+    """
+    mode = os.environ.get(TYPECHECK_ENV, "full").strip().lower()
+    if mode not in get_args(TypecheckMode):
+        raise ValueError(f"invalid {TYPECHECK_ENV} {mode!r}, expected one of {get_args(TypecheckMode)}")
+    return cast(TypecheckMode, mode)
+
+
+@overload
+def typechecked(obj: T, /) -> T: ...
+
+
+@overload
+def typechecked(*, hot: bool = False) -> Callable[[T], T]: ...
+
+
+def typechecked(obj: T | None = None, /, *, hot: bool = False) -> T | Callable[[T], T]:
+    """
+    Apply beartype according to `typecheck_mode()`.
+
+    Use `@typechecked(hot=True)` for callables invoked per venue or per order within a run, which
+    `reduced` mode skips. The mode is read when the decorator runs, i.e. at import time, so
+    unchecked callables carry no wrapper at all.
+    """
+
+    def decorator(target: T) -> T:
+        mode = typecheck_mode()
+        if mode == "off" or (mode == "reduced" and hot):
+            return target
+        return beartype(target)
+
+    if obj is not None:
+        return decorator(obj)
+    return decorator